@@ -8,18 +8,39 @@ ad creation, keyword management, asset handling, and performance insights.
 Supports both read (list, get, insights) and write (create, update, delete) operations.
 """
 
+import io
 import os
 import json
-from typing import Optional, List, Dict, Any
+import time
+import random
+import asyncio
+import hashlib
+import threading
+import weakref
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import cycle, islice
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timedelta
+from importlib import import_module
 from pathlib import Path
 
+import grpc
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from mcp.server.fastmcp import FastMCP
 from google.ads.googleads.client import GoogleAdsClient
+from google.ads.googleads import client as googleads_client_module
+from google.ads.googleads import util as googleads_util
+from google.ads.googleads.interceptors import ExceptionInterceptor, LoggingInterceptor, MetadataInterceptor
 from google.ads.googleads.errors import GoogleAdsException
+from google.auth.exceptions import RefreshError
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used as fallback
+    orjson = None
 
 # Load environment variables from .env file
 # Use absolute path to ensure it works when run from any directory
@@ -37,6 +58,111 @@ mcp = FastMCP("google_ads_mcp")
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
 DEFAULT_API_VERSION = "v23"  # Google Ads API version (library v29.x supports v20-v23)
 
+# Response cache for read-only list tools: "enabled", "read-only" (serve
+# existing entries, never store new ones) or "disabled"
+CACHE_MODE = os.getenv("GOOGLE_ADS_CACHE_MODE", "enabled").lower()
+CACHE_TTL_SECONDS = float(os.getenv("GOOGLE_ADS_CACHE_TTL", "60"))
+
+# Reports whose data changes slowly keep their cached responses longer
+RECOMMENDATIONS_CACHE_TTL_SECONDS = 300.0
+CONVERSION_SETUP_CACHE_TTL_SECONDS = 3600.0  # Conversion actions and campaign goals
+CONVERSION_STATS_CACHE_TTL_SECONDS = 600.0
+
+# Auth and quota failures are replayed for this long per account instead of
+# every concurrent call hitting the API with the same bad token or quota
+ERROR_CACHE_TTL_SECONDS = 5.0
+
+# Client-side rate limiting (defaults follow Basic access: 1,500 requests per
+# 100 seconds and 15,000 operations per day per customer; 0 disables a limit)
+RATE_LIMIT_RPM = float(os.getenv("GOOGLE_ADS_RATE_LIMIT_RPM", "900"))
+RATE_LIMIT_OPS_PER_DAY = float(os.getenv("GOOGLE_ADS_OPS_PER_DAY", "15000"))
+RATE_LIMIT_MAX_RETRIES = 3  # Retries with exponential backoff on RESOURCE_EXHAUSTED
+RATE_LIMIT_MAX_WAIT_SECONDS = 30.0  # Longest a call waits for tokens before failing with a quota error
+
+# gRPC channels opened per service and used round-robin by concurrent tool calls
+GRPC_CHANNEL_POOL_SIZE = int(os.getenv("GOOGLE_ADS_CHANNEL_POOL_SIZE", "4"))
+
+# Mutate requests with more operations than this are submitted as batch jobs
+MUTATE_MAX_OPERATIONS = 5000
+
+# Campaign ID lists longer than this are split across concurrent queries
+GAQL_IN_SHARD_SIZE = 500
+
+# Criterion mutates are split into requests of this size and sent concurrently
+MUTATE_CHUNK_SIZE = 50
+
+# Concurrent partial-failure mutates for the same account submitted within this
+# window are coalesced into one GoogleAdsService.Mutate request (0 disables)
+MUTATE_BATCH_WINDOW_MS = float(os.getenv("GOOGLE_ADS_BATCH_WINDOW_MS", "20"))
+
+# Mutates in flight at once for the same account; other accounts are unaffected
+MUTATE_CONCURRENCY_PER_CUSTOMER = int(os.getenv("GOOGLE_ADS_MUTATE_CONCURRENCY", "8"))
+
+# Markdown icon lookup tables (built once, shared by all tool renderers)
+_APPROVAL_ICONS = {
+    "APPROVED": "✅",
+    "DISAPPROVED": "❌",
+    "LIMITED": "⚠️",
+    "UNDER_REVIEW": "🔍"
+}
+_LABEL_ICONS = {
+    "BEST": "🏆",
+    "GOOD": "✅",
+    "LOW": "⚠️",
+    "LEARNING": "🔄",
+    "PENDING": "⏳",
+    "UNKNOWN": "❓"
+}
+_LABEL_ORDER = ("BEST", "GOOD", "LOW", "LEARNING", "PENDING", "UNKNOWN")
+_STATUS_EMOJI = {
+    "ENABLED": "✅",
+    "PAUSED": "⏸️",
+    "REMOVED": "🗑️"
+}
+_MATCH_ICON = {
+    "EXACT": "🎯",
+    "PHRASE": "📝",
+    "BROAD": "🌐"
+}
+# Search term icon keyed by (has_conversions, has_clicks)
+_SEARCH_TERM_ICONS = {
+    (True, True): "🎯",    # Converting
+    (True, False): "🎯",
+    (False, True): "👆",   # Getting clicks
+    (False, False): "👁️"   # Only impressions
+}
+# QualityScoreBucket names indexed by enum value
+_QS_LABELS = ("UNSPECIFIED", "UNKNOWN", "BELOW_AVERAGE", "AVERAGE", "ABOVE_AVERAGE")
+# Ad strength report: distribution order and icons
+_STRENGTH_ORDER = ("EXCELLENT", "GOOD", "AVERAGE", "POOR", "UNSPECIFIED")
+_STRENGTH_EMOJI = {"EXCELLENT": "🟢", "GOOD": "🟡", "AVERAGE": "🟠", "POOR": "🔴", "UNSPECIFIED": "⚪"}
+# Keyword quality score report: rows shown in the full and low-QS tables
+_QS_TABLE_ROWS = 50
+_QS_ATTENTION_ROWS = 20
+# Distribution icon indexed by quality score (1-10) and bars for 0-20 keywords
+_QS_EMOJI = ("", "🔴", "🔴", "🔴", "🔴", "🟡", "🟡", "🟢", "🟢", "🟢", "🟢")
+_BARS = tuple("█" * count for count in range(21))
+# Pre-bound row formatters; precision specs truncate the text columns
+_QS_LOW_ROW = "| {:.25s} | {} | {:.3s} | {:.3s} | {:.3s} | {:,} |\n".format
+_QS_ALL_ROW = "| {:.20s} | {:.5s} | {} | {:.3s} | {:.3s} | {:.3s} | {:,} | ${:.2f} |\n".format
+# Recommendations report: recommendations shown per type in markdown, and
+# section icon and title per recommendation type
+_RECOMMENDATIONS_PER_TYPE = 10
+_REC_TYPE_INFO = {
+    "CAMPAIGN_BUDGET": ("💰", "Budget Recommendations"),
+    "KEYWORD": ("🔑", "Keyword Suggestions"),
+    "RESPONSIVE_SEARCH_AD": ("📝", "Ad Improvement"),
+    "TARGET_CPA_OPT_IN": ("🎯", "Bidding Strategy"),
+    "MAXIMIZE_CONVERSIONS_OPT_IN": ("📈", "Bidding Strategy"),
+    "SITELINK_ASSET": ("🔗", "Sitelink Suggestions"),
+    "CALLOUT_ASSET": ("📢", "Callout Suggestions"),
+}
+# Conversion stats report: pre-bound campaign row formatter (name cut to 20 chars)
+_CONVERSION_STATS_ROW = "| {:.20s} | {} | {:,.1f} | ${:,.2f} | ${:,.2f} | ${:,.2f} | {:.2f}x |\n".format
+# Audit snapshot: recommendations fetched and top campaigns shown
+_AUDIT_RECOMMENDATIONS_LIMIT = 200
+_AUDIT_TOP_CAMPAIGNS = 10
+
 
 # ============================================================================
 # ENUMS
@@ -274,7 +400,7 @@ class GetSearchTermsInput(BaseModel):
     """Input for getting search terms report."""
     model_config = ConfigDict(str_strip_whitespace=True)
 
-    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    customer_id: str = Field(..., min_length=10, description="10-digit customer ID, or comma-separated list of IDs to merge several accounts")
     campaign_id: Optional[str] = Field(None, description="Filter by campaign ID (optional)")
     ad_group_id: Optional[str] = Field(None, description="Filter by ad group ID (optional)")
     date_range: DatePreset = Field(default=DatePreset.LAST_30_DAYS, description="Date range preset (ignored if since/until provided)")
@@ -896,6 +1022,16 @@ class RemoveKeywordsInput(BaseModel):
     keyword_ids: List[str] = Field(..., min_length=1, description="List of keyword criterion IDs to remove")
 
 
+class PollBatchJobInput(BaseModel):
+    """Input for checking the progress of a batch job."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    batch_job_id: str = Field(..., description="Batch job ID returned by a bulk operation")
+    max_errors: int = Field(default=20, ge=0, le=200, description="Maximum failed operations to list when the job is done")
+    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
+
+
 # Ads Input Models
 
 class ListAdsInput(BaseModel):
@@ -950,6 +1086,42 @@ class UpdateAdStatusInput(BaseModel):
     status: AdStatus = Field(..., description="New ad status")
 
 
+class CreateCompleteAdGroupInput(BaseModel):
+    """Input for creating an ad group with its keywords and responsive search ad in one request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    campaign_id: str = Field(..., description="Campaign ID")
+    ad_group_name: str = Field(..., min_length=1, max_length=255, description="Ad group name")
+    cpc_bid_micros: Optional[int] = Field(None, ge=10000, description="CPC bid in micros (min: 10000 = $0.01)")
+    status: AdGroupStatus = Field(default=AdGroupStatus.PAUSED, description="Initial status (default: PAUSED)")
+    keywords: List[str] = Field(..., min_length=1, max_length=50, description="List of keywords to add (1-50)")
+    match_type: KeywordMatchType = Field(default=KeywordMatchType.BROAD, description="Match type for all keywords")
+    headlines: List[str] = Field(..., min_length=3, max_length=15, description="Headlines (3-15 required, max 30 chars each)")
+    descriptions: List[str] = Field(..., min_length=2, max_length=4, description="Descriptions (2-4 required, max 90 chars each)")
+    final_urls: List[str] = Field(..., min_length=1, description="Final URLs where users land")
+    path1: Optional[str] = Field(None, max_length=15, description="Display path 1 (max 15 chars)")
+    path2: Optional[str] = Field(None, max_length=15, description="Display path 2 (max 15 chars)")
+
+    @field_validator('headlines')
+    @classmethod
+    def validate_headlines(cls, v: List[str]) -> List[str]:
+        """Validate headlines length."""
+        for headline in v:
+            if len(headline) > 30:
+                raise ValueError(f"Headline too long (max 30 chars): {headline}")
+        return v
+
+    @field_validator('descriptions')
+    @classmethod
+    def validate_descriptions(cls, v: List[str]) -> List[str]:
+        """Validate descriptions length."""
+        for description in v:
+            if len(description) > 90:
+                raise ValueError(f"Description too long (max 90 chars): {description}")
+        return v
+
+
 class CreateTextAssetsInput(BaseModel):
     """Input for creating text assets and adding them to an asset group."""
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -1001,6 +1173,7 @@ class UpdateAssetGroupAssetsInput(BaseModel):
     add_headlines: Optional[List[str]] = Field(default=None, description="Headlines to add")
     add_descriptions: Optional[List[str]] = Field(default=None, description="Descriptions to add")
     remove_asset_group_asset_ids: Optional[List[str]] = Field(default=None, description="Asset group asset IDs to remove")
+    atomic: bool = Field(default=True, description="Apply add and remove in one all-or-nothing request; if false they run concurrently and succeed or fail independently")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
 
@@ -1021,6 +1194,7 @@ class ListNegativeKeywordsInput(BaseModel):
     customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
     campaign_id: Optional[str] = Field(default=None, description="Campaign ID to filter by (optional)")
     ad_group_id: Optional[str] = Field(default=None, description="Ad group ID to filter by (optional)")
+    level: Optional[NegativeKeywordLevel] = Field(default=None, description="Only list CAMPAIGN or AD_GROUP level negatives (default: both)")
     limit: Optional[int] = Field(default=100, ge=1, le=500, description="Maximum negative keywords to return (1-500)")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
@@ -1066,6 +1240,11 @@ class UpdateCampaignBudgetInput(BaseModel):
     customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
     campaign_id: str = Field(..., description="Campaign ID")
     new_budget_micros: int = Field(..., ge=1000000, description="New daily budget in micros (min: 1000000 = $1)")
+    budget_resource_name: Optional[str] = Field(
+        default=None,
+        pattern=r'^customers/\d+/campaignBudgets/\d+$',
+        description="Campaign budget resource name under customer_id, if already known (skips the lookup query; not checked against campaign_id, and the previous budget is not reported)"
+    )
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
 
@@ -1179,6 +1358,22 @@ class DismissRecommendationInput(BaseModel):
     recommendation_id: str = Field(..., description="Recommendation resource name or ID")
 
 
+class BatchApplyRecommendationsInput(BaseModel):
+    """Input for applying several recommendations in one request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    recommendation_ids: List[str] = Field(..., min_length=1, description="Recommendation resource names or IDs to apply")
+
+
+class BatchDismissRecommendationsInput(BaseModel):
+    """Input for dismissing several recommendations in one request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    recommendation_ids: List[str] = Field(..., min_length=1, description="Recommendation resource names or IDs to dismiss")
+
+
 # ============================================================================
 # CONVERSION TRACKING INPUT MODELS
 # ============================================================================
@@ -1201,6 +1396,7 @@ class GetConversionStatsInput(BaseModel):
     date_range: DatePreset = Field(default=DatePreset.LAST_30_DAYS, description="Date range preset (ignored if since/until provided)")
     since: Optional[str] = Field(default=None, pattern=r'^\d{4}-\d{2}-\d{2}$', description="Start date (YYYY-MM-DD). Requires 'until' parameter")
     until: Optional[str] = Field(default=None, pattern=r'^\d{4}-\d{2}-\d{2}$', description="End date (YYYY-MM-DD). Requires 'since' parameter")
+    max_campaigns: int = Field(default=100, ge=1, le=500, description="Maximum campaigns to list, by conversions (totals cover all campaigns)")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
     @model_validator(mode='after')
@@ -1239,6 +1435,26 @@ class GetConversionsByActionInput(BaseModel):
         return self
 
 
+# ============================================================================
+# ACCOUNT AUDIT INPUT MODELS
+# ============================================================================
+
+class AuditSnapshotInput(BaseModel):
+    """Input for the combined recommendations and conversion audit snapshot."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    customer_id: str = Field(..., min_length=10, max_length=10, description="10-digit customer ID")
+    date_range: DatePreset = Field(default=DatePreset.LAST_30_DAYS, description="Date range for conversion performance (ignored if since/until provided)")
+    since: Optional[str] = Field(default=None, pattern=r'^\d{4}-\d{2}-\d{2}$', description="Start date (YYYY-MM-DD). Requires 'until' parameter")
+    until: Optional[str] = Field(default=None, pattern=r'^\d{4}-\d{2}-\d{2}$', description="End date (YYYY-MM-DD). Requires 'since' parameter")
+
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        if (self.since is None) != (self.until is None):
+            raise ValueError("Both 'since' and 'until' must be provided together for custom date range")
+        return self
+
+
 # ============================================================================
 # GEOGRAPHIC TARGETING INPUT MODELS
 # ============================================================================
@@ -1312,10 +1528,19 @@ class SearchGeoTargetsInput(BaseModel):
 # SHARED UTILITY FUNCTIONS
 # ============================================================================
 
-def _get_google_ads_client() -> GoogleAdsClient:
+@lru_cache(maxsize=2)
+def _get_google_ads_client(use_proto_plus: bool = True) -> GoogleAdsClient:
     """
     Initialize and return Google Ads API client with credentials from environment.
 
+    The client is built once and shared by every tool call.
+
+    Args:
+        use_proto_plus: Return proto-plus wrapped messages (default). Pass False
+            for a client whose get_type() returns raw protobuf messages, which are
+            much cheaper to build in bulk; raw operations can be sent through the
+            proto-plus services unchanged.
+
     Returns:
         GoogleAdsClient: Initialized Google Ads client
 
@@ -1343,7 +1568,7 @@ def _get_google_ads_client() -> GoogleAdsClient:
         "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
         "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
         "refresh_token": os.getenv("GOOGLE_ADS_REFRESH_TOKEN"),
-        "use_proto_plus": True
+        "use_proto_plus": use_proto_plus
     }
 
     # Add login customer ID if provided (for MCC accounts)
@@ -1353,10 +1578,147 @@ def _get_google_ads_client() -> GoogleAdsClient:
     return GoogleAdsClient.load_from_dict(credentials, version=DEFAULT_API_VERSION)
 
 
+def _pooled_service(client: GoogleAdsClient, name: str) -> Any:
+    """
+    Build a service client on a channel with its own TCP connection.
+
+    Channels created with identical arguments share gRPC's global subchannel
+    pool and therefore a single connection. GoogleAdsClient.get_service()
+    exposes no channel options hook, so this mirrors its sync path with the
+    local subchannel pool option added for this channel only; channels that
+    get_service() builds elsewhere keep sharing the global pool.
+
+    Args:
+        client: Google Ads client supplying credentials and request metadata
+        name: Service name (e.g. "GoogleAdsService")
+
+    Returns:
+        Service client bound to a dedicated channel
+    """
+    version = client.version or DEFAULT_API_VERSION
+    module = import_module(
+        f"google.ads.googleads.{version}.services.services.{googleads_util.convert_upper_case_to_snake_case(name)}"
+    )
+    service_class = getattr(module, f"{name}Client")
+    transport_class = service_class.get_transport_class()
+    endpoint = client.endpoint or service_class.DEFAULT_ENDPOINT
+
+    channel = transport_class.create_channel(
+        host=endpoint,
+        credentials=client.credentials,
+        options=[*googleads_client_module._GRPC_CHANNEL_OPTIONS, ("grpc.use_local_subchannel_pool", 1)]
+    )
+    channel = grpc.intercept_channel(
+        channel,
+        MetadataInterceptor(
+            client.developer_token,
+            client.login_customer_id,
+            client.linked_customer_id,
+            ads_assistant=client._ads_assistant
+        ),
+        LoggingInterceptor(googleads_client_module._logger, version, endpoint),
+        ExceptionInterceptor(version, use_proto_plus=client.use_proto_plus)
+    )
+    return service_class(
+        transport=transport_class(channel=channel, client_info=googleads_client_module._CLIENT_INFO)
+    )
+
+
+@lru_cache(maxsize=None)
+def _service_pool(name: str) -> "cycle":
+    """
+    Build the round-robin pool of service clients for one service name.
+
+    The pool holds GRPC_CHANNEL_POOL_SIZE channels per service for the
+    process lifetime, each on its own connection. Channels connect lazily on
+    their first RPC.
+    """
+    client = _get_google_ads_client()
+    if GRPC_CHANNEL_POOL_SIZE <= 1:
+        return cycle([client.get_service(name)])
+    return cycle([_pooled_service(client, name) for _ in range(GRPC_CHANNEL_POOL_SIZE)])
+
+
+def _get_service(name: str) -> Any:
+    """
+    Return a shared service client (e.g. "GoogleAdsService").
+
+    Successive calls rotate through a small pool of channels so concurrent
+    tool calls spread over several HTTP/2 connections instead of queueing
+    behind one.
+
+    Args:
+        name: Service name
+
+    Returns:
+        Service client bound to the shared Google Ads client
+    """
+    return next(_service_pool(name))
+
+
+# grpc.aio channels belong to the event loop they were created on, so async
+# service clients are cached per loop
+_async_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_service(name: str) -> Any:
+    """
+    Return a shared grpc_asyncio service client for the running event loop.
+
+    Its RPC methods are coroutines, so mutates can be awaited directly instead
+    of occupying a worker thread each.
+
+    Args:
+        name: Service name (e.g. "GoogleAdsService")
+
+    Returns:
+        Async service client bound to the shared Google Ads client
+    """
+    services = _async_services.setdefault(asyncio.get_running_loop(), {})
+    service = services.get(name)
+    if service is None:
+        service = services[name] = _get_google_ads_client().get_service(name, is_async=True)
+    return service
+
+
+def _reset_google_ads_client() -> None:
+    """
+    Drop the shared client and every service client built from it.
+
+    Called after an authentication failure so the next tool call rebuilds the
+    client, its channels and its OAuth credentials instead of reusing a
+    client whose token can no longer be refreshed.
+    """
+    _get_google_ads_client.cache_clear()
+    _service_pool.cache_clear()
+    _async_services.clear()
+
+
+@lru_cache(maxsize=None)
+def _enum_map(enum_name: str) -> Dict[str, Any]:
+    """
+    Return a name -> value table for a Google Ads enum (e.g. "AdGroupStatusEnum").
+
+    Built once per enum so mutate paths do a dict lookup instead of attribute
+    traversal through the client.enums proxy.
+
+    Args:
+        enum_name: Enum type name as exposed on client.enums
+
+    Returns:
+        Dict mapping enum member names to enum values
+    """
+    return {member.name: member for member in getattr(_get_google_ads_client().enums, enum_name)}
+
+
+@lru_cache(maxsize=256)
 def _validate_customer_id(customer_id: str) -> str:
     """
     Validate and format customer ID (remove dashes if present).
 
+    Results are memoized; invalid IDs raise on every call since exceptions
+    are not cached.
+
     Args:
         customer_id: Customer ID string (with or without dashes)
 
@@ -1381,6 +1743,9 @@ def _execute_query(client: GoogleAdsClient, customer_id: str, query: str) -> Lis
     """
     Execute a GAQL query and return results as list of dictionaries.
 
+    Blocks until the whole stream is read, so async tools run it through
+    asyncio.to_thread to keep the event loop free.
+
     Args:
         client: Google Ads client
         customer_id: Customer ID
@@ -1389,28 +1754,156 @@ def _execute_query(client: GoogleAdsClient, customer_id: str, query: str) -> Lis
     Returns:
         List[Dict]: Query results
     """
-    ga_service = client.get_service("GoogleAdsService")
+    return list(_stream_query(client, customer_id, query))
 
-    results = []
-    stream = ga_service.search_stream(customer_id=customer_id, query=query)
 
-    for batch in stream:
-        for row in batch.results:
-            results.append(row)
+def _stream_query(client: GoogleAdsClient, customer_id: str, query: str) -> Iterator[Any]:
+    """
+    Execute a GAQL query and yield rows as their search_stream batches arrive.
+
+    Lets callers aggregate or convert rows while later batches are still in
+    flight instead of materializing the full result first.
+
+    Args:
+        client: Google Ads client (the stream runs on the shared service pool)
+        customer_id: Customer ID
+        query: GAQL query string
+
+    Yields:
+        GoogleAdsRow: Query result rows
+    """
+    ga_service = _get_service("GoogleAdsService")
+
+    for batch in ga_service.search_stream(customer_id=customer_id, query=query):
+        yield from batch.results
+
+
+async def _search_many(
+    customer_ids: List[str],
+    query: str,
+    concurrency: int = 10
+) -> Tuple[Dict[str, List[Any]], Dict[str, Exception]]:
+    """
+    Execute the same GAQL query against several customers concurrently.
+
+    Each query runs in a worker thread (the gRPC stream is blocking) through
+    the shared rate limiter, and at most ``concurrency`` run at once. A
+    failing account does not abort the others; its exception is returned
+    alongside the successful results.
+
+    Args:
+        customer_ids: Validated customer IDs
+        query: GAQL query string
+        concurrency: Maximum number of in-flight queries
 
-    return results
+    Returns:
+        Tuple[Dict, Dict]: Query results and exceptions, both keyed by customer ID
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(customer_id: str) -> List[Any]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _call_with_rate_limit,
+                1,
+                _stream_rows,
+                googleads_service=_get_service("GoogleAdsService"),
+                customer_id=customer_id,
+                query=query,
+            )
+
+    outcomes = await asyncio.gather(*[_run(cid) for cid in customer_ids], return_exceptions=True)
+    results, failures = {}, {}
+    for cid, outcome in zip(customer_ids, outcomes):
+        if isinstance(outcome, Exception):
+            failures[cid] = outcome
+        else:
+            results[cid] = outcome
+    return results, failures
 
 
-def _handle_google_ads_error(error: Exception) -> str:
+def _handle_google_ads_error(error: Exception, customer_id: Optional[str] = None) -> str:
     """
     Handle Google Ads API errors with actionable messages.
 
+    Authentication, authorization and quota errors are remembered for
+    ERROR_CACHE_TTL_SECONDS so tools can fail fast via _cached_account_error().
+    Authentication failures also reset the shared client.
+
     Args:
         error: Exception from Google Ads API
+        customer_id: Account the failed call targeted (enables error caching)
 
     Returns:
         str: User-friendly error message
     """
+    message = _format_google_ads_error(error)
+    if _is_authentication_error(error):
+        _reset_google_ads_client()
+    if customer_id and _is_account_level_error(error):
+        _error_cache.set((customer_id.replace("-", ""),), message)
+    return message
+
+
+def _google_ads_error_kinds(error: GoogleAdsException) -> set:
+    """
+    Return the error_code oneof field names of a GoogleAdsException's failures.
+
+    Classifies by category (e.g. "authentication_error", "quota_error")
+    rather than by enum value, whose text differs per code (OAUTH_TOKEN_EXPIRED,
+    USER_PERMISSION_DENIED, ...).
+    """
+    kinds = set()
+    for err in error.failure.errors:
+        error_code = getattr(err.error_code, "_pb", err.error_code)
+        kind = error_code.WhichOneof("error_code")
+        if kind:
+            kinds.add(kind)
+    return kinds
+
+
+def _grpc_status(error: GoogleAdsException) -> Any:
+    """Return the gRPC status code of the call that raised error, if available."""
+    code = getattr(error.error, "code", None)
+    return code() if callable(code) else None
+
+
+def _is_authentication_error(error: Exception) -> bool:
+    """Whether the client's credentials were rejected or could not be refreshed."""
+    if isinstance(error, RefreshError):
+        return True
+    if not isinstance(error, GoogleAdsException):
+        return False
+    return (
+        "authentication_error" in _google_ads_error_kinds(error)
+        or _grpc_status(error) == grpc.StatusCode.UNAUTHENTICATED
+    )
+
+
+_ACCOUNT_LEVEL_ERROR_KINDS = {"authentication_error", "authorization_error", "quota_error"}
+_ACCOUNT_LEVEL_GRPC_STATUSES = (
+    grpc.StatusCode.UNAUTHENTICATED, grpc.StatusCode.PERMISSION_DENIED, grpc.StatusCode.RESOURCE_EXHAUSTED
+)
+
+
+def _is_account_level_error(error: Exception) -> bool:
+    """Whether an error will repeat for every call to the account until it is fixed."""
+    if isinstance(error, RefreshError):
+        return True
+    if isinstance(error, GoogleAdsException):
+        return bool(_google_ads_error_kinds(error) & _ACCOUNT_LEVEL_ERROR_KINDS) or (
+            _grpc_status(error) in _ACCOUNT_LEVEL_GRPC_STATUSES
+        )
+    return False
+
+
+def _cached_account_error(customer_id: str) -> Optional[str]:
+    """Return the error recently cached for customer_id, if any."""
+    return _error_cache.get((customer_id,))
+
+
+def _format_google_ads_error(error: Exception) -> str:
+    """Build the user-facing message for an exception."""
     if isinstance(error, GoogleAdsException):
         # Extract error details
         error_messages = []
@@ -1419,8 +1912,9 @@ def _handle_google_ads_error(error: Exception) -> str:
 
         # Check for common error types
         error_str = str(error)
+        kinds = _google_ads_error_kinds(error)
 
-        if "AUTHENTICATION_ERROR" in error_str:
+        if "authentication_error" in kinds:
             return (
                 "Error: Authentication failed. Please verify:\n"
                 "- GOOGLE_ADS_DEVELOPER_TOKEN is valid\n"
@@ -1429,13 +1923,13 @@ def _handle_google_ads_error(error: Exception) -> str:
                 "Run the OAuth flow again if needed."
             )
 
-        if "AUTHORIZATION_ERROR" in error_str:
+        if "authorization_error" in kinds:
             return (
                 "Error: Authorization failed. You don't have access to this customer account. "
                 "Please verify the customer ID and ensure your account has proper permissions."
             )
 
-        if "RATE_EXCEEDED" in error_str or "RESOURCE_EXHAUSTED" in error_str:
+        if "quota_error" in kinds or "RESOURCE_EXHAUSTED" in error_str:
             return "Error: API rate limit exceeded. Please wait a few moments before making more requests."
 
         if "INVALID_CUSTOMER_ID" in error_str:
@@ -1450,6 +1944,12 @@ def _handle_google_ads_error(error: Exception) -> str:
         # Return detailed error messages
         return "Error from Google Ads API:\n" + "\n".join(error_messages)
 
+    elif isinstance(error, RefreshError):
+        return (
+            f"Error: OAuth token refresh failed ({error}). "
+            "GOOGLE_ADS_REFRESH_TOKEN is likely expired or revoked; run the OAuth flow again."
+        )
+
     elif isinstance(error, ValueError):
         return f"Error: {str(error)}"
 
@@ -1457,6 +1957,92 @@ def _handle_google_ads_error(error: Exception) -> str:
         return f"Error: Unexpected error occurred - {type(error).__name__}: {str(error)}"
 
 
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a response payload as JSON indented by 2 spaces.
+
+    Uses orjson when installed (C implementation, several times faster on
+    large payloads) and falls back to the stdlib encoder otherwise or for
+    values orjson cannot encode.
+
+    Args:
+        obj: JSON-serializable payload
+
+    Returns:
+        str: JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_rows(header: Dict[str, Any], key: str, rows: Iterable[Dict[str, Any]]) -> str:
+    """
+    Serialize ``{**header, key: list(rows)}`` as 2-space indented JSON without
+    materializing the row list.
+
+    Each row is encoded as soon as the iterable yields it, so a generator of
+    row dicts never holds more than one dict at a time.
+
+    Args:
+        header: Leading top-level fields
+        key: Name of the top-level field holding the rows
+        rows: Row dicts, typically a generator
+
+    Returns:
+        str: JSON document, identical to _dumps() of the full payload
+    """
+    def nested(value: Any, indent: str) -> str:
+        return _dumps(value).replace("\n", "\n" + indent)
+
+    buf = io.StringIO()
+    buf.write("{")
+    for name, value in header.items():
+        buf.write(f"\n  {json.dumps(name)}: {nested(value, '  ')},")
+    buf.write(f"\n  {json.dumps(key)}: [")
+    separator = "\n    "
+    for row in rows:
+        buf.write(separator)
+        buf.write(nested(row, "    "))
+        separator = ",\n    "
+    buf.write("]\n}" if separator == "\n    " else "\n  ]\n}")
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _pb_enum_names(descriptor: Any, field_name: str) -> Dict[int, str]:
+    """
+    Build an int -> name lookup table for an enum field of a raw protobuf message.
+
+    Used by hot row loops that read ``row._pb`` directly, where enum fields are
+    plain ints instead of proto-plus enum wrappers.
+
+    Args:
+        descriptor: Protobuf message descriptor (e.g. ``row._pb.asset.DESCRIPTOR``)
+        field_name: Name of the enum field on that message
+
+    Returns:
+        Dict[int, str]: Enum value names keyed by number (empty if field is absent)
+    """
+    field = descriptor.fields_by_name.get(field_name)
+    if field is None or field.enum_type is None:
+        return {}
+    return {value.number: value.name for value in field.enum_type.values}
+
+
+def _enum_name(value: Any) -> str:
+    """
+    Name of a proto-plus enum field value.
+
+    Values this library version doesn't know come back as plain ints and are
+    returned as their number.
+    """
+    return value.name if isinstance(value, Enum) else str(value)
+
+
 def _format_money_micros(micros: int, currency_code: str = "USD") -> str:
     """Format micros to currency string."""
     amount = micros / 1_000_000
@@ -1501,6 +2087,45 @@ def _format_date_range(
     return mapping.get(date_preset, "segments.date DURING LAST_30_DAYS")
 
 
+def _date_range_days(
+    date_preset: DatePreset = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> int:
+    """
+    Count the days covered by the range _format_date_range filters on.
+
+    Lets queries that aggregate metrics server-side (no segments.date in
+    SELECT) still derive daily averages.
+
+    Args:
+        date_preset: Preset date range (e.g., LAST_7_DAYS)
+        start_date: Custom start date in YYYY-MM-DD format
+        end_date: Custom end date in YYYY-MM-DD format
+
+    Returns:
+        int: Number of days (at least 1)
+    """
+    if start_date and end_date:
+        span = datetime.strptime(end_date, "%Y-%m-%d") - datetime.strptime(start_date, "%Y-%m-%d")
+        return max(span.days + 1, 1)
+
+    today = datetime.now().date()
+    if date_preset == DatePreset.LAST_MONTH:
+        return (today.replace(day=1) - timedelta(days=1)).day
+    if date_preset == DatePreset.THIS_MONTH:
+        return today.day
+    if date_preset == DatePreset.THIS_YEAR:
+        return today.timetuple().tm_yday
+    return {
+        DatePreset.TODAY: 1,
+        DatePreset.YESTERDAY: 1,
+        DatePreset.LAST_7_DAYS: 7,
+        DatePreset.LAST_14_DAYS: 14,
+        DatePreset.LAST_WEEK: 7,
+    }.get(date_preset, 30)
+
+
 def _check_and_truncate(response: str, limit: int = CHARACTER_LIMIT) -> str:
     """
     Check response length and truncate if needed with clear message.
@@ -1525,50 +2150,1118 @@ def _check_and_truncate(response: str, limit: int = CHARACTER_LIMIT) -> str:
     return truncated + warning
 
 
-# ============================================================================
-# TOOL IMPLEMENTATIONS - PHASE 1 (MVP)
-# ============================================================================
-
-@mcp.tool(
-    name="google_ads_list_accounts",
-    annotations={
-        "title": "List Google Ads Accounts",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
-)
-async def google_ads_list_accounts(params: ListAccountsInput) -> str:
+def _bounded_join(parts: Iterable[str], limit: int = CHARACTER_LIMIT) -> str:
     """
-    List all accessible Google Ads accounts for the authenticated user.
+    Newline-join lines, stopping once the character limit would be exceeded.
 
-    Retrieves a list of all customer accounts that the authenticated credentials
-    can access, showing account names, IDs, currency, status, and timezone.
+    Unlike _check_and_truncate, the full response is never materialized:
+    when parts is a generator, lines past the limit are never formatted.
 
     Args:
-        params (ListAccountsInput): Input parameters containing:
-            - limit (Optional[int]): Maximum accounts to return (1-100, default: 25)
-            - response_format (ResponseFormat): Output format ('markdown' or 'json')
+        parts: Lines of the response
+        limit: Character limit
 
     Returns:
-        str: List of accessible accounts with details
+        str: Joined lines, with a truncation warning if the limit was hit
+    """
+    kept = []
+    total = -1  # no separator before the first line
+    for part in parts:
+        total += len(part) + 1
+        if total > limit:
+            return "\n".join(kept) + (
+                f"\n\n⚠️ **Response truncated** at {limit:,} characters. "
+                "Use filters, pagination, or reduce date range to see more data."
+            )
+        kept.append(part)
+    return "\n".join(kept)
 
-        Markdown format:
-        # Google Ads Accounts
-        Found X accounts
 
-        ## Account Name (1234567890)
-        - **Currency**: USD
-        - **Status**: ENABLED
-        - **Timezone**: America/New_York
+def _truncate_buffer(buf: io.StringIO, limit: int = CHARACTER_LIMIT) -> str:
+    """
+    Return a rendered response buffer, cut at the character limit.
 
-        JSON format:
-        {
-            "total": int,
-            "count": int,
-            "accounts": [
-                {
+    Renderers check buf.tell() against the limit between sections and stop
+    early, so the buffer may end before the full response; the warning
+    therefore reports the limit rather than the full length.
+
+    Args:
+        buf: Buffer the response was written to
+        limit: Character limit
+
+    Returns:
+        str: Buffer contents, with a truncation warning if the limit was hit
+    """
+    response = buf.getvalue()
+    if len(response) <= limit:
+        return response
+    return response[:limit] + (
+        f"\n\n⚠️ **Response truncated** at {limit:,} characters. "
+        "Use filters, pagination, or reduce date range to see more data."
+    )
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class _TokenBucket:
+    """
+    Thread-safe token buckets throttling outbound Google Ads RPCs.
+
+    Requests are limited process-wide at ``rpm`` per minute (each RPC costs
+    one token), as the developer token's request limit spans every account.
+    Operations are limited per customer at ``ops_per_day`` (each RPC costs
+    its estimated operation count). ``acquire`` waits until both buckets can
+    pay, smoothing bursts instead of letting them fail with
+    RESOURCE_EXHAUSTED, but raises rather than wait longer than ``max_wait``
+    seconds.
+    """
+
+    def __init__(self, rpm: float, ops_per_day: float, max_wait: float):
+        self.request_rate = rpm / 60.0
+        self.request_capacity = rpm
+        self.ops_rate = ops_per_day / 86400.0
+        self.ops_capacity = ops_per_day
+        self.max_wait = max_wait
+        self._requests = self.request_capacity
+        self._updated = time.monotonic()
+        # customer_id -> [available operations, last refill time]
+        self._ops: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float, customer_id: Optional[str]) -> Optional[List[float]]:
+        """Refill the request bucket and customer_id's operations bucket, returning the latter."""
+        if self.request_capacity:
+            self._requests = min(self.request_capacity, self._requests + (now - self._updated) * self.request_rate)
+        self._updated = now
+        if not self.ops_capacity or not customer_id:
+            return None
+        ops = self._ops.get(customer_id)
+        if ops is None:
+            ops = self._ops[customer_id] = [self.ops_capacity, now]
+        else:
+            ops[0] = min(self.ops_capacity, ops[0] + (now - ops[1]) * self.ops_rate)
+            ops[1] = now
+        return ops
+
+    def try_acquire(self, estimated_tokens: int = 1, customer_id: Optional[str] = None) -> float:
+        """Take one request and estimated_tokens of customer_id's operations if available; otherwise return seconds to wait."""
+        ops_needed = min(estimated_tokens, self.ops_capacity)
+        with self._lock:
+            ops = self._refill(time.monotonic(), customer_id)
+            request_ok = not self.request_capacity or self._requests >= 1
+            ops_ok = ops is None or ops[0] >= ops_needed
+            if request_ok and ops_ok:
+                if self.request_capacity:
+                    self._requests -= 1
+                if ops is not None:
+                    ops[0] -= ops_needed
+                return 0.0
+            wait = 0.0
+            if not request_ok:
+                wait = max(wait, (1 - self._requests) / self.request_rate)
+            if not ops_ok:
+                wait = max(wait, (ops_needed - ops[0]) / self.ops_rate)
+            return wait
+
+    def _check_wait(self, wait: float, deadline: float, estimated_tokens: int, customer_id: Optional[str]) -> None:
+        """Raise a quota error if waiting `wait` more seconds would pass the deadline."""
+        if time.monotonic() + wait > deadline:
+            target = f" for customer {customer_id}" if customer_id else ""
+            raise ValueError(
+                f"Client-side API quota exhausted{target}: {estimated_tokens} operation(s) would have to wait "
+                f"about {wait:,.0f} seconds. Retry later, or raise GOOGLE_ADS_OPS_PER_DAY / "
+                "GOOGLE_ADS_RATE_LIMIT_RPM if your access level allows."
+            )
+
+    def acquire(self, estimated_tokens: int = 1, customer_id: Optional[str] = None) -> None:
+        """Block until one request and estimated_tokens operations are available, or raise past max_wait."""
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self.try_acquire(estimated_tokens, customer_id)
+            if not wait:
+                return
+            self._check_wait(wait, deadline, estimated_tokens, customer_id)
+            time.sleep(wait)
+
+    async def acquire_async(self, estimated_tokens: int = 1, customer_id: Optional[str] = None) -> None:
+        """Like acquire, but waits without blocking the event loop."""
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self.try_acquire(estimated_tokens, customer_id)
+            if not wait:
+                return
+            self._check_wait(wait, deadline, estimated_tokens, customer_id)
+            await asyncio.sleep(wait)
+
+
+_rate_limiter = _TokenBucket(
+    rpm=RATE_LIMIT_RPM, ops_per_day=RATE_LIMIT_OPS_PER_DAY, max_wait=RATE_LIMIT_MAX_WAIT_SECONDS
+)
+
+
+def _rate_limit_customer(kwargs: Dict[str, Any]) -> Optional[str]:
+    """Customer an RPC targets, from its customer_id, request dict or customers/... resource name."""
+    request = kwargs.get("request") or {}
+    customer_id = kwargs.get("customer_id") or request.get("customer_id")
+    if customer_id:
+        return customer_id
+    resource_name = kwargs.get("resource_name") or ""
+    return resource_name.split("/")[1] if resource_name.startswith("customers/") else None
+
+
+def _is_quota_error(error: GoogleAdsException) -> bool:
+    """Return True for quota_error failures and RESOURCE_EXHAUSTED responses."""
+    return "quota_error" in _google_ads_error_kinds(error) or _grpc_status(error) == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def _call_with_rate_limit(estimated_tokens: int, rpc: Any, **kwargs: Any) -> Any:
+    """
+    Call a Google Ads RPC through the shared token bucket.
+
+    Sleeps while throttled, so only call it from worker threads; async tools
+    use _call_with_rate_limit_async or run it through asyncio.to_thread.
+    Operations are charged to the customer the request targets, and a
+    ValueError is raised instead of waiting past RATE_LIMIT_MAX_WAIT_SECONDS.
+    Quota errors are retried up to RATE_LIMIT_MAX_RETRIES times with
+    exponential backoff and jitter; other errors propagate unchanged.
+
+    Args:
+        estimated_tokens: Operations the request carries (1 for searches)
+        rpc: Bound service method, e.g. googleads_service.search
+        **kwargs: Request arguments forwarded to rpc
+
+    Returns:
+        The RPC response
+    """
+    customer_id = _rate_limit_customer(kwargs)
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        _rate_limiter.acquire(estimated_tokens, customer_id)
+        try:
+            return rpc(**kwargs)
+        except GoogleAdsException as e:
+            if attempt == RATE_LIMIT_MAX_RETRIES or not _is_quota_error(e):
+                raise
+            time.sleep((2 ** attempt) + random.uniform(0, 1))
+
+
+async def _call_with_rate_limit_async(estimated_tokens: int, rpc: Any, **kwargs: Any) -> Any:
+    """
+    Await an async Google Ads RPC through the shared token bucket.
+
+    Same throttling and quota retries as _call_with_rate_limit, but waits with
+    asyncio.sleep so no worker thread is held while the request is in flight.
+
+    Args:
+        estimated_tokens: Operations the request carries
+        rpc: Bound async service method, e.g. from _get_async_service(...)
+        **kwargs: Request arguments forwarded to rpc
+
+    Returns:
+        The RPC response
+    """
+    customer_id = _rate_limit_customer(kwargs)
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        await _rate_limiter.acquire_async(estimated_tokens, customer_id)
+        try:
+            return await rpc(**kwargs)
+        except GoogleAdsException as e:
+            if attempt == RATE_LIMIT_MAX_RETRIES or not _is_quota_error(e):
+                raise
+            await asyncio.sleep((2 ** attempt) + random.uniform(0, 1))
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class _TTLCache:
+    """
+    Minimal thread-safe TTL cache for read-only query results.
+
+    Keys are tuples whose first element is the customer ID, so mutating tools
+    can drop every cached entry for the account they just changed.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: tuple, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the oldest entries beyond maxsize."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, customer_id: str, namespace: Optional[str] = None) -> None:
+        """
+        Drop every entry cached for customer_id.
+
+        With namespace, only entries whose second key element matches it are
+        dropped (e.g. "recommendations"), leaving the account's other
+        entries in place.
+        """
+        with self._lock:
+            for key in [
+                k for k in self._data
+                if k[0] == customer_id and (namespace is None or (len(k) > 1 and k[1] == namespace))
+            ]:
+                del self._data[key]
+
+
+_query_cache = _TTLCache(maxsize=1024, ttl=CACHE_TTL_SECONDS)
+_error_cache = _TTLCache(maxsize=256, ttl=ERROR_CACHE_TTL_SECONDS)
+
+
+def _stream_rows(googleads_service: Any, **request: Any) -> List[Any]:
+    """Consume a search_stream response batch by batch into a list of rows."""
+    return [
+        row
+        for batch in googleads_service.search_stream(**request)
+        for row in batch.results
+    ]
+
+
+def _cached_search(googleads_service: Any, customer_id: str, query: str) -> List[Any]:
+    """
+    Run a GAQL query through the response cache.
+
+    Uses search_stream so rows arrive in server-side batches instead of
+    paging through unary search requests. The key is a SHA-256 digest of the
+    customer ID and query text, so identical parameters hit the same entry.
+    Behaviour follows GOOGLE_ADS_CACHE_MODE.
+
+    Args:
+        googleads_service: GoogleAdsService client
+        customer_id: Customer ID
+        query: GAQL query string
+
+    Returns:
+        List: Materialized result rows
+    """
+    def _search() -> List[Any]:
+        return _call_with_rate_limit(
+            1,
+            _stream_rows,
+            googleads_service=googleads_service,
+            customer_id=customer_id,
+            query=query
+        )
+
+    if CACHE_MODE == "disabled":
+        return _search()
+
+    key = (customer_id, hashlib.sha256(f"{customer_id}|{query}".encode()).digest())
+    rows = _query_cache.get(key)
+    if rows is None:
+        rows = _search()
+        if CACHE_MODE != "read-only":
+            _query_cache.set(key, rows)
+    return rows
+
+
+# ============================================================================
+# MUTATE HELPERS
+# ============================================================================
+# Builders return GoogleAdsService MutateOperations so several resources can be
+# created in a single GoogleAdsService.Mutate request. Resources created in the
+# same request reference each other through temporary (negative) IDs.
+
+def _ad_group_mutate_operation(
+    client: GoogleAdsClient,
+    customer_id: str,
+    campaign_id: str,
+    name: str,
+    status: str,
+    cpc_bid_micros: Optional[int] = None,
+    temp_id: Optional[int] = None
+) -> Any:
+    """
+    Build a MutateOperation that creates a SEARCH_STANDARD ad group.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        campaign_id: Parent campaign ID
+        name: Ad group name
+        status: AdGroupStatusEnum name (e.g. "PAUSED")
+        cpc_bid_micros: Optional default CPC bid
+        temp_id: Optional negative temporary ID so later operations in the
+            same request can reference the new ad group
+
+    Returns:
+        MutateOperation with ad_group_operation.create populated
+    """
+    mutate_op = client.get_type("MutateOperation")
+    ad_group = mutate_op.ad_group_operation.create
+
+    if temp_id is not None:
+        ad_group.resource_name = f"customers/{customer_id}/adGroups/{temp_id}"
+    ad_group.name = name
+    ad_group.campaign = f"customers/{customer_id}/campaigns/{campaign_id}"
+    ad_group.status = _enum_map("AdGroupStatusEnum")[status]
+    ad_group.type_ = client.enums.AdGroupTypeEnum.SEARCH_STANDARD
+
+    if cpc_bid_micros:
+        ad_group.cpc_bid_micros = cpc_bid_micros
+
+    return mutate_op
+
+
+def _keyword_mutate_operations(
+    client: GoogleAdsClient,
+    ad_group_resource_name: str,
+    keywords: List[str],
+    match_type: str,
+    cpc_bid_micros: Optional[int] = None
+) -> List[Any]:
+    """
+    Build one MutateOperation per keyword creating an enabled ad group criterion.
+
+    Args:
+        client: Google Ads client
+        ad_group_resource_name: Ad group resource name (real or temporary)
+        keywords: Keyword texts
+        match_type: KeywordMatchTypeEnum name (e.g. "BROAD")
+        cpc_bid_micros: Optional CPC bid override
+
+    Returns:
+        List of MutateOperations with ad_group_criterion_operation.create populated
+    """
+    match_type_value = _enum_map("KeywordMatchTypeEnum")[match_type]
+    enabled = client.enums.AdGroupCriterionStatusEnum.ENABLED
+
+    operations = []
+    for keyword_text in keywords:
+        mutate_op = client.get_type("MutateOperation")
+        criterion = mutate_op.ad_group_criterion_operation.create
+
+        criterion.ad_group = ad_group_resource_name
+        criterion.status = enabled
+        criterion.keyword.text = keyword_text
+        criterion.keyword.match_type = match_type_value
+
+        if cpc_bid_micros:
+            criterion.cpc_bid_micros = cpc_bid_micros
+
+        operations.append(mutate_op)
+
+    return operations
+
+
+def _responsive_search_ad_mutate_operation(
+    client: GoogleAdsClient,
+    ad_group_resource_name: str,
+    headlines: List[str],
+    descriptions: List[str],
+    final_urls: List[str],
+    path1: Optional[str] = None,
+    path2: Optional[str] = None
+) -> Any:
+    """
+    Build a MutateOperation that creates a PAUSED responsive search ad.
+
+    Args:
+        client: Google Ads client
+        ad_group_resource_name: Ad group resource name (real or temporary)
+        headlines: Headline texts
+        descriptions: Description texts
+        final_urls: Landing page URLs
+        path1: Optional display path 1
+        path2: Optional display path 2
+
+    Returns:
+        MutateOperation with ad_group_ad_operation.create populated
+    """
+    mutate_op = client.get_type("MutateOperation")
+    ad_group_ad = mutate_op.ad_group_ad_operation.create
+
+    ad_group_ad.ad_group = ad_group_resource_name
+    ad_group_ad.status = client.enums.AdGroupAdStatusEnum.PAUSED  # Start paused for safety
+    ad_group_ad.ad.final_urls.extend(final_urls)
+
+    rsa = ad_group_ad.ad.responsive_search_ad
+    for headline_text in headlines:
+        headline = client.get_type("AdTextAsset")
+        headline.text = headline_text
+        rsa.headlines.append(headline)
+
+    for description_text in descriptions:
+        description = client.get_type("AdTextAsset")
+        description.text = description_text
+        rsa.descriptions.append(description)
+
+    if path1:
+        rsa.path1 = path1
+    if path2:
+        rsa.path2 = path2
+
+    return mutate_op
+
+
+_temp_id_lock = threading.Lock()
+_next_temp_id = -1
+
+
+def _reserve_temp_ids(count: int) -> int:
+    """
+    Reserve ``count`` consecutive temporary resource IDs and return the first.
+
+    IDs count down from -1 across the whole process, so operations built by
+    different tool calls never collide when they share a Mutate request.
+    """
+    global _next_temp_id
+    with _temp_id_lock:
+        first = _next_temp_id
+        _next_temp_id -= count
+    return first
+
+
+# Google Ads character limits per text asset field type
+_TEXT_ASSET_LIMITS = {"HEADLINE": 30, "DESCRIPTION": 90, "LONG_HEADLINE": 90, "BUSINESS_NAME": 25}
+_TEXT_ASSET_SUMMARY_KEYS = {"HEADLINE": "headlines", "DESCRIPTION": "descriptions", "LONG_HEADLINE": "long_headlines"}
+
+
+def _validate_text_assets(assets: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], List[Dict[str, str]]]:
+    """
+    Split (field_type, text) pairs into valid ones and length violations.
+
+    Over-long texts would be rejected by the API anyway; checking them locally
+    saves the round trip (and, for atomic requests, the whole batch).
+
+    Args:
+        assets: (field_type, text) pairs
+
+    Returns:
+        Tuple of (valid pairs, validation errors as field_type/text/error dicts)
+    """
+    valid = []
+    validation_errors = []
+    for field_type, text in assets:
+        limit = _TEXT_ASSET_LIMITS.get(field_type)
+        if limit is not None and len(text) > limit:
+            validation_errors.append({
+                "field_type": field_type,
+                "text": text,
+                "error": f"{len(text)} characters exceeds the {limit} character limit"
+            })
+        else:
+            valid.append((field_type, text))
+    return valid, validation_errors
+
+
+def _text_asset_summary(assets: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Group (field_type, text) pairs into the summary returned by the asset tools.
+
+    Args:
+        assets: (field_type, text) pairs
+
+    Returns:
+        Dict with headlines, descriptions, long_headlines lists and business_name
+    """
+    summary = {"headlines": [], "descriptions": [], "long_headlines": [], "business_name": None}
+    for field_type, text in assets:
+        if field_type == "BUSINESS_NAME":
+            summary["business_name"] = text
+        else:
+            summary[_TEXT_ASSET_SUMMARY_KEYS[field_type]].append(text)
+    return summary
+
+
+def _text_asset_mutate_operations(
+    client: GoogleAdsClient,
+    customer_id: str,
+    asset_group_id: str,
+    assets: List[Tuple[str, str]]
+) -> List[Any]:
+    """
+    Build MutateOperations that create text assets and link them to an asset group.
+
+    Assets get process-wide unique temporary IDs (see _reserve_temp_ids) so the
+    operations can be coalesced with other requests; the returned list holds all
+    asset creates first, then one AssetGroupAsset create per asset in the same order.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        asset_group_id: Asset group to link the new assets to
+        assets: (field_type, text) pairs, field_type an AssetFieldTypeEnum name
+
+    Returns:
+        List of 2 * len(assets) MutateOperations
+    """
+    # Resource name prefixes are formatted once, not per asset
+    asset_group = f"customers/{customer_id}/assetGroups/{asset_group_id}"
+    asset_prefix = f"customers/{customer_id}/assets/"
+    first_temp_id = _reserve_temp_ids(len(assets))
+
+    # Resolve the message class and enum values once instead of per operation
+    mutate_operation_type = type(client.get_type("MutateOperation"))
+    text_type = _enum_map("AssetTypeEnum")["TEXT"]
+    field_types = _enum_map("AssetFieldTypeEnum")
+
+    asset_operations = []
+    link_operations = []
+    for i, (field_type, text) in enumerate(assets):
+        temp_resource_name = f"{asset_prefix}{first_temp_id - i}"
+
+        mutate_op = mutate_operation_type()
+        asset = mutate_op.asset_operation.create
+        asset.resource_name = temp_resource_name
+        asset.type_ = text_type
+        asset.text_asset.text = text
+        asset.name = f"{field_type}_{text[:20]}"  # Descriptive name (truncated)
+        asset_operations.append(mutate_op)
+
+        mutate_op = mutate_operation_type()
+        aga = mutate_op.asset_group_asset_operation.create
+        aga.asset = temp_resource_name
+        aga.asset_group = asset_group
+        aga.field_type = field_types[field_type]
+        link_operations.append(mutate_op)
+
+    return asset_operations + link_operations
+
+
+# Per-account semaphores capping concurrent async mutates (customer-level limits
+# are the tightest; bursting one account only earns quota retries)
+_customer_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _customer_semaphore(customer_id: str) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent async mutates for one account."""
+    semaphore = _customer_semaphores.get(customer_id)
+    if semaphore is None:
+        semaphore = _customer_semaphores.setdefault(
+            customer_id, asyncio.Semaphore(max(1, MUTATE_CONCURRENCY_PER_CUSTOMER))
+        )
+    return semaphore
+
+
+async def _mutate_async(
+    customer_id: str,
+    mutate_operations: List[Any],
+    partial_failure: bool = False
+) -> Any:
+    """
+    Send MutateOperations in a single GoogleAdsService.Mutate request over the grpc_asyncio transport.
+
+    At most MUTATE_CONCURRENCY_PER_CUSTOMER requests per account are in flight;
+    further callers for that account wait while other accounts proceed.
+
+    Args:
+        customer_id: Customer ID
+        mutate_operations: Operations built by the _*_mutate_operation helpers
+        partial_failure: Let valid operations succeed when others fail
+
+    Returns:
+        MutateGoogleAdsResponse
+    """
+    async with _customer_semaphore(customer_id):
+        return await _call_with_rate_limit_async(
+            len(mutate_operations),
+            _get_async_service("GoogleAdsService").mutate,
+            # partial_failure isn't a flattened argument, so it goes in the request
+            request={
+                "customer_id": customer_id,
+                "mutate_operations": mutate_operations,
+                "partial_failure": partial_failure
+            }
+        )
+
+
+async def _mutate_in_chunks(
+    rpc: Any,
+    customer_id: str,
+    operations: List[Any],
+    chunk_size: int = MUTATE_CHUNK_SIZE
+) -> List[Tuple[int, int, Any]]:
+    """
+    Send service mutate operations as concurrent fixed-size requests.
+
+    Each chunk is atomic on its own, so a rejected operation only fails the
+    operations sharing its chunk.
+
+    Args:
+        rpc: Bound service mutate method taking customer_id and operations
+        customer_id: Customer ID
+        operations: Operations for rpc
+        chunk_size: Operations per request
+
+    Returns:
+        (start, end, response or exception) per chunk, in operation order
+    """
+    bounds = [(start, min(start + chunk_size, len(operations))) for start in range(0, len(operations), chunk_size)]
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _call_with_rate_limit,
+                end - start,
+                rpc,
+                customer_id=customer_id,
+                operations=operations[start:end]
+            )
+            for start, end in bounds
+        ),
+        return_exceptions=True
+    )
+    return [(start, end, outcome) for (start, end), outcome in zip(bounds, outcomes)]
+
+
+def _partial_failure_errors(response: Any) -> Dict[int, str]:
+    """
+    Map failed operation indexes to error messages for a partial_failure mutate.
+
+    Args:
+        response: Mutate response sent with partial_failure=True
+
+    Returns:
+        Dict of operation index -> error message (empty when everything succeeded)
+    """
+    errors: Dict[int, str] = {}
+    if not response.partial_failure_error.code:
+        return errors
+
+    failure_type = type(_get_google_ads_client().get_type("GoogleAdsFailure"))
+    for detail in response.partial_failure_error.details:
+        failure = failure_type.deserialize(detail.value)
+        for error in failure.errors:
+            # First path element is the operation list, e.g. mutate_operations[3]
+            path = error.location.field_path_elements
+            index = path[0].index if path else -1
+            errors[index] = f"{errors[index]}; {error.message}" if index in errors else error.message
+
+    return errors
+
+
+def _submit_batch_job(
+    client: GoogleAdsClient,
+    customer_id: str,
+    mutate_operations: List[Any]
+) -> str:
+    """
+    Submit MutateOperations as an asynchronous BatchJob and start it.
+
+    Used when a request exceeds MUTATE_MAX_OPERATIONS. Operations are uploaded
+    in MUTATE_MAX_OPERATIONS-sized chunks chained by sequence token; the job is
+    started without waiting for completion (see google_ads_poll_batch_job).
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        mutate_operations: Operations to run
+
+    Returns:
+        Batch job resource name
+    """
+    batch_job_service = _get_service("BatchJobService")
+
+    batch_job_operation = client.get_type("BatchJobOperation")
+    client.copy_from(batch_job_operation.create, client.get_type("BatchJob"))
+    response = _call_with_rate_limit(
+        1,
+        batch_job_service.mutate_batch_job,
+        customer_id=customer_id,
+        operation=batch_job_operation
+    )
+    resource_name = response.result.resource_name
+
+    sequence_token = None
+    for start in range(0, len(mutate_operations), MUTATE_MAX_OPERATIONS):
+        chunk = mutate_operations[start:start + MUTATE_MAX_OPERATIONS]
+        add_response = _call_with_rate_limit(
+            len(chunk),
+            batch_job_service.add_batch_job_operations,
+            resource_name=resource_name,
+            sequence_token=sequence_token,
+            mutate_operations=chunk
+        )
+        sequence_token = add_response.next_sequence_token
+
+    # Returns a long-running operation; completion is checked by polling
+    _call_with_rate_limit(1, batch_job_service.run_batch_job, resource_name=resource_name)
+
+    return resource_name
+
+
+def _batch_job_failures(resource_name: str, max_errors: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Count failed operations of a finished BatchJob.
+
+    Reads every list_batch_job_results page, so async tools run it through
+    asyncio.to_thread.
+
+    Args:
+        resource_name: Batch job resource name
+        max_errors: Maximum number of failures to return in detail
+
+    Returns:
+        Tuple[int, List]: Failed operation count and the first max_errors failures
+    """
+    results = _get_service("BatchJobService").list_batch_job_results(
+        request={"resource_name": resource_name, "page_size": 1000}
+    )
+    failed_count = 0
+    failures = []
+    for result in results:
+        if result.status.code:
+            failed_count += 1
+            if len(failures) < max_errors:
+                failures.append({
+                    "operation_index": result.operation_index,
+                    "message": result.status.message
+                })
+    return failed_count, failures
+
+
+# ============================================================================
+# MUTATE BATCHING
+# ============================================================================
+
+class _MutateBatcher:
+    """
+    Coalesce concurrent partial-failure mutates for one account into one request.
+
+    The first submission for a customer opens a batch and schedules a flush
+    after ``window`` seconds; submissions arriving meanwhile join it (up to
+    ``max_ops`` operations). The flush sends a single partial_failure Mutate and
+    hands each submitter its own slice of responses and errors. If the combined
+    request fails outright, every submission is retried on its own so errors
+    are attributed to the right caller. Operations must use unique temporary
+    IDs (see _reserve_temp_ids).
+    """
+
+    def __init__(self, window: float, max_ops: int):
+        self.window = window
+        self.max_ops = max_ops
+        self._open: Dict[str, Dict[str, Any]] = {}
+        self._tasks: set = set()  # Strong references so pending flushes aren't garbage collected
+
+    async def submit(self, customer_id: str, mutate_operations: List[Any]) -> Tuple[List[Any], Dict[int, str]]:
+        """
+        Queue operations and wait for their share of the batched response.
+
+        Returns:
+            (mutate_operation_responses, {operation index: error message}) for
+            this submission's operations only
+        """
+        if self.window <= 0:
+            response = await _mutate_async(customer_id, mutate_operations, partial_failure=True)
+            return list(response.mutate_operation_responses), _partial_failure_errors(response)
+
+        future = asyncio.get_running_loop().create_future()
+        batch = self._open.get(customer_id)
+        if batch is None or batch["ops"] + len(mutate_operations) > self.max_ops:
+            batch = {"entries": [], "ops": 0}
+            self._open[customer_id] = batch
+            task = asyncio.ensure_future(self._flush(customer_id, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch["entries"].append((mutate_operations, future))
+        batch["ops"] += len(mutate_operations)
+
+        return await future
+
+    async def _flush(self, customer_id: str, batch: Dict[str, Any]) -> None:
+        await asyncio.sleep(self.window)
+        if self._open.get(customer_id) is batch:
+            del self._open[customer_id]
+
+        entries = batch["entries"]
+        try:
+            response = await _mutate_async(
+                customer_id,
+                [op for operations, _ in entries for op in operations],
+                partial_failure=True
+            )
+        except Exception as e:
+            if len(entries) == 1:
+                if not entries[0][1].done():
+                    entries[0][1].set_exception(e)
+                return
+            # Don't let one submission's request-level error fail the others
+            for operations, future in entries:
+                try:
+                    single = await _mutate_async(customer_id, operations, partial_failure=True)
+                    if not future.done():
+                        future.set_result((list(single.mutate_operation_responses), _partial_failure_errors(single)))
+                except Exception as single_error:
+                    if not future.done():
+                        future.set_exception(single_error)
+            return
+
+        responses = response.mutate_operation_responses
+        errors = _partial_failure_errors(response)
+        offset = 0
+        for operations, future in entries:
+            end = offset + len(operations)
+            if not future.done():
+                future.set_result((
+                    list(responses[offset:end]),
+                    {i - offset: message for i, message in errors.items() if offset <= i < end}
+                ))
+            offset = end
+
+
+_mutate_batcher = _MutateBatcher(window=MUTATE_BATCH_WINDOW_MS / 1000.0, max_ops=MUTATE_MAX_OPERATIONS)
+
+
+# ============================================================================
+# GAQL QUERY TEMPLATES
+# ============================================================================
+# Single-line templates filled with str.format_map(). Only validated numeric
+# IDs, enum values and ints are substituted, so identical parameters always
+# produce byte-identical queries (stable response-cache keys).
+
+_AD_GROUPS_QUERY = (
+    "SELECT ad_group.id, ad_group.name, ad_group.status, ad_group.type, "
+    "ad_group.cpc_bid_micros, campaign.id, campaign.name "
+    "FROM ad_group "
+    "WHERE campaign.id = {campaign_id}{status_clause} "
+    "ORDER BY ad_group.name LIMIT {limit}"
+)
+
+_KEYWORDS_QUERY = (
+    "SELECT ad_group_criterion.criterion_id, ad_group_criterion.keyword.text, "
+    "ad_group_criterion.keyword.match_type, ad_group_criterion.status, "
+    "ad_group_criterion.cpc_bid_micros, ad_group.id, ad_group.name "
+    "FROM ad_group_criterion "
+    "WHERE ad_group.id = {ad_group_id} AND ad_group_criterion.type = 'KEYWORD' "
+    "AND ad_group_criterion.status != 'REMOVED' "
+    "ORDER BY ad_group_criterion.keyword.text LIMIT {limit}"
+)
+
+_ADS_QUERY = (
+    "SELECT ad_group_ad.ad.id, ad_group_ad.ad.type, ad_group_ad.status, "
+    "ad_group_ad.ad.final_urls, ad_group_ad.ad.responsive_search_ad.headlines, "
+    "ad_group_ad.ad.responsive_search_ad.descriptions, ad_group.id, ad_group.name "
+    "FROM ad_group_ad "
+    "WHERE ad_group.id = {ad_group_id}{status_clause} LIMIT {limit}"
+)
+
+# {detail_fields} carries the per-type detail sub-messages the caller will read
+_RECOMMENDATIONS_QUERY = (
+    "SELECT recommendation.resource_name, recommendation.type, recommendation.impact, "
+    "recommendation.campaign{detail_fields} "
+    "FROM recommendation "
+    "WHERE {filters} LIMIT {limit}"
+)
+
+_CONVERSION_ACTIONS_QUERY = (
+    "SELECT conversion_action.id, conversion_action.name, conversion_action.status "
+    "FROM conversion_action{status_clause} "
+    "ORDER BY conversion_action.name"
+)
+
+# {extra_metrics} adds the traffic metrics only the reports that show them need
+_CONVERSION_STATS_QUERY = (
+    "SELECT campaign.id, campaign.name, campaign.status, metrics.conversions, "
+    "metrics.conversions_value, metrics.cost_micros{extra_metrics} "
+    "FROM campaign "
+    "WHERE {date_filter}{campaign_clause} "
+    "ORDER BY metrics.conversions DESC"
+)
+
+_CAMPAIGN_CONVERSION_GOALS_QUERY = (
+    "SELECT campaign.id, campaign.name, campaign.advertising_channel_type, "
+    "campaign.bidding_strategy_type, campaign_conversion_goal.category, "
+    "campaign_conversion_goal.origin, campaign_conversion_goal.biddable "
+    "FROM campaign_conversion_goal "
+    "WHERE campaign.status != 'REMOVED'{campaign_clause} "
+    "ORDER BY campaign.name, campaign_conversion_goal.biddable DESC"
+)
+
+@lru_cache(maxsize=None)
+def _campaign_negatives_query_template(has_campaign: bool) -> str:
+    """Negative keyword query template for campaign criteria, specialized on the filter shape."""
+    return (
+        "SELECT campaign_criterion.criterion_id, campaign_criterion.keyword.text, "
+        "campaign_criterion.keyword.match_type, campaign.id, campaign.name "
+        "FROM campaign_criterion "
+        "WHERE campaign_criterion.type = 'KEYWORD' AND campaign_criterion.negative = TRUE"
+        + (" AND campaign.id = {campaign_id}" if has_campaign else "")
+        + " LIMIT {limit}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _ad_group_negatives_query_template(has_campaign: bool, has_ad_group: bool) -> str:
+    """Negative keyword query template for ad group criteria, specialized on the filter shape."""
+    return (
+        "SELECT ad_group_criterion.criterion_id, ad_group_criterion.keyword.text, "
+        "ad_group_criterion.keyword.match_type, ad_group.id, ad_group.name, "
+        "campaign.id, campaign.name "
+        "FROM ad_group_criterion "
+        "WHERE ad_group_criterion.type = 'KEYWORD' AND ad_group_criterion.negative = TRUE"
+        + (" AND campaign.id = {campaign_id}" if has_campaign else "")
+        + (" AND ad_group.id = {ad_group_id}" if has_ad_group else "")
+        + " LIMIT {limit}"
+    )
+
+
+_KEYWORD_QUALITY_FIELDS = (
+    "ad_group_criterion.criterion_id, ad_group_criterion.keyword.text, "
+    "ad_group_criterion.keyword.match_type, ad_group_criterion.quality_info.quality_score, "
+    "ad_group_criterion.quality_info.creative_quality_score, "
+    "ad_group_criterion.quality_info.post_click_quality_score, "
+    "ad_group_criterion.quality_info.search_predicted_ctr, ad_group.name, campaign.name, "
+    "metrics.impressions, metrics.clicks, metrics.cost_micros"
+)
+
+
+@lru_cache(maxsize=128)
+def _keyword_quality_query(
+    campaign_id: Optional[str],
+    ad_group_id: Optional[str],
+    min_impressions: int,
+    limit: int,
+    scores_only: bool = False,
+    low_only: bool = False
+) -> str:
+    """Keyword quality score query, cached per parameter set (low_only keeps QS 1-4)."""
+    filters = ["ad_group_criterion.status != 'REMOVED'"]
+    if campaign_id:
+        filters.append(f"campaign.id = {_numeric_id(campaign_id, 'Campaign ID')}")
+    if ad_group_id:
+        filters.append(f"ad_group.id = {_numeric_id(ad_group_id, 'Ad group ID')}")
+    if min_impressions > 0:
+        filters.append(f"metrics.impressions >= {int(min_impressions)}")
+    if low_only:
+        filters.append("ad_group_criterion.quality_info.quality_score >= 1")
+        filters.append("ad_group_criterion.quality_info.quality_score < 5")
+    fields = "ad_group_criterion.quality_info.quality_score" if scores_only else _KEYWORD_QUALITY_FIELDS
+    return (
+        f"SELECT {fields} FROM keyword_view WHERE {' AND '.join(filters)} "
+        f"ORDER BY ad_group_criterion.quality_info.quality_score ASC LIMIT {int(limit)}"
+    )
+
+
+@lru_cache(maxsize=128)
+def _ad_strength_query(campaign_id: Optional[str], ad_group_id: Optional[str], limit: int) -> str:
+    """Responsive search ad strength query, cached per parameter set."""
+    filters = ["ad_group_ad.ad.type = 'RESPONSIVE_SEARCH_AD'", "ad_group_ad.status != 'REMOVED'"]
+    if campaign_id:
+        filters.append(f"campaign.id = {_numeric_id(campaign_id, 'Campaign ID')}")
+    if ad_group_id:
+        filters.append(f"ad_group.id = {_numeric_id(ad_group_id, 'Ad group ID')}")
+    return (
+        "SELECT ad_group_ad.ad.id, ad_group_ad.ad.responsive_search_ad.headlines, "
+        "ad_group_ad.ad.responsive_search_ad.descriptions, ad_group_ad.ad.final_urls, "
+        "ad_group_ad.ad_strength, ad_group_ad.status, ad_group.name, campaign.name, "
+        "metrics.impressions, metrics.clicks, metrics.ctr "
+        f"FROM ad_group_ad WHERE {' AND '.join(filters)} "
+        f"ORDER BY ad_group_ad.ad_strength ASC LIMIT {int(limit)}"
+    )
+
+
+# Approval statuses that count as a policy issue, shared by the ad and asset queries
+_POLICY_ISSUE_STATUSES = "('DISAPPROVED', 'APPROVED_LIMITED', 'AREA_OF_INTEREST_ONLY')"
+
+
+@lru_cache(maxsize=128)
+def _policy_ads_query(campaign_id: Optional[str]) -> str:
+    """Query for ads with policy issues, cached per campaign filter."""
+    filters = [f"ad_group_ad.policy_summary.approval_status IN {_POLICY_ISSUE_STATUSES}"]
+    if campaign_id:
+        filters.append(f"campaign.id = {_numeric_id(campaign_id, 'Campaign ID')}")
+    return (
+        "SELECT ad_group_ad.ad.id, ad_group_ad.ad.type, ad_group_ad.status, "
+        "ad_group_ad.policy_summary.approval_status, ad_group_ad.policy_summary.policy_topic_entries, "
+        "ad_group_ad.policy_summary.review_status, ad_group.id, ad_group.name, campaign.id, campaign.name "
+        f"FROM ad_group_ad WHERE {' AND '.join(filters)}"
+    )
+
+
+_POLICY_ASSETS_QUERY = (
+    "SELECT asset.id, asset.type, asset.name, asset.text_asset.text, "
+    "asset.policy_summary.approval_status, asset.policy_summary.policy_topic_entries, "
+    "asset.policy_summary.review_status "
+    "FROM asset "
+    f"WHERE asset.policy_summary.approval_status IN {_POLICY_ISSUE_STATUSES}"
+)
+
+_AD_GROUP_STATUS_VALUES = frozenset(status.value for status in AdGroupStatus)
+_AD_STATUS_VALUES = frozenset(status.value for status in AdStatus)
+
+
+def _numeric_id(value: str, label: str) -> str:
+    """Validate that an ID interpolated into GAQL contains only digits."""
+    if not value.isdigit():
+        raise ValueError(f"{label} must contain only digits, got '{value}'")
+    return value
+
+
+def _status_clause(field: str, status: Optional[Enum], allowed: frozenset) -> str:
+    """Build an optional ' AND <field> = 'STATUS'' filter from an allowlisted enum."""
+    if status is None:
+        return ""
+    if status.value not in allowed:
+        raise ValueError(f"Unsupported status filter: {status.value}")
+    return f" AND {field} = '{status.value}'"
+
+
+# ============================================================================
+# TOOL IMPLEMENTATIONS - PHASE 1 (MVP)
+# ============================================================================
+
+@mcp.tool(
+    name="google_ads_list_accounts",
+    annotations={
+        "title": "List Google Ads Accounts",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def google_ads_list_accounts(params: ListAccountsInput) -> str:
+    """
+    List all accessible Google Ads accounts for the authenticated user.
+
+    Retrieves a list of all customer accounts that the authenticated credentials
+    can access, showing account names, IDs, currency, status, and timezone.
+
+    Args:
+        params (ListAccountsInput): Input parameters containing:
+            - limit (Optional[int]): Maximum accounts to return (1-100, default: 25)
+            - response_format (ResponseFormat): Output format ('markdown' or 'json')
+
+    Returns:
+        str: List of accessible accounts with details
+
+        Markdown format:
+        # Google Ads Accounts
+        Found X accounts
+
+        ## Account Name (1234567890)
+        - **Currency**: USD
+        - **Status**: ENABLED
+        - **Timezone**: America/New_York
+
+        JSON format:
+        {
+            "total": int,
+            "count": int,
+            "accounts": [
+                {
                     "id": "1234567890",
                     "name": "Account Name",
                     "currency_code": "USD",
@@ -2172,7 +3865,8 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
 
     Args:
         params (GetSearchTermsInput): Input parameters containing:
-            - customer_id (str): 10-digit customer ID
+            - customer_id (str): 10-digit customer ID, or comma-separated IDs
+              to fan out across accounts and merge the results
             - campaign_id (Optional[str]): Filter by specific campaign
             - ad_group_id (Optional[str]): Filter by specific ad group
             - date_range (DatePreset): Date range (default: LAST_30_DAYS)
@@ -2195,6 +3889,7 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
         - "Show me search terms for campaign 123456"
         - "What are users actually searching for?"
         - "Get search terms report last 7 days"
+        - "Show search terms across accounts 1234567890,0987654321"
 
     Note:
         Use this to identify:
@@ -2203,9 +3898,9 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
         - Search intent patterns → inform ad copy and landing pages
     """
     try:
-        customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-
+        customer_ids = list(dict.fromkeys(
+            _validate_customer_id(cid.strip()) for cid in params.customer_id.split(",") if cid.strip()
+        ))
         # Build date filter (custom dates take precedence over preset)
         date_filter = _format_date_range(params.date_range, params.since, params.until)
 
@@ -2243,15 +3938,26 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
             LIMIT {params.limit}
         """
 
-        results = _execute_query(client, customer_id, query)
+        results_by_customer, failures = await _search_many(customer_ids, query)
+        if not results_by_customer:
+            first_cid = customer_ids[0]
+            return _handle_google_ads_error(failures[first_cid], first_cid)
+        failed_accounts = {
+            cid: _format_google_ads_error(error) for cid, error in failures.items()
+        }
+        for cid, error in failures.items():
+            _handle_google_ads_error(error, cid)
+        results = [
+            (cid, row) for cid in customer_ids for row in results_by_customer.get(cid, [])
+        ]
 
-        if not results:
+        if not results and not failed_accounts:
             filter_msg = f" for campaign {params.campaign_id}" if params.campaign_id else ""
             return f"No search terms found{filter_msg} in the selected date range"
 
         # Collect search terms data
         search_terms = []
-        for row in results:
+        for cid, row in results:
             stv = row.search_term_view
             metrics = row.metrics
             keyword = row.segments.keyword.info if hasattr(row.segments, 'keyword') else None
@@ -2259,6 +3965,7 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
             ctr = metrics.ctr * 100 if hasattr(metrics, 'ctr') else 0
 
             search_terms.append({
+                "customer_id": cid,
                 "search_term": stv.search_term,
                 "status": stv.status.name if hasattr(stv, 'status') else "UNKNOWN",
                 "campaign_id": row.campaign.id,
@@ -2278,23 +3985,31 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
                 }
             })
 
+        # Merge per-account results into a single impressions-ranked list
+        if len(customer_ids) > 1:
+            search_terms.sort(key=lambda st: st["metrics"]["impressions"], reverse=True)
+            del search_terms[params.limit:]
+
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
             lines = [f"# Search Terms Report", ""]
+            if len(customer_ids) > 1:
+                lines.append(f"**Accounts**: {', '.join(customer_ids)}")
             lines.append(f"**Date Range**: {params.date_range.value}")
             lines.append(f"**Found**: {len(search_terms)} search term(s)")
             lines.append("")
 
+            if failed_accounts:
+                lines.append("## ⚠️ Failed Accounts")
+                for cid, message in failed_accounts.items():
+                    lines.append(f"- **{cid}**: {message}")
+                lines.append("")
+
             for i, st in enumerate(search_terms[:50], 1):  # Limit markdown output
                 m = st['metrics']
 
                 # Icon based on performance
-                if m['conversions'] > 0:
-                    icon = "🎯"  # Converting
-                elif m['clicks'] > 0:
-                    icon = "👆"  # Getting clicks
-                else:
-                    icon = "👁️"  # Only impressions
+                icon = _SEARCH_TERM_ICONS[(m['conversions'] > 0, m['clicks'] > 0)]
 
                 lines.append(f"## {icon} \"{st['search_term']}\"")
                 lines.append(f"- **Campaign**: {st['campaign_name']}")
@@ -2323,10 +4038,13 @@ async def google_ads_get_search_terms(params: GetSearchTermsInput) -> str:
 
         else:  # JSON
             response = {
+                "customer_ids": customer_ids,
                 "date_range": params.date_range.value,
                 "total": len(search_terms),
                 "search_terms": search_terms
             }
+            if failed_accounts:
+                response["failed_accounts"] = failed_accounts
             result = json.dumps(response, indent=2)
             return _check_and_truncate(result)
 
@@ -2442,52 +4160,55 @@ async def google_ads_get_asset_performance(params: GetAssetPerformanceInput) ->
         if not results:
             return f"No assets found for campaign {params.campaign_id}. Make sure this is a Performance Max campaign."
 
+        # Resolve enum name tables once from the raw protobuf descriptors
+        first_pb = results[0]._pb
+        aga_descriptor = first_pb.asset_group_asset.DESCRIPTOR
+        policy_descriptor = first_pb.asset_group_asset.policy_summary.DESCRIPTOR
+        asset_type_names = _pb_enum_names(first_pb.asset.DESCRIPTOR, "type_")
+        field_type_names = _pb_enum_names(aga_descriptor, "field_type")
+        label_names = _pb_enum_names(aga_descriptor, "performance_label")
+        approval_names = _pb_enum_names(policy_descriptor, "approval_status")
+        review_names = _pb_enum_names(policy_descriptor, "review_status")
+        has_label = bool(label_names)
+
         # Collect assets data
         assets = []
         for row in results:
-            aga = row.asset_group_asset
-            asset = row.asset
-            policy = aga.policy_summary if hasattr(aga, 'policy_summary') else None
+            pb = row._pb
+            aga = pb.asset_group_asset
+            asset = pb.asset
+            policy = aga.policy_summary
+            asset_type = asset_type_names.get(asset.type_, "UNKNOWN")
 
             # Get asset content based on type
-            asset_content = ""
-            asset_preview = ""
-            if asset.type.name == "TEXT":
-                asset_content = asset.text_asset.text if hasattr(asset, 'text_asset') else "N/A"
+            if asset_type == "TEXT":
+                asset_content = asset.text_asset.text
                 asset_preview = asset_content[:100] + "..." if len(asset_content) > 100 else asset_content
-            elif asset.type.name == "IMAGE":
-                if hasattr(asset, 'image_asset') and hasattr(asset.image_asset, 'full_size'):
-                    asset_content = asset.image_asset.full_size.url
-                    asset_preview = "🖼️ Image"
-                else:
-                    asset_content = "Image (URL not available)"
-                    asset_preview = "🖼️ Image"
-            elif asset.type.name == "YOUTUBE_VIDEO":
-                if hasattr(asset, 'youtube_video_asset'):
-                    video_id = asset.youtube_video_asset.youtube_video_id
-                    asset_content = f"https://youtube.com/watch?v={video_id}"
-                    asset_preview = f"📹 Video: {video_id[:20]}"
-                else:
-                    asset_content = "YouTube Video"
-                    asset_preview = "📹 Video"
+            elif asset_type == "IMAGE":
+                asset_content = asset.image_asset.full_size.url or "Image (URL not available)"
+                asset_preview = "🖼️ Image"
+            elif asset_type == "YOUTUBE_VIDEO":
+                video_id = asset.youtube_video_asset.youtube_video_id
+                asset_content = f"https://youtube.com/watch?v={video_id}"
+                asset_preview = f"📹 Video: {video_id[:20]}"
             else:
-                asset_content = f"{asset.type.name} asset"
-                asset_preview = f"{asset.type.name}"
+                asset_content = f"{asset_type} asset"
+                asset_preview = asset_type
 
             assets.append({
                 "asset_id": aga.asset,
-                "asset_type": asset.type.name,
-                "field_type": aga.field_type.name if hasattr(aga, 'field_type') else "UNKNOWN",
-                "performance_label": aga.performance_label.name if hasattr(aga, 'performance_label') else "UNKNOWN",
-                "approval_status": policy.approval_status.name if policy and hasattr(policy, 'approval_status') else "UNKNOWN",
-                "review_status": policy.review_status.name if policy and hasattr(policy, 'review_status') else "UNKNOWN",
+                "asset_type": asset_type,
+                "field_type": field_type_names.get(aga.field_type, "UNKNOWN"),
+                "performance_label": label_names.get(aga.performance_label, "UNKNOWN") if has_label else "UNKNOWN",
+                "approval_status": approval_names.get(policy.approval_status, "UNKNOWN"),
+                "review_status": review_names.get(policy.review_status, "UNKNOWN"),
                 "content": asset_content,
                 "preview": asset_preview,
-                "asset_name": asset.name if hasattr(asset, 'name') else "",
-                "asset_group_id": row.asset_group.id,
-                "asset_group_name": row.asset_group.name,
-                "campaign_id": row.campaign.id,
-                "campaign_name": row.campaign.name
+                "asset_name": asset.name,
+                "asset_group_id": pb.asset_group.id,
+                "asset_group_name": pb.asset_group.name,
+                "campaign_id": pb.campaign.id,
+                "campaign_name": pb.campaign.name
             })
 
         # Format response
@@ -2507,37 +4228,25 @@ async def google_ads_get_asset_performance(params: GetAssetPerformanceInput) ->
 
             # Show summary
             lines.append("## Performance Summary")
-            for label in ["BEST", "GOOD", "LOW", "LEARNING", "PENDING", "UNKNOWN"]:
+            for label in _LABEL_ORDER:
                 if label in by_label:
                     count = len(by_label[label])
                     lines.append(f"- **{label}**: {count} asset(s)")
             lines.append("")
 
             # Show assets by performance
-            for label in ["BEST", "GOOD", "LOW", "LEARNING", "PENDING", "UNKNOWN"]:
+            for label in _LABEL_ORDER:
                 if label not in by_label:
                     continue
 
-                label_icon = {
-                    "BEST": "🏆",
-                    "GOOD": "✅",
-                    "LOW": "⚠️",
-                    "LEARNING": "🔄",
-                    "PENDING": "⏳",
-                    "UNKNOWN": "❓"
-                }.get(label, "")
+                label_icon = _LABEL_ICONS.get(label, "")
 
                 lines.append(f"## {label_icon} {label} Performance")
                 lines.append("")
 
                 for asset in by_label[label][:20]:  # Limit per section
                     # Approval status icon
-                    approval_icon = {
-                        "APPROVED": "✅",
-                        "DISAPPROVED": "❌",
-                        "LIMITED": "⚠️",
-                        "UNDER_REVIEW": "🔍"
-                    }.get(asset['approval_status'], "❓")
+                    approval_icon = _APPROVAL_ICONS.get(asset['approval_status'], "❓")
 
                     lines.append(f"### {asset['asset_type']} - {asset['field_type']}")
                     lines.append(f"**Content**: {asset['preview']}")
@@ -2679,6 +4388,8 @@ async def google_ads_create_campaign(params: CreateCampaignInput) -> str:
             operations=[campaign_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         campaign_resource_name = campaign_response.results[0].resource_name
         campaign_id = campaign_resource_name.split("/")[-1]
 
@@ -2752,7 +4463,7 @@ async def google_ads_update_campaign_status(params: UpdateCampaignStatusInput) -
         campaign.resource_name = client.get_service("CampaignService").campaign_path(
             customer_id, params.campaign_id
         )
-        campaign.status = getattr(client.enums.CampaignStatusEnum, params.status.value)
+        campaign.status = _enum_map("CampaignStatusEnum")[params.status.value]
 
         # Set field mask
         campaign_operation.update_mask.paths.extend(["status"])
@@ -2763,6 +4474,8 @@ async def google_ads_update_campaign_status(params: UpdateCampaignStatusInput) -
             operations=[campaign_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         action = {
             CampaignStatus.ENABLED: "enabled",
             CampaignStatus.PAUSED: "paused",
@@ -2929,67 +4642,60 @@ async def google_ads_list_ad_groups(params: ListAdGroupsInput) -> str:
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-        googleads_service = client.get_service("GoogleAdsService")
+        googleads_service = _get_service("GoogleAdsService")
 
-        # Build query
-        query = f"""
-            SELECT
-                ad_group.id,
-                ad_group.name,
-                ad_group.status,
-                ad_group.type,
-                ad_group.cpc_bid_micros,
-                campaign.id,
-                campaign.name
-            FROM ad_group
-            WHERE campaign.id = {params.campaign_id}
-        """
-
-        if params.status_filter:
-            query += f" AND ad_group.status = '{params.status_filter.value}'"
-
-        query += f" ORDER BY ad_group.name LIMIT {params.limit}"
+        query = _AD_GROUPS_QUERY.format_map({
+            "campaign_id": _numeric_id(params.campaign_id, "Campaign ID"),
+            "status_clause": _status_clause("ad_group.status", params.status_filter, _AD_GROUP_STATUS_VALUES),
+            "limit": int(params.limit)
+        })
 
-        results = googleads_service.search(customer_id=customer_id, query=query)
+        results = await asyncio.to_thread(_cached_search, googleads_service, customer_id, query)
 
-        ad_groups = []
-        for row in results:
-            ag = row.ad_group
-            ad_groups.append({
-                "id": ag.id,
-                "name": ag.name,
-                "status": ag.status.name,
-                "type": ag.type_.name if hasattr(ag, 'type_') else "UNKNOWN",
-                "cpc_bid_micros": ag.cpc_bid_micros,
-                "campaign_id": row.campaign.id,
-                "campaign_name": row.campaign.name
-            })
+        # Row schema is fixed by the query, so probe optional fields once
+        has_type = bool(results) and hasattr(results[0].ad_group, 'type_')
 
+        # Markdown is rendered straight from the rows in a single pass
         if params.response_format == ResponseFormat.MARKDOWN:
-            if not ad_groups:
+            if not results:
                 return f"No ad groups found for campaign {params.campaign_id}"
 
-            lines = [f"# Ad Groups for Campaign {ad_groups[0]['campaign_name']}", ""]
-            lines.append(f"Found {len(ad_groups)} ad group(s)\n")
-
-            for ag in ad_groups:
-                status_emoji = "✅" if ag['status'] == "ENABLED" else "⏸️" if ag['status'] == "PAUSED" else "🗑️"
-                lines.append(f"## {status_emoji} {ag['name']} ({ag['id']})")
-                lines.append(f"- **Status**: {ag['status']}")
-                lines.append(f"- **Type**: {ag['type']}")
-                if ag['cpc_bid_micros']:
-                    lines.append(f"- **CPC Bid**: {_format_money_micros(ag['cpc_bid_micros'])}")
-                lines.append("")
+            # Each row is written as one chunk prefixed by its blank separator line
+            buf = io.StringIO()
+            buf.write(f"# Ad Groups for Campaign {results[0].campaign.name}\n\nFound {len(results)} ad group(s)\n")
+
+            for row in results:
+                ag = row.ad_group
+                status = ag.status.name
+                buf.write(
+                    f"\n## {_STATUS_EMOJI.get(status, '❓')} {ag.name} ({ag.id})\n"
+                    f"- **Status**: {status}\n"
+                    f"- **Type**: {ag.type_.name if has_type else 'UNKNOWN'}\n"
+                )
+                if ag.cpc_bid_micros:
+                    buf.write(f"- **CPC Bid**: {_format_money_micros(ag.cpc_bid_micros)}\n")
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         else:  # JSON
-            return json.dumps({
+            ad_groups = [
+                {
+                    "id": row.ad_group.id,
+                    "name": row.ad_group.name,
+                    "status": row.ad_group.status.name,
+                    "type": row.ad_group.type_.name if has_type else "UNKNOWN",
+                    "cpc_bid_micros": row.ad_group.cpc_bid_micros,
+                    "campaign_id": row.campaign.id,
+                    "campaign_name": row.campaign.name
+                }
+                for row in results
+            ]
+
+            return await asyncio.to_thread(_dumps, {
                 "campaign_id": params.campaign_id,
                 "total": len(ad_groups),
                 "ad_groups": ad_groups
-            }, indent=2)
+            })
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -3026,28 +4732,21 @@ async def google_ads_create_ad_group(params: CreateAdGroupInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_service = client.get_service("AdGroupService")
-        campaign_service = client.get_service("CampaignService")
-
-        # Create ad group operation
-        ad_group_operation = client.get_type("AdGroupOperation")
-        ad_group = ad_group_operation.create
-
-        ad_group.name = params.ad_group_name
-        ad_group.campaign = campaign_service.campaign_path(customer_id, params.campaign_id)
-        ad_group.status = getattr(client.enums.AdGroupStatusEnum, params.status.value)
-        ad_group.type_ = client.enums.AdGroupTypeEnum.SEARCH_STANDARD
-
-        if params.cpc_bid_micros:
-            ad_group.cpc_bid_micros = params.cpc_bid_micros
+        mutate_op = _ad_group_mutate_operation(
+            client,
+            customer_id,
+            params.campaign_id,
+            params.ad_group_name,
+            params.status.value,
+            params.cpc_bid_micros
+        )
 
         # Execute
-        response = ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=[ad_group_operation]
-        )
+        response = await _mutate_async(customer_id, [mutate_op])
+
+        _query_cache.invalidate(customer_id)
 
-        ad_group_resource_name = response.results[0].resource_name
+        ad_group_resource_name = response.mutate_operation_responses[0].ad_group_result.resource_name
         ad_group_id = ad_group_resource_name.split("/")[-1]
 
         return f"""✅ Ad group created successfully!
@@ -3095,7 +4794,7 @@ async def google_ads_update_ad_group_status(params: UpdateAdGroupStatusInput) ->
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_service = client.get_service("AdGroupService")
+        ad_group_service = _get_async_service("AdGroupService")
 
         # Create operation
         ad_group_operation = client.get_type("AdGroupOperation")
@@ -3104,17 +4803,21 @@ async def google_ads_update_ad_group_status(params: UpdateAdGroupStatusInput) ->
         ad_group.resource_name = ad_group_service.ad_group_path(
             customer_id, params.ad_group_id
         )
-        ad_group.status = getattr(client.enums.AdGroupStatusEnum, params.status.value)
+        ad_group.status = _enum_map("AdGroupStatusEnum")[params.status.value]
 
         # Set field mask
         ad_group_operation.update_mask.paths.extend(["status"])
 
         # Execute
-        response = ad_group_service.mutate_ad_groups(
+        response = await _call_with_rate_limit_async(
+            1,
+            ad_group_service.mutate_ad_groups,
             customer_id=customer_id,
             operations=[ad_group_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         action = {
             AdGroupStatus.ENABLED: "enabled",
             AdGroupStatus.PAUSED: "paused",
@@ -3159,75 +4862,61 @@ async def google_ads_list_keywords(params: ListKeywordsInput) -> str:
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-        googleads_service = client.get_service("GoogleAdsService")
+        googleads_service = _get_service("GoogleAdsService")
 
-        query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.status,
-                ad_group_criterion.cpc_bid_micros,
-                ad_group.id,
-                ad_group.name
-            FROM ad_group_criterion
-            WHERE ad_group.id = {params.ad_group_id}
-              AND ad_group_criterion.type = 'KEYWORD'
-              AND ad_group_criterion.status != 'REMOVED'
-            ORDER BY ad_group_criterion.keyword.text
-            LIMIT {params.limit}
-        """
+        query = _KEYWORDS_QUERY.format_map({
+            "ad_group_id": _numeric_id(params.ad_group_id, "Ad group ID"),
+            "limit": int(params.limit)
+        })
 
-        results = googleads_service.search(customer_id=customer_id, query=query)
+        results = await asyncio.to_thread(_cached_search, googleads_service, customer_id, query)
 
-        keywords = []
-        ad_group_name = None
-        for row in results:
-            if not ad_group_name:
-                ad_group_name = row.ad_group.name
-
-            criterion = row.ad_group_criterion
-            keywords.append({
-                "id": criterion.criterion_id,
-                "text": criterion.keyword.text,
-                "match_type": criterion.keyword.match_type.name,
-                "status": criterion.status.name,
-                "cpc_bid_micros": criterion.cpc_bid_micros if hasattr(criterion, 'cpc_bid_micros') else None
-            })
+        # Row schema is fixed by the query, so probe optional fields once
+        ad_group_name = results[0].ad_group.name if results else None
+        has_bid = bool(results) and hasattr(results[0].ad_group_criterion, 'cpc_bid_micros')
 
+        # Markdown is rendered straight from the rows in a single pass
         if params.response_format == ResponseFormat.MARKDOWN:
-            if not keywords:
+            if not results:
                 return f"No keywords found for ad group {params.ad_group_id}"
 
-            lines = [f"# Keywords for Ad Group: {ad_group_name}", ""]
-            lines.append(f"Found {len(keywords)} keyword(s)\n")
-
-            for kw in keywords:
-                status_emoji = "✅" if kw['status'] == "ENABLED" else "⏸️"
-                match_icon = {
-                    "EXACT": "🎯",
-                    "PHRASE": "📝",
-                    "BROAD": "🌐"
-                }.get(kw['match_type'], "❓")
-
-                lines.append(f"## {status_emoji} {match_icon} {kw['text']}")
-                lines.append(f"- **Match Type**: {kw['match_type']}")
-                lines.append(f"- **Status**: {kw['status']}")
-                lines.append(f"- **ID**: {kw['id']}")
-                if kw['cpc_bid_micros']:
-                    lines.append(f"- **CPC Bid**: {_format_money_micros(kw['cpc_bid_micros'])}")
-                lines.append("")
+            # Each row is written as one chunk prefixed by its blank separator line
+            buf = io.StringIO()
+            buf.write(f"# Keywords for Ad Group: {ad_group_name}\n\nFound {len(results)} keyword(s)\n")
+
+            for row in results:
+                criterion = row.ad_group_criterion
+                match_type = criterion.keyword.match_type.name
+                status = criterion.status.name
+                buf.write(
+                    f"\n## {_STATUS_EMOJI.get(status, '❓')} {_MATCH_ICON.get(match_type, '❓')} {criterion.keyword.text}\n"
+                    f"- **Match Type**: {match_type}\n"
+                    f"- **Status**: {status}\n"
+                    f"- **ID**: {criterion.criterion_id}\n"
+                )
+                if has_bid and criterion.cpc_bid_micros:
+                    buf.write(f"- **CPC Bid**: {_format_money_micros(criterion.cpc_bid_micros)}\n")
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         else:  # JSON
-            return json.dumps({
+            keywords = [
+                {
+                    "id": row.ad_group_criterion.criterion_id,
+                    "text": row.ad_group_criterion.keyword.text,
+                    "match_type": row.ad_group_criterion.keyword.match_type.name,
+                    "status": row.ad_group_criterion.status.name,
+                    "cpc_bid_micros": row.ad_group_criterion.cpc_bid_micros if has_bid else None
+                }
+                for row in results
+            ]
+
+            return await asyncio.to_thread(_dumps, {
                 "ad_group_id": params.ad_group_id,
                 "ad_group_name": ad_group_name,
                 "total": len(keywords),
                 "keywords": keywords
-            }, indent=2)
+            })
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -3263,42 +4952,50 @@ async def google_ads_add_keywords(params: AddKeywordsInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_criterion_service = client.get_service("AdGroupCriterionService")
-        ad_group_service = client.get_service("AdGroupService")
+        operations = _keyword_mutate_operations(
+            client,
+            f"customers/{customer_id}/adGroups/{params.ad_group_id}",
+            params.keywords,
+            params.match_type.value,
+            params.cpc_bid_micros
+        )
 
-        operations = []
-        for keyword_text in params.keywords:
-            criterion_operation = client.get_type("AdGroupCriterionOperation")
-            criterion = criterion_operation.create
+        # Execute; partial failure lets valid keywords through when others are rejected
+        response = await _mutate_async(customer_id, operations, partial_failure=True)
+        errors = _partial_failure_errors(response)
 
-            criterion.ad_group = ad_group_service.ad_group_path(customer_id, params.ad_group_id)
-            criterion.status = client.enums.AdGroupCriterionStatusEnum.ENABLED
-            criterion.keyword.text = keyword_text
-            criterion.keyword.match_type = getattr(
-                client.enums.KeywordMatchTypeEnum, params.match_type.value
-            )
+        added = [kw for i, kw in enumerate(params.keywords) if i not in errors]
+        if added:
+            _query_cache.invalidate(customer_id)
 
-            if params.cpc_bid_micros:
-                criterion.cpc_bid_micros = params.cpc_bid_micros
+        keyword_list = "\n".join([f"  - {kw} ({params.match_type.value})" for kw in added])
 
-            operations.append(criterion_operation)
+        if not errors:
+            return f"""✅ Added {len(params.keywords)} keyword(s) successfully!
 
-        # Execute
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=operations
-        )
+**Ad Group ID**: {params.ad_group_id}
+**Match Type**: {params.match_type.value}
+**CPC Bid**: {_format_money_micros(params.cpc_bid_micros) if params.cpc_bid_micros else 'Inherited from ad group'}
+
+**Keywords added:**
+{keyword_list}"""
 
-        keyword_list = "\n".join([f"  - {kw} ({params.match_type.value})" for kw in params.keywords])
+        failed_list = "\n".join(
+            f"  - {params.keywords[i]}: {message}" if 0 <= i < len(params.keywords) else f"  - {message}"
+            for i, message in sorted(errors.items())
+        )
 
-        return f"""✅ Added {len(params.keywords)} keyword(s) successfully!
+        return f"""{"⚠️" if added else "❌"} Added {len(added)} of {len(params.keywords)} keyword(s)
 
 **Ad Group ID**: {params.ad_group_id}
 **Match Type**: {params.match_type.value}
 **CPC Bid**: {_format_money_micros(params.cpc_bid_micros) if params.cpc_bid_micros else 'Inherited from ad group'}
 
 **Keywords added:**
-{keyword_list}"""
+{keyword_list or "  (none)"}
+
+**Keywords failed:**
+{failed_list}"""
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -3321,8 +5018,11 @@ async def google_ads_remove_keywords(params: RemoveKeywordsInput) -> str:
     Args:
         params (RemoveKeywordsInput): Input parameters
 
+    Requests with more than 5,000 keywords are submitted as an asynchronous
+    batch job; check its progress with google_ads_poll_batch_job.
+
     Returns:
-        str: Success confirmation
+        str: Success confirmation, or the batch job ID for large removals
 
     Examples:
         - "Remove keyword 12345"
@@ -3332,7 +5032,24 @@ async def google_ads_remove_keywords(params: RemoveKeywordsInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_criterion_service = client.get_service("AdGroupCriterionService")
+        if len(params.keyword_ids) > MUTATE_MAX_OPERATIONS:
+            mutate_operations = []
+            for keyword_id in params.keyword_ids:
+                mutate_op = client.get_type("MutateOperation")
+                mutate_op.ad_group_criterion_operation.remove = f"customers/{customer_id}/adGroupCriteria/{keyword_id}"
+                mutate_operations.append(mutate_op)
+
+            batch_job_resource_name = await asyncio.to_thread(_submit_batch_job, client, customer_id, mutate_operations)
+            _query_cache.invalidate(customer_id)
+
+            return f"""⏳ Removal of {len(params.keyword_ids)} keyword(s) submitted as a batch job.
+
+**Batch Job ID**: {batch_job_resource_name.split("/")[-1]}
+**Status**: RUNNING
+
+Check progress with google_ads_poll_batch_job."""
+
+        ad_group_criterion_service = _get_async_service("AdGroupCriterionService")
 
         operations = []
         for keyword_id in params.keyword_ids:
@@ -3342,17 +5059,127 @@ async def google_ads_remove_keywords(params: RemoveKeywordsInput) -> str:
             operations.append(criterion_operation)
 
         # Execute
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
+        response = await _call_with_rate_limit_async(
+            len(operations),
+            ad_group_criterion_service.mutate_ad_group_criteria,
             customer_id=customer_id,
             operations=operations
         )
 
+        _query_cache.invalidate(customer_id)
+
         return f"✅ Removed {len(params.keyword_ids)} keyword(s) successfully."
 
     except Exception as e:
         return _handle_google_ads_error(e)
 
 
+@mcp.tool(
+    name="google_ads_poll_batch_job",
+    annotations={
+        "title": "Poll Batch Job",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def google_ads_poll_batch_job(params: PollBatchJobInput) -> str:
+    """
+    Check the progress of a batch job submitted by a bulk operation.
+
+    When the job is done, failed operations are listed with their error message.
+
+    Args:
+        params (PollBatchJobInput): Input parameters
+
+    Returns:
+        str: Batch job status, progress and failures
+
+    Examples:
+        - "Check batch job 987654"
+        - "Is my keyword removal batch job finished?"
+    """
+    try:
+        customer_id = _validate_customer_id(params.customer_id)
+        batch_job_id = _numeric_id(params.batch_job_id, "Batch job ID")
+
+        query = (
+            "SELECT batch_job.resource_name, batch_job.status, "
+            "batch_job.metadata.operation_count, batch_job.metadata.executed_operation_count, "
+            "batch_job.metadata.estimated_completion_ratio "
+            f"FROM batch_job WHERE batch_job.id = {batch_job_id}"
+        )
+
+        # Status changes while the job runs, so bypass the response cache
+        rows = await asyncio.to_thread(
+            _call_with_rate_limit,
+            1,
+            _stream_rows,
+            googleads_service=_get_service("GoogleAdsService"),
+            customer_id=customer_id,
+            query=query
+        )
+
+        if not rows:
+            return f"Batch job {batch_job_id} not found for customer {customer_id}"
+
+        batch_job = rows[0].batch_job
+        status = batch_job.status.name
+        metadata = batch_job.metadata
+
+        failed_count = 0
+        failures = []
+        if status == "DONE":
+            failed_count, failures = await asyncio.to_thread(
+                _call_with_rate_limit,
+                1,
+                _batch_job_failures,
+                resource_name=batch_job.resource_name,
+                max_errors=params.max_errors
+            )
+
+        job = {
+            "batch_job_id": batch_job_id,
+            "status": status,
+            "operation_count": metadata.operation_count,
+            "executed_operation_count": metadata.executed_operation_count,
+            "estimated_completion_ratio": metadata.estimated_completion_ratio,
+            "failed_count": failed_count,
+            "failures": failures
+        }
+
+        if params.response_format == ResponseFormat.MARKDOWN:
+            status_icon = {"DONE": "✅", "RUNNING": "⏳", "PENDING": "🕐"}.get(status, "❓")
+            lines = [
+                f"# {status_icon} Batch Job {batch_job_id}",
+                "",
+                f"**Status**: {status}",
+                f"**Operations**: {job['executed_operation_count']}/{job['operation_count']} executed "
+                f"({job['estimated_completion_ratio'] * 100:.0f}%)"
+            ]
+            if status == "DONE":
+                lines.append(f"**Failed Operations**: {failed_count}")
+                if failures:
+                    lines.extend(["", "## Failures", ""])
+                    lines.extend(
+                        f"- Operation {failure['operation_index']}: {failure['message']}"
+                        for failure in failures
+                    )
+                    if failed_count > len(failures):
+                        lines.append(f"- ... and {failed_count - len(failures)} more")
+            else:
+                lines.extend(["", "Poll again in a few minutes."])
+
+            return "\n".join(lines)
+
+        else:  # JSON
+            return _dumps(job)
+
+    except Exception as e:
+        return _handle_google_ads_error(e)
+
+
 # ============================================================================
 # ADS TOOLS
 # ============================================================================
@@ -3385,84 +5212,76 @@ async def google_ads_list_ads(params: ListAdsInput) -> str:
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-        googleads_service = client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                ad_group_ad.ad.id,
-                ad_group_ad.ad.type,
-                ad_group_ad.status,
-                ad_group_ad.ad.final_urls,
-                ad_group_ad.ad.responsive_search_ad.headlines,
-                ad_group_ad.ad.responsive_search_ad.descriptions,
-                ad_group.id,
-                ad_group.name
-            FROM ad_group_ad
-            WHERE ad_group.id = {params.ad_group_id}
-        """
-
-        if params.status_filter:
-            query += f" AND ad_group_ad.status = '{params.status_filter.value}'"
+        googleads_service = _get_service("GoogleAdsService")
 
-        query += f" LIMIT {params.limit}"
+        query = _ADS_QUERY.format_map({
+            "ad_group_id": _numeric_id(params.ad_group_id, "Ad group ID"),
+            "status_clause": _status_clause("ad_group_ad.status", params.status_filter, _AD_STATUS_VALUES),
+            "limit": int(params.limit)
+        })
 
-        results = googleads_service.search(customer_id=customer_id, query=query)
+        results = await asyncio.to_thread(_cached_search, googleads_service, customer_id, query)
 
-        ads = []
-        ad_group_name = None
-        for row in results:
-            if not ad_group_name:
-                ad_group_name = row.ad_group.name
+        # Row schema is fixed by the query, so probe optional fields once
+        ad_group_name = results[0].ad_group.name if results else None
+        has_rsa = bool(results) and hasattr(results[0].ad_group_ad.ad, 'responsive_search_ad')
 
-            ad_group_ad = row.ad_group_ad
-            ad = ad_group_ad.ad
+        # Markdown is rendered straight from the rows in a single pass
+        if params.response_format == ResponseFormat.MARKDOWN:
+            if not results:
+                return f"No ads found for ad group {params.ad_group_id}"
 
-            ad_data = {
-                "id": ad.id,
-                "type": ad.type_.name,
-                "status": ad_group_ad.status.name,
-                "final_urls": list(ad.final_urls) if ad.final_urls else []
-            }
+            # Each row is written as one chunk prefixed by its blank separator line
+            buf = io.StringIO()
+            buf.write(f"# Ads for Ad Group: {ad_group_name}\n\nFound {len(results)} ad(s)\n")
+
+            for row in results:
+                ad = row.ad_group_ad.ad
+                ad_type = ad.type_.name
+                status = row.ad_group_ad.status.name
+                buf.write(
+                    f"\n## {_STATUS_EMOJI.get(status, '❓')} Ad {ad.id}\n"
+                    f"- **Type**: {ad_type}\n"
+                    f"- **Status**: {status}\n"
+                )
 
-            # Extract headlines if responsive search ad
-            if ad.type_.name == "RESPONSIVE_SEARCH_AD" and hasattr(ad, 'responsive_search_ad'):
-                rsa = ad.responsive_search_ad
-                ad_data["headlines"] = [h.text for h in rsa.headlines] if rsa.headlines else []
-                ad_data["descriptions"] = [d.text for d in rsa.descriptions] if rsa.descriptions else []
+                if has_rsa and ad_type == "RESPONSIVE_SEARCH_AD":
+                    rsa = ad.responsive_search_ad
+                    # Only the first three headlines are shown; don't copy the rest
+                    if rsa.headlines:
+                        buf.write(f"- **Headlines**: {', '.join(h.text for h in islice(rsa.headlines, 3))}...\n")
+                    if rsa.descriptions:
+                        buf.write(f"- **Descriptions**: {rsa.descriptions[0].text[:50]}...\n")
+                if ad.final_urls:
+                    buf.write(f"- **URL**: {ad.final_urls[0]}\n")
 
-            ads.append(ad_data)
+            return buf.getvalue()
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            if not ads:
-                return f"No ads found for ad group {params.ad_group_id}"
+        else:  # JSON
+            ads = []
+            for row in results:
+                ad = row.ad_group_ad.ad
+                ad_data = {
+                    "id": ad.id,
+                    "type": ad.type_.name,
+                    "status": row.ad_group_ad.status.name,
+                    "final_urls": list(ad.final_urls) if ad.final_urls else []
+                }
 
-            lines = [f"# Ads for Ad Group: {ad_group_name}", ""]
-            lines.append(f"Found {len(ads)} ad(s)\n")
-
-            for ad in ads:
-                status_emoji = "✅" if ad['status'] == "ENABLED" else "⏸️" if ad['status'] == "PAUSED" else "🗑️"
-                lines.append(f"## {status_emoji} Ad {ad['id']}")
-                lines.append(f"- **Type**: {ad['type']}")
-                lines.append(f"- **Status**: {ad['status']}")
-
-                if ad.get('headlines'):
-                    lines.append(f"- **Headlines**: {', '.join(ad['headlines'][:3])}...")
-                if ad.get('descriptions'):
-                    lines.append(f"- **Descriptions**: {ad['descriptions'][0][:50]}...")
-                if ad.get('final_urls'):
-                    lines.append(f"- **URL**: {ad['final_urls'][0]}")
-                lines.append("")
+                # Extract headlines if responsive search ad
+                if has_rsa and ad_data["type"] == "RESPONSIVE_SEARCH_AD":
+                    rsa = ad.responsive_search_ad
+                    ad_data["headlines"] = [h.text for h in rsa.headlines] if rsa.headlines else []
+                    ad_data["descriptions"] = [d.text for d in rsa.descriptions] if rsa.descriptions else []
 
-            return "\n".join(lines)
+                ads.append(ad_data)
 
-        else:  # JSON
-            return json.dumps({
+            return await asyncio.to_thread(_dumps, {
                 "ad_group_id": params.ad_group_id,
                 "ad_group_name": ad_group_name,
                 "total": len(ads),
                 "ads": ads
-            }, indent=2)
+            })
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -3498,47 +5317,22 @@ async def google_ads_create_responsive_search_ad(params: CreateResponsiveSearchA
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_ad_service = client.get_service("AdGroupAdService")
-        ad_group_service = client.get_service("AdGroupService")
-
-        # Create ad group ad operation
-        ad_group_ad_operation = client.get_type("AdGroupAdOperation")
-        ad_group_ad = ad_group_ad_operation.create
-
-        ad_group_ad.ad_group = ad_group_service.ad_group_path(customer_id, params.ad_group_id)
-        ad_group_ad.status = client.enums.AdGroupAdStatusEnum.PAUSED  # Start paused for safety
-
-        # Set final URLs
-        ad_group_ad.ad.final_urls.extend(params.final_urls)
-
-        # Create responsive search ad
-        rsa = ad_group_ad.ad.responsive_search_ad
-
-        # Add headlines
-        for headline_text in params.headlines:
-            headline = client.get_type("AdTextAsset")
-            headline.text = headline_text
-            rsa.headlines.append(headline)
-
-        # Add descriptions
-        for description_text in params.descriptions:
-            description = client.get_type("AdTextAsset")
-            description.text = description_text
-            rsa.descriptions.append(description)
-
-        # Set display paths
-        if params.path1:
-            rsa.path1 = params.path1
-        if params.path2:
-            rsa.path2 = params.path2
+        mutate_op = _responsive_search_ad_mutate_operation(
+            client,
+            f"customers/{customer_id}/adGroups/{params.ad_group_id}",
+            params.headlines,
+            params.descriptions,
+            params.final_urls,
+            params.path1,
+            params.path2
+        )
 
         # Execute
-        response = ad_group_ad_service.mutate_ad_group_ads(
-            customer_id=customer_id,
-            operations=[ad_group_ad_operation]
-        )
+        response = await _mutate_async(customer_id, [mutate_op])
 
-        ad_resource_name = response.results[0].resource_name
+        _query_cache.invalidate(customer_id)
+
+        ad_resource_name = response.mutate_operation_responses[0].ad_group_ad_result.resource_name
         ad_id = ad_resource_name.split("/")[-1].split("~")[1]
 
         return f"""✅ Responsive search ad created successfully!
@@ -3586,7 +5380,7 @@ async def google_ads_update_ad_status(params: UpdateAdStatusInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        ad_group_ad_service = client.get_service("AdGroupAdService")
+        ad_group_ad_service = _get_async_service("AdGroupAdService")
 
         # Create operation
         ad_group_ad_operation = client.get_type("AdGroupAdOperation")
@@ -3595,17 +5389,21 @@ async def google_ads_update_ad_status(params: UpdateAdStatusInput) -> str:
         ad_group_ad.resource_name = ad_group_ad_service.ad_group_ad_path(
             customer_id, params.ad_group_id, params.ad_id
         )
-        ad_group_ad.status = getattr(client.enums.AdGroupAdStatusEnum, params.status.value)
+        ad_group_ad.status = _enum_map("AdGroupAdStatusEnum")[params.status.value]
 
         # Set field mask
         ad_group_ad_operation.update_mask.paths.extend(["status"])
 
         # Execute
-        response = ad_group_ad_service.mutate_ad_group_ads(
+        response = await _call_with_rate_limit_async(
+            1,
+            ad_group_ad_service.mutate_ad_group_ads,
             customer_id=customer_id,
             operations=[ad_group_ad_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         action = {
             AdStatus.ENABLED: "enabled",
             AdStatus.PAUSED: "paused",
@@ -3618,10 +5416,174 @@ async def google_ads_update_ad_status(params: UpdateAdStatusInput) -> str:
         return _handle_google_ads_error(e)
 
 
+@mcp.tool(
+    name="google_ads_create_complete_ad_group",
+    annotations={
+        "title": "Create Complete Ad Group",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def google_ads_create_complete_ad_group(params: CreateCompleteAdGroupInput) -> str:
+    """
+    Create an ad group together with its keywords and a responsive search ad.
+
+    Everything is sent in one atomic GoogleAdsService.Mutate request: the ad group
+    gets a temporary ID that the keyword and ad operations reference, so either the
+    whole ad group is created or nothing is. Replaces calling google_ads_create_ad_group,
+    google_ads_add_keywords and google_ads_create_responsive_search_ad in sequence.
+
+    Args:
+        params (CreateCompleteAdGroupInput): Input parameters
+
+    Returns:
+        str: Success message with ad group, keyword and ad IDs
+
+    Examples:
+        - "Create ad group 'Summer Shoes' in campaign 123456 with keywords and an RSA"
+        - "Set up a complete ad group with exact match keywords"
+    """
+    try:
+        customer_id = _validate_customer_id(params.customer_id)
+        client = _get_google_ads_client()
+
+        temp_ad_group = f"customers/{customer_id}/adGroups/-1"
+
+        mutate_operations = [
+            _ad_group_mutate_operation(
+                client,
+                customer_id,
+                params.campaign_id,
+                params.ad_group_name,
+                params.status.value,
+                params.cpc_bid_micros,
+                temp_id=-1
+            ),
+            *_keyword_mutate_operations(
+                client,
+                temp_ad_group,
+                params.keywords,
+                params.match_type.value
+            ),
+            _responsive_search_ad_mutate_operation(
+                client,
+                temp_ad_group,
+                params.headlines,
+                params.descriptions,
+                params.final_urls,
+                params.path1,
+                params.path2
+            )
+        ]
+
+        # Execute
+        response = await _mutate_async(customer_id, mutate_operations)
+
+        _query_cache.invalidate(customer_id)
+
+        results = response.mutate_operation_responses
+        ad_group_id = results[0].ad_group_result.resource_name.split("/")[-1]
+        criterion_ids = [
+            result.ad_group_criterion_result.resource_name.split("~")[-1]
+            for result in results[1:-1]
+        ]
+        ad_id = results[-1].ad_group_ad_result.resource_name.split("~")[-1]
+
+        keyword_list = "\n".join(
+            f"  - {kw} ({params.match_type.value}, ID: {criterion_id})"
+            for kw, criterion_id in zip(params.keywords, criterion_ids)
+        )
+
+        return f"""✅ Ad group created with keywords and ad in a single request!
+
+**Ad Group Name**: {params.ad_group_name}
+**Ad Group ID**: {ad_group_id}
+**Campaign ID**: {params.campaign_id}
+**Status**: {params.status.value}
+**CPC Bid**: {_format_money_micros(params.cpc_bid_micros) if params.cpc_bid_micros else 'Not set (inherited from campaign)'}
+
+**Keywords added ({len(criterion_ids)}):**
+{keyword_list}
+
+**Responsive Search Ad ID**: {ad_id} (PAUSED)
+**Headlines**: {len(params.headlines)} | **Descriptions**: {len(params.descriptions)}
+**Final URL**: {params.final_urls[0]}
+
+Next step: Enable the ad group and ad when ready."""
+
+    except Exception as e:
+        return _handle_google_ads_error(e)
+
+
 # ============================================================================
 # ASSET MANAGEMENT TOOLS (Performance Max)
 # ============================================================================
 
+async def _create_text_assets_core(
+    customer_id: str,
+    asset_group_id: str,
+    assets: List[Tuple[str, str]]
+) -> Dict[str, Any]:
+    """
+    Create text assets and link them to an asset group.
+
+    Shared by the create and update asset tools, which format the returned
+    summary themselves. Texts over the length limit are reported under
+    "validation_errors" without being sent, texts the API rejects under
+    "failed"; request-level errors propagate to the caller.
+
+    Args:
+        customer_id: Validated customer ID
+        asset_group_id: Asset group to link the new assets to
+        assets: (field_type, text) pairs, e.g. ("HEADLINE", "Free Shipping")
+
+    Returns:
+        Dict[str, Any]: JSON-serializable creation summary
+    """
+    assets, validation_errors = _validate_text_assets(assets)
+
+    # Create the assets and link them to the asset group in a single request
+    # (shared with concurrent calls for the same account); links reference the
+    # new assets through temporary IDs. With partial failure one rejected text
+    # doesn't sink the rest (its link fails with it).
+    results, errors = [], {}
+    if assets:
+        client = _get_google_ads_client(use_proto_plus=False)
+        results, errors = await _mutate_batcher.submit(
+            customer_id,
+            _text_asset_mutate_operations(client, customer_id, asset_group_id, assets)
+        )
+
+    # Responses hold all asset creates first, then the links in the same order
+    n_assets = len(assets)
+    created = []
+    failed_assets = []
+    for i, (field_type, text) in enumerate(assets):
+        error = errors.get(i) or errors.get(n_assets + i)
+        if error:
+            failed_assets.append({"field_type": field_type, "text": text, "error": error})
+        else:
+            created.append(i)
+
+    # Nothing to invalidate or summarize when every asset was rejected
+    if created:
+        _query_cache.invalidate(customer_id)
+
+    return {
+        "asset_group_id": asset_group_id,
+        "total_created": len(created),
+        "assets": _text_asset_summary([assets[i] for i in created]),
+        "asset_resource_names": [results[i].asset_result.resource_name for i in created],
+        "asset_group_asset_resource_names": [
+            results[n_assets + i].asset_group_asset_result.resource_name for i in created
+        ],
+        "failed": failed_assets,
+        "validation_errors": validation_errors
+    }
+
+
 @mcp.tool(
     name="google_ads_create_text_assets",
     annotations={
@@ -3663,137 +5625,93 @@ async def google_ads_create_text_assets(params: CreateTextAssetsInput) -> str:
     Note:
         - All text assets are created in APPROVED status (pending Google review)
         - Assets will be automatically linked to the asset group
+        - Assets and links are created in a single request; rejected texts are
+          reported individually without failing the rest
         - Use this to replace disapproved assets with policy-compliant alternatives
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-
-        # Services needed
-        asset_service = client.get_service("AssetService")
-        asset_group_asset_service = client.get_service("AssetGroupAssetService")
 
         # Validate at least one asset type is provided
         if not any([params.headlines, params.descriptions, params.long_headlines, params.business_name]):
             return "❌ Error: You must provide at least one asset type (headlines, descriptions, long_headlines, or business_name)."
 
-        operations = []
-        asset_summary = {
-            "headlines": [],
-            "descriptions": [],
-            "long_headlines": [],
-            "business_name": None
-        }
-
-        # Helper function to create text asset and link to asset group
-        def create_text_asset_operation(text: str, field_type: str):
-            """Create asset operation with text asset."""
-            asset_operation = client.get_type("AssetOperation")
-            asset = asset_operation.create
-            asset.type_ = client.enums.AssetTypeEnum.TEXT
-            asset.text_asset.text = text
-            asset.name = f"{field_type}_{text[:20]}"  # Descriptive name (truncated)
-            return asset_operation
-
-        def create_asset_group_asset_operation(asset_resource_name: str, field_type: str):
-            """Link asset to asset group."""
-            aga_operation = client.get_type("AssetGroupAssetOperation")
-            aga = aga_operation.create
-            aga.asset = asset_resource_name
-            aga.asset_group = f"customers/{customer_id}/assetGroups/{params.asset_group_id}"
-            aga.field_type = getattr(client.enums.AssetFieldTypeEnum, field_type)
-            return aga_operation
-
-        # Step 1: Create all text assets first
-        asset_operations = []
-        asset_field_types = []  # Track field type for each asset
-
-        if params.headlines:
-            for headline in params.headlines:
-                asset_operations.append(create_text_asset_operation(headline, "HEADLINE"))
-                asset_field_types.append("HEADLINE")
-                asset_summary["headlines"].append(headline)
-
-        if params.descriptions:
-            for description in params.descriptions:
-                asset_operations.append(create_text_asset_operation(description, "DESCRIPTION"))
-                asset_field_types.append("DESCRIPTION")
-                asset_summary["descriptions"].append(description)
-
-        if params.long_headlines:
-            for long_headline in params.long_headlines:
-                asset_operations.append(create_text_asset_operation(long_headline, "LONG_HEADLINE"))
-                asset_field_types.append("LONG_HEADLINE")
-                asset_summary["long_headlines"].append(long_headline)
-
-        if params.business_name:
-            asset_operations.append(create_text_asset_operation(params.business_name, "BUSINESS_NAME"))
-            asset_field_types.append("BUSINESS_NAME")
-            asset_summary["business_name"] = params.business_name
-
-        # Execute asset creation
-        asset_response = asset_service.mutate_assets(
-            customer_id=customer_id,
-            operations=asset_operations
-        )
-
-        # Step 2: Link created assets to asset group
-        aga_operations = []
-        for i, result in enumerate(asset_response.results):
-            asset_resource_name = result.resource_name
-            field_type = asset_field_types[i]
-            aga_operations.append(create_asset_group_asset_operation(asset_resource_name, field_type))
-
-        # Execute asset group asset linking
-        aga_response = asset_group_asset_service.mutate_asset_group_assets(
-            customer_id=customer_id,
-            operations=aga_operations
+        # Flatten every asset to create into (field_type, text) pairs
+        assets = (
+            [("HEADLINE", text) for text in params.headlines or []]
+            + [("DESCRIPTION", text) for text in params.descriptions or []]
+            + [("LONG_HEADLINE", text) for text in params.long_headlines or []]
         )
+        if params.business_name:
+            assets.append(("BUSINESS_NAME", params.business_name))
+        # Repeated texts would each cost an asset create and a link; keep first occurrences
+        assets = list(dict.fromkeys(assets))
+
+        data = await _create_text_assets_core(customer_id, params.asset_group_id, assets)
+        n_assets = len(assets)
+        total_created = data["total_created"]
+        asset_summary = data["assets"]
+        failed_assets = data["validation_errors"] + data["failed"]
+
+        # Every asset was rejected
+        if not total_created:
+            if params.response_format == ResponseFormat.JSON:
+                return _dumps({
+                    "success": False,
+                    "asset_group_id": params.asset_group_id,
+                    "total_created": 0,
+                    "failed": data["failed"],
+                    "validation_errors": data["validation_errors"]
+                })
+            return f"❌ **No text assets were created** (asset group {params.asset_group_id})\n\n" + "\n".join(
+                f"- [{failure['field_type']}] {failure['text']}: {failure['error']}" for failure in failed_assets
+            )
 
         # Build response
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = ["✅ **Text assets created and added to asset group successfully!**\n"]
-            lines.append(f"**Asset Group ID**: {params.asset_group_id}")
-            lines.append(f"**Total Assets Created**: {len(asset_operations)}\n")
-
-            if asset_summary["headlines"]:
-                lines.append(f"### Headlines ({len(asset_summary['headlines'])})")
-                for h in asset_summary["headlines"]:
-                    lines.append(f"- {h}")
-                lines.append("")
-
-            if asset_summary["descriptions"]:
-                lines.append(f"### Descriptions ({len(asset_summary['descriptions'])})")
-                for d in asset_summary["descriptions"]:
-                    lines.append(f"- {d}")
-                lines.append("")
+            buf = io.StringIO()
+            if failed_assets:
+                buf.write(f"⚠️ **Created {total_created} of {n_assets} text assets**\n\n")
+            else:
+                buf.write("✅ **Text assets created and added to asset group successfully!**\n\n")
+            buf.write(
+                f"**Asset Group ID**: {params.asset_group_id}\n"
+                f"**Total Assets Created**: {total_created}\n\n"
+            )
 
-            if asset_summary["long_headlines"]:
-                lines.append(f"### Long Headlines ({len(asset_summary['long_headlines'])})")
-                for lh in asset_summary["long_headlines"]:
-                    lines.append(f"- {lh}")
-                lines.append("")
+            for title, texts in (
+                ("Headlines", asset_summary["headlines"]),
+                ("Descriptions", asset_summary["descriptions"]),
+                ("Long Headlines", asset_summary["long_headlines"])
+            ):
+                if texts:
+                    buf.write(f"### {title} ({len(texts)})\n")
+                    buf.writelines(f"- {text}\n" for text in texts)
+                    buf.write("\n")
 
             if asset_summary["business_name"]:
-                lines.append(f"### Business Name\n- {asset_summary['business_name']}\n")
+                buf.write(f"### Business Name\n- {asset_summary['business_name']}\n\n")
 
-            lines.append("**Status**: Assets are pending Google review (usually within 1 business day)")
-            lines.append("\n**Next Steps**:")
-            lines.append("1. Monitor asset approval status with `google_ads_get_asset_performance`")
-            lines.append("2. Remove disapproved assets if any")
-            lines.append("3. Wait 24-48 hours for performance labels to appear")
+            if failed_assets:
+                buf.write(f"### ❌ Failed ({len(failed_assets)})\n")
+                buf.writelines(
+                    f"- [{failure['field_type']}] {failure['text']}: {failure['error']}\n"
+                    for failure in failed_assets
+                )
+                buf.write("\n")
+
+            buf.write(
+                "**Status**: Assets are pending Google review (usually within 1 business day)\n"
+                "\n**Next Steps**:\n"
+                "1. Monitor asset approval status with `google_ads_get_asset_performance`\n"
+                "2. Remove disapproved assets if any\n"
+                "3. Wait 24-48 hours for performance labels to appear"
+            )
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         else:  # JSON
-            return json.dumps({
-                "success": True,
-                "asset_group_id": params.asset_group_id,
-                "total_created": len(asset_operations),
-                "assets": asset_summary,
-                "asset_resource_names": [r.resource_name for r in asset_response.results],
-                "asset_group_asset_resource_names": [r.resource_name for r in aga_response.results]
-            }, indent=2)
+            return _dumps({"success": not failed_assets, **data})
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -3836,31 +5754,53 @@ async def google_ads_remove_asset_from_group(params: RemoveAssetFromGroupInput)
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
+        client = _get_google_ads_client(use_proto_plus=False)
 
-        asset_group_asset_service = client.get_service("AssetGroupAssetService")
+        asset_group_asset_service = _get_async_service("AssetGroupAssetService")
 
+        operation_type = type(client.get_type("AssetGroupAssetOperation"))
+        aga_prefix = f"customers/{customer_id}/assetGroupAssets/"
         operations = []
         for aga_id in params.asset_group_asset_ids:
-            operation = client.get_type("AssetGroupAssetOperation")
+            operation = operation_type()
             # For remove, we need the full resource name
             # Expected format: customers/{customer_id}/assetGroupAssets/{asset_group_id}~{asset_id}~{field_type}
             if aga_id.startswith("customers/"):
                 operation.remove = aga_id
             else:
                 # If user provided partial ID, construct full resource name
-                operation.remove = f"customers/{customer_id}/assetGroupAssets/{aga_id}"
+                operation.remove = aga_prefix + aga_id
             operations.append(operation)
 
-        # Execute removal
-        response = asset_group_asset_service.mutate_asset_group_assets(
-            customer_id=customer_id,
-            operations=operations
-        )
+        # Awaited over the async transport so the event loop stays free; partial
+        # failure lets valid removals through when an ID is stale or malformed
+        async with _customer_semaphore(customer_id):
+            response = await _call_with_rate_limit_async(
+                len(operations),
+                asset_group_asset_service.mutate_asset_group_assets,
+                request={"customer_id": customer_id, "operations": operations, "partial_failure": True}
+            )
+        errors = _partial_failure_errors(response)
+
+        removed_count = len(operations) - sum(1 for i in range(len(operations)) if i in errors)
+        if removed_count:
+            _query_cache.invalidate(customer_id)
+
+        if errors:
+            failed_list = "\n".join(
+                f"- {params.asset_group_asset_ids[i]}: {message}" if 0 <= i < len(operations) else f"- {message}"
+                for i, message in sorted(errors.items())
+            )
+            return f"""{"⚠️" if removed_count else "❌"} **Removed {removed_count} of {len(operations)} asset(s) from asset group**
+
+**Failed:**
+{failed_list}
+
+**Note**: Removed assets remain in your account library and can be reused in other campaigns."""
 
         return f"""✅ **Removed {len(params.asset_group_asset_ids)} asset(s) from asset group successfully!**
 
-**Removed Assets**: {len(response.results)}
+**Removed Assets**: {removed_count}
 
 The assets have been unlinked from the asset group. The campaign will stop using them immediately.
 
@@ -3894,6 +5834,7 @@ async def google_ads_update_asset_group_assets(params: UpdateAssetGroupAssetsInp
             - add_headlines (Optional[List[str]]): New headlines to add
             - add_descriptions (Optional[List[str]]): New descriptions to add
             - remove_asset_group_asset_ids (Optional[List[str]]): Asset group asset IDs to remove
+            - atomic (bool): All-or-nothing single request (default), or concurrent independent add/remove
             - response_format (ResponseFormat): Output format
 
     Returns:
@@ -3904,8 +5845,10 @@ async def google_ads_update_asset_group_assets(params: UpdateAssetGroupAssetsInp
         - "Swap out 3 old headlines and add 3 new ones"
 
     Note:
-        - Both add and remove operations are executed in a single API call
-        - If one operation fails, the entire batch fails (atomic operation)
+        - Asset creation, linking and removal are executed in a single Mutate request
+        - If one operation fails, the entire batch fails (atomic operation); set
+          atomic=false to let the add and remove halves succeed independently
+          (rejected new texts are then reported individually)
         - Use `google_ads_get_asset_performance` to get asset IDs for removal
     """
     try:
@@ -3918,60 +5861,134 @@ async def google_ads_update_asset_group_assets(params: UpdateAssetGroupAssetsInp
         if not has_add and not has_remove:
             return "❌ Error: You must specify at least one operation (add or remove assets)."
 
-        results = []
+        client = _get_google_ads_client(use_proto_plus=False)
+
+        assets = [("HEADLINE", text) for text in params.add_headlines or []]
+        assets += [("DESCRIPTION", text) for text in params.add_descriptions or []]
+        assets = list(dict.fromkeys(assets))  # Drop repeated texts
+
+        # Non-atomic add/remove run as two independent requests
+        concurrent = not params.atomic and has_add and has_remove
 
-        # Step 1: Add new assets if specified
-        if has_add:
-            add_params = CreateTextAssetsInput(
-                customer_id=params.customer_id,
-                asset_group_id=params.asset_group_id,
-                headlines=params.add_headlines,
-                descriptions=params.add_descriptions,
-                response_format=ResponseFormat.JSON  # Get JSON for parsing
+        # An over-long text would fail the whole atomic request; reject it before sending
+        if not concurrent:
+            assets, validation_errors = _validate_text_assets(assets)
+            if validation_errors:
+                return "❌ Error: Text assets exceed Google Ads length limits (nothing was changed):\n" + "\n".join(
+                    f"- [{failure['field_type']}] {failure['text']}: {failure['error']}" for failure in validation_errors
+                )
+
+        add_operations = (
+            [] if concurrent
+            else _text_asset_mutate_operations(client, customer_id, params.asset_group_id, assets)
+        )
+        mutate_operation_type = type(client.get_type("MutateOperation"))
+        aga_prefix = f"customers/{customer_id}/assetGroupAssets/"
+        remove_operations = []
+        for aga_id in params.remove_asset_group_asset_ids or []:
+            mutate_op = mutate_operation_type()
+            if aga_id.startswith("customers/"):
+                mutate_op.asset_group_asset_operation.remove = aga_id
+            else:
+                mutate_op.asset_group_asset_operation.remove = aga_prefix + aga_id
+            remove_operations.append(mutate_op)
+
+        add_error = remove_error = None
+        if not concurrent:
+            # New assets, their links and the removals all go in one atomic request;
+            # responses follow operation order: asset creates, link creates, removals
+            response = await _mutate_async(customer_id, add_operations + remove_operations)
+            responses = response.mutate_operation_responses
+            add_responses = responses[:len(add_operations)]
+            remove_responses = responses[len(add_operations):]
+        else:
+            # Independent halves: overlap the two round trips instead of running them
+            # back to back; the add half reuses the create tool's core (per-asset errors)
+            add_outcome, remove_outcome = await asyncio.gather(
+                _create_text_assets_core(customer_id, params.asset_group_id, assets),
+                _mutate_async(customer_id, remove_operations),
+                return_exceptions=True
             )
-            add_result = await google_ads_create_text_assets(add_params)
-            add_data = json.loads(add_result)
-            results.append(("add", add_data))
+            if isinstance(add_outcome, Exception):
+                add_error = _handle_google_ads_error(add_outcome)
+            if isinstance(remove_outcome, Exception):
+                remove_error, remove_responses = _handle_google_ads_error(remove_outcome), []
+            else:
+                remove_responses = remove_outcome.mutate_operation_responses
+
+        if add_error is None or remove_error is None:
+            _query_cache.invalidate(customer_id)
 
-        # Step 2: Remove old assets if specified
+        n_assets = len(assets)
+        results = []
+        if concurrent:
+            results.append(("add", {"error": add_error} if add_error else add_outcome))
+        elif has_add:
+            results.append(("add", {
+                "total_created": n_assets,
+                "assets": _text_asset_summary(assets),
+                "asset_resource_names": [r.asset_result.resource_name for r in add_responses[:n_assets]],
+                "asset_group_asset_resource_names": [
+                    r.asset_group_asset_result.resource_name for r in add_responses[n_assets:]
+                ]
+            }))
         if has_remove:
-            remove_params = RemoveAssetFromGroupInput(
-                customer_id=params.customer_id,
-                asset_group_asset_ids=params.remove_asset_group_asset_ids
-            )
-            remove_result = await google_ads_remove_asset_from_group(remove_params)
-            results.append(("remove", remove_result))
+            removed = [r.asset_group_asset_result.resource_name for r in remove_responses]
+            results.append(("remove", {"error": remove_error} if remove_error else {
+                "total_removed": len(removed),
+                "asset_group_asset_resource_names": removed
+            }))
+
+        if add_error and remove_error:
+            return f"❌ Asset group update failed.\n\n**Add**: {add_error}\n\n**Remove**: {remove_error}"
+
+        partial = bool(add_error or remove_error or any(
+            data.get("failed") or data.get("validation_errors") for _, data in results
+        ))
 
         # Build response
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = ["✅ **Asset group updated successfully!**\n"]
-            lines.append(f"**Asset Group ID**: {params.asset_group_id}\n")
+            buf = io.StringIO()
+            if partial:
+                buf.write("⚠️ **Asset group partially updated**\n\n")
+            else:
+                buf.write("✅ **Asset group updated successfully!**\n\n")
+            buf.write(f"**Asset Group ID**: {params.asset_group_id}\n\n")
 
             for operation_type, data in results:
-                if operation_type == "add":
-                    lines.append(f"### Added Assets ({data['total_created']})")
+                if "error" in data:
+                    buf.write(f"### ❌ {'Add' if operation_type == 'add' else 'Remove'} Failed\n{data['error']}\n\n")
+                elif operation_type == "add":
+                    buf.write(f"### Added Assets ({data['total_created']})\n")
                     if data['assets'].get('headlines'):
-                        lines.append(f"**Headlines**: {', '.join(data['assets']['headlines'])}")
+                        buf.write(f"**Headlines**: {', '.join(data['assets']['headlines'])}\n")
                     if data['assets'].get('descriptions'):
-                        lines.append(f"**Descriptions**: {', '.join(data['assets']['descriptions'])}")
-                    lines.append("")
+                        buf.write(f"**Descriptions**: {', '.join(data['assets']['descriptions'])}\n")
+                    buf.writelines(
+                        f"❌ [{failure['field_type']}] {failure['text']}: {failure['error']}\n"
+                        for failure in data.get('validation_errors', []) + data.get('failed', [])
+                    )
+                    buf.write("\n")
                 elif operation_type == "remove":
-                    lines.append(f"### Removed Assets")
-                    lines.append(data)
-                    lines.append("")
+                    buf.write(
+                        f"### Removed Assets ({data['total_removed']})\n"
+                        "Unlinked from the asset group; the assets remain in your account library.\n\n"
+                    )
 
-            lines.append("**Next Steps**:")
-            lines.append("1. Verify new assets are approved with `google_ads_get_asset_performance`")
-            lines.append("2. Monitor campaign performance for impact")
+            buf.write(
+                "**Next Steps**:\n"
+                "1. Verify new assets are approved with `google_ads_get_asset_performance`\n"
+                "2. Monitor campaign performance for impact"
+            )
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         else:  # JSON
-            return json.dumps({
-                "success": True,
+            return _dumps({
+                "success": not partial,
                 "asset_group_id": params.asset_group_id,
                 "operations": results
-            }, indent=2)
+            })
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -4003,6 +6020,7 @@ async def google_ads_list_negative_keywords(params: ListNegativeKeywordsInput) -
             - customer_id (str): 10-digit customer ID
             - campaign_id (Optional[str]): Filter by campaign ID
             - ad_group_id (Optional[str]): Filter by ad group ID
+            - level (Optional[NegativeKeywordLevel]): Only query one level (default: both)
             - limit (int): Maximum results to return (default: 100)
             - response_format (ResponseFormat): Output format
 
@@ -4013,109 +6031,146 @@ async def google_ads_list_negative_keywords(params: ListNegativeKeywordsInput) -
         - "List all negative keywords for account 1234567890"
         - "Show negative keywords for campaign 123456"
         - "Get ad group level negatives for ad group 789"
+        - "List only campaign-level negatives" (level=CAMPAIGN, one query instead of two)
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
+        cached_error = _cached_account_error(customer_id)
+        if cached_error:
+            return cached_error
         client = _get_google_ads_client()
 
+        if params.level == NegativeKeywordLevel.CAMPAIGN and params.ad_group_id:
+            return "❌ Error: ad_group_id only applies to AD_GROUP level negatives"
+
+        # Rendered responses are cached per parameter set; the add/remove tools
+        # invalidate the account's entries
+        cache_key = (
+            customer_id, "negative_keywords", params.campaign_id, params.ad_group_id,
+            params.level, params.limit, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         results = {"campaign_level": [], "ad_group_level": []}
 
+        query_values = {
+            "campaign_id": _numeric_id(params.campaign_id, "Campaign ID") if params.campaign_id else "",
+            "ad_group_id": _numeric_id(params.ad_group_id, "Ad group ID") if params.ad_group_id else "",
+            "limit": int(params.limit)
+        }
+
         # Query campaign-level negative keywords
-        if not params.ad_group_id:  # Skip if filtering by ad group only
-            campaign_query = f"""
-                SELECT
-                    campaign_criterion.criterion_id,
-                    campaign_criterion.keyword.text,
-                    campaign_criterion.keyword.match_type,
-                    campaign_criterion.negative,
-                    campaign.id,
-                    campaign.name
-                FROM campaign_criterion
-                WHERE campaign_criterion.type = 'KEYWORD'
-                AND campaign_criterion.negative = TRUE
-                {"AND campaign.id = " + params.campaign_id if params.campaign_id else ""}
-                LIMIT {params.limit}
-            """
-            campaign_results = _execute_query(client, customer_id, campaign_query)
-
-            for row in campaign_results:
-                results["campaign_level"].append({
-                    "criterion_id": str(row.campaign_criterion.criterion_id),
-                    "keyword": row.campaign_criterion.keyword.text,
-                    "match_type": row.campaign_criterion.keyword.match_type.name,
-                    "campaign_id": str(row.campaign.id),
-                    "campaign_name": row.campaign.name
-                })
+        campaign_query = None
+        # Skip if filtering by ad group or only ad group level was requested
+        if not params.ad_group_id and params.level != NegativeKeywordLevel.AD_GROUP:
+            campaign_query = _campaign_negatives_query_template(
+                bool(params.campaign_id)
+            ).format_map(query_values)
 
         # Query ad group-level negative keywords
-        ad_group_query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.negative,
-                ad_group.id,
-                ad_group.name,
-                campaign.id,
-                campaign.name
-            FROM ad_group_criterion
-            WHERE ad_group_criterion.type = 'KEYWORD'
-            AND ad_group_criterion.negative = TRUE
-            {"AND campaign.id = " + params.campaign_id if params.campaign_id else ""}
-            {"AND ad_group.id = " + params.ad_group_id if params.ad_group_id else ""}
-            LIMIT {params.limit}
-        """
-        ad_group_results = _execute_query(client, customer_id, ad_group_query)
-
-        for row in ad_group_results:
-            results["ad_group_level"].append({
-                "criterion_id": str(row.ad_group_criterion.criterion_id),
-                "keyword": row.ad_group_criterion.keyword.text,
-                "match_type": row.ad_group_criterion.keyword.match_type.name,
-                "ad_group_id": str(row.ad_group.id),
-                "ad_group_name": row.ad_group.name,
-                "campaign_id": str(row.campaign.id),
-                "campaign_name": row.campaign.name
-            })
+        ad_group_query = None
+        if params.level != NegativeKeywordLevel.CAMPAIGN:
+            ad_group_query = _ad_group_negatives_query_template(
+                bool(params.campaign_id), bool(params.ad_group_id)
+            ).format_map(query_values)
+
+        # Rows are converted as their stream batches arrive (in worker threads)
+        match_type_names = _pb_enum_names(client.get_type("KeywordInfo")._pb.DESCRIPTOR, "match_type")
+
+        def _campaign_negatives() -> List[Dict[str, str]]:
+            negatives = []
+            for row in _stream_query(client, customer_id, campaign_query):
+                pb = row._pb
+                criterion = pb.campaign_criterion
+                negatives.append({
+                    "criterion_id": str(criterion.criterion_id),
+                    "keyword": criterion.keyword.text,
+                    "match_type": match_type_names.get(criterion.keyword.match_type, "UNKNOWN"),
+                    "campaign_id": str(pb.campaign.id),
+                    "campaign_name": pb.campaign.name
+                })
+            return negatives
+
+        def _ad_group_negatives() -> List[Dict[str, str]]:
+            negatives = []
+            for row in _stream_query(client, customer_id, ad_group_query):
+                pb = row._pb
+                criterion = pb.ad_group_criterion
+                negatives.append({
+                    "criterion_id": str(criterion.criterion_id),
+                    "keyword": criterion.keyword.text,
+                    "match_type": match_type_names.get(criterion.keyword.match_type, "UNKNOWN"),
+                    "ad_group_id": str(pb.ad_group.id),
+                    "ad_group_name": pb.ad_group.name,
+                    "campaign_id": str(pb.campaign.id),
+                    "campaign_name": pb.campaign.name
+                })
+            return negatives
+
+        async def _run(query: Optional[str], convert: Any) -> List[Dict[str, str]]:
+            return await asyncio.to_thread(convert) if query else []
+
+        # The two levels are independent: overlap their round trips
+        results["campaign_level"], results["ad_group_level"] = await asyncio.gather(
+            _run(campaign_query, _campaign_negatives),
+            _run(ad_group_query, _ad_group_negatives)
+        )
 
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
             total = len(results["campaign_level"]) + len(results["ad_group_level"])
-            lines = [f"# Negative Keywords\n", f"**Total**: {total} negative keywords found\n"]
-
-            if results["campaign_level"]:
-                lines.append(f"## Campaign-Level Negatives ({len(results['campaign_level'])})\n")
-                lines.append("| Keyword | Match Type | Campaign | Criterion ID |")
-                lines.append("|---------|------------|----------|--------------|")
-                for nk in results["campaign_level"]:
-                    lines.append(f"| {nk['keyword']} | {nk['match_type']} | {nk['campaign_name']} | {nk['criterion_id']} |")
-                lines.append("")
-
-            if results["ad_group_level"]:
-                lines.append(f"## Ad Group-Level Negatives ({len(results['ad_group_level'])})\n")
-                lines.append("| Keyword | Match Type | Ad Group | Campaign | Criterion ID |")
-                lines.append("|---------|------------|----------|----------|--------------|")
-                for nk in results["ad_group_level"]:
-                    lines.append(f"| {nk['keyword']} | {nk['match_type']} | {nk['ad_group_name']} | {nk['campaign_name']} | {nk['criterion_id']} |")
-                lines.append("")
 
-            if total == 0:
-                lines.append("No negative keywords found. Consider adding negative keywords to:\n")
-                lines.append("- Block irrelevant search queries")
-                lines.append("- Reduce wasted ad spend")
-                lines.append("- Improve campaign relevance")
+            # Lines are produced lazily so rows past the size limit are never formatted
+            def _lines() -> Iterator[str]:
+                yield "# Negative Keywords\n"
+                yield f"**Total**: {total} negative keywords found\n"
+
+                if results["campaign_level"]:
+                    yield f"## Campaign-Level Negatives ({len(results['campaign_level'])})\n"
+                    yield "| Keyword | Match Type | Campaign | Criterion ID |"
+                    yield "|---------|------------|----------|--------------|"
+                    yield from (
+                        f"| {nk['keyword']} | {nk['match_type']} | {nk['campaign_name']} | {nk['criterion_id']} |"
+                        for nk in results["campaign_level"]
+                    )
+                    yield ""
+
+                if results["ad_group_level"]:
+                    yield f"## Ad Group-Level Negatives ({len(results['ad_group_level'])})\n"
+                    yield "| Keyword | Match Type | Ad Group | Campaign | Criterion ID |"
+                    yield "|---------|------------|----------|----------|--------------|"
+                    yield from (
+                        f"| {nk['keyword']} | {nk['match_type']} | {nk['ad_group_name']} | {nk['campaign_name']} | {nk['criterion_id']} |"
+                        for nk in results["ad_group_level"]
+                    )
+                    yield ""
+
+                if total == 0:
+                    yield from (
+                        "No negative keywords found. Consider adding negative keywords to:\n",
+                        "- Block irrelevant search queries",
+                        "- Reduce wasted ad spend",
+                        "- Improve campaign relevance"
+                    )
 
-            return _check_and_truncate("\n".join(lines))
+            response = _bounded_join(_lines())
 
         else:  # JSON
-            return json.dumps({
+            response = _dumps({
                 "total": len(results["campaign_level"]) + len(results["ad_group_level"]),
                 "campaign_level": results["campaign_level"],
                 "ad_group_level": results["ad_group_level"]
-            }, indent=2)
+            })
+
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response)
+        return response
 
     except Exception as e:
-        return _handle_google_ads_error(e)
+        return _handle_google_ads_error(e, params.customer_id)
 
 
 @mcp.tool(
@@ -4157,10 +6212,16 @@ async def google_ads_add_negative_keywords(params: AddNegativeKeywordsInput) ->
         - PHRASE match (default) blocks queries containing the phrase
         - EXACT match only blocks exact query matches
         - BROAD match blocks queries with all terms in any order
+        - Keywords are sent in concurrent requests of 50; a rejected request
+          is reported without undoing the others
+        - Duplicate keywords (ignoring case and spacing) are added once
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
+        cached_error = _cached_account_error(customer_id)
+        if cached_error:
+            return cached_error
+        client = _get_google_ads_client(use_proto_plus=False)
 
         # Validate required IDs based on level
         if params.level == NegativeKeywordLevel.CAMPAIGN:
@@ -4170,48 +6231,70 @@ async def google_ads_add_negative_keywords(params: AddNegativeKeywordsInput) ->
             if not params.ad_group_id:
                 return "❌ Error: ad_group_id is required when level is AD_GROUP"
 
+        # Keyword text is case-insensitive, so repeats differing only in case or
+        # spacing would just produce duplicate operations; first spelling wins
+        unique_keywords: Dict[str, str] = {}
+        for keyword in params.keywords:
+            unique_keywords.setdefault(" ".join(keyword.split()).lower(), keyword.strip())
+        keywords = list(unique_keywords.values())
+        duplicates_removed = len(params.keywords) - len(keywords)
+
         operations = []
-        match_type_enum = getattr(client.enums.KeywordMatchTypeEnum, params.match_type.value)
+        match_type_enum = _enum_map("KeywordMatchTypeEnum")[params.match_type.value]
 
+        # Operation class and parent resource name are resolved once, not per keyword
         if params.level == NegativeKeywordLevel.CAMPAIGN:
-            campaign_criterion_service = client.get_service("CampaignCriterionService")
+            campaign_criterion_service = _get_service("CampaignCriterionService")
+            operation_type = type(client.get_type("CampaignCriterionOperation"))
+            campaign = f"customers/{customer_id}/campaigns/{params.campaign_id}"
 
-            for keyword in params.keywords:
-                operation = client.get_type("CampaignCriterionOperation")
+            for keyword in keywords:
+                operation = operation_type()
                 criterion = operation.create
 
-                criterion.campaign = f"customers/{customer_id}/campaigns/{params.campaign_id}"
+                criterion.campaign = campaign
                 criterion.negative = True
                 criterion.keyword.text = keyword
                 criterion.keyword.match_type = match_type_enum
 
                 operations.append(operation)
 
-            # Execute
-            response = campaign_criterion_service.mutate_campaign_criteria(
-                customer_id=customer_id,
-                operations=operations
-            )
+            rpc = campaign_criterion_service.mutate_campaign_criteria
 
         else:  # AD_GROUP level
-            ad_group_criterion_service = client.get_service("AdGroupCriterionService")
+            ad_group_criterion_service = _get_service("AdGroupCriterionService")
+            operation_type = type(client.get_type("AdGroupCriterionOperation"))
+            ad_group = f"customers/{customer_id}/adGroups/{params.ad_group_id}"
 
-            for keyword in params.keywords:
-                operation = client.get_type("AdGroupCriterionOperation")
+            for keyword in keywords:
+                operation = operation_type()
                 criterion = operation.create
 
-                criterion.ad_group = f"customers/{customer_id}/adGroups/{params.ad_group_id}"
+                criterion.ad_group = ad_group
                 criterion.negative = True
                 criterion.keyword.text = keyword
                 criterion.keyword.match_type = match_type_enum
 
                 operations.append(operation)
 
-            # Execute
-            response = ad_group_criterion_service.mutate_ad_group_criteria(
-                customer_id=customer_id,
-                operations=operations
-            )
+            rpc = ad_group_criterion_service.mutate_ad_group_criteria
+
+        # Execute in concurrent chunks; each chunk succeeds or fails as a whole
+        added = []
+        resource_names = []
+        failed = []
+        for start, end, outcome in await _mutate_in_chunks(rpc, customer_id, operations):
+            if isinstance(outcome, Exception):
+                failed.append((keywords[start:end], outcome))
+            else:
+                added.extend(keywords[start:end])
+                resource_names.extend(r.resource_name for r in outcome.results)
+
+        if not added:
+            raise failed[0][1]
+        _query_cache.invalidate(customer_id)
+        for _, error in failed:
+            _handle_google_ads_error(error, customer_id)
 
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
@@ -4219,15 +6302,22 @@ async def google_ads_add_negative_keywords(params: AddNegativeKeywordsInput) ->
             entity_id = params.campaign_id if params.level == NegativeKeywordLevel.CAMPAIGN else params.ad_group_id
 
             lines = [
-                f"✅ **Added {len(params.keywords)} negative keywords successfully!**\n",
+                f"⚠️ **Added {len(added)} of {len(keywords)} negative keywords**\n" if failed
+                else f"✅ **Added {len(keywords)} negative keywords successfully!**\n",
                 f"**Level**: {level_name.title()}",
                 f"**{level_name.title()} ID**: {entity_id}",
                 f"**Match Type**: {params.match_type.value}\n",
-                "### Keywords Added:",
             ]
 
-            for kw in params.keywords:
-                lines.append(f"- {kw}")
+            if duplicates_removed:
+                lines.append(f"ℹ️ Skipped {duplicates_removed} duplicate keyword(s)\n")
+
+            lines.append("### Keywords Added:")
+
+            lines.extend(f"- {kw}" for kw in added)
+
+            for chunk_keywords, error in failed:
+                lines.append(f"\n### ❌ Not Added: {', '.join(chunk_keywords)}\n{_format_google_ads_error(error)}")
 
             lines.append("\n**Effect**: Ads will no longer show for searches containing these terms.")
             lines.append("\n**Tip**: Use `google_ads_get_search_terms` to find more irrelevant queries to block.")
@@ -4235,19 +6325,24 @@ async def google_ads_add_negative_keywords(params: AddNegativeKeywordsInput) ->
             return "\n".join(lines)
 
         else:  # JSON
-            return json.dumps({
-                "success": True,
+            return _dumps({
+                "success": not failed,
                 "level": params.level.value,
                 "campaign_id": params.campaign_id,
                 "ad_group_id": params.ad_group_id,
                 "match_type": params.match_type.value,
-                "keywords_added": params.keywords,
-                "count": len(params.keywords),
-                "resource_names": [r.resource_name for r in response.results]
-            }, indent=2)
+                "keywords_added": added,
+                "count": len(added),
+                "duplicates_removed": duplicates_removed,
+                "resource_names": resource_names,
+                "failed": [
+                    {"keywords": chunk_keywords, "error": _format_google_ads_error(error)}
+                    for chunk_keywords, error in failed
+                ]
+            })
 
     except Exception as e:
-        return _handle_google_ads_error(e)
+        return _handle_google_ads_error(e, params.customer_id)
 
 
 @mcp.tool(
@@ -4287,49 +6382,73 @@ async def google_ads_remove_negative_keywords(params: RemoveNegativeKeywordsInpu
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
+        cached_error = _cached_account_error(customer_id)
+        if cached_error:
+            return cached_error
+        client = _get_google_ads_client(use_proto_plus=False)
 
         # Validate required IDs
         if params.level == NegativeKeywordLevel.CAMPAIGN:
             if not params.campaign_id:
                 return "❌ Error: campaign_id is required when level is CAMPAIGN"
 
-            campaign_criterion_service = client.get_service("CampaignCriterionService")
+            campaign_criterion_service = _get_service("CampaignCriterionService")
+            operation_type = type(client.get_type("CampaignCriterionOperation"))
+            # Same format as campaign_criterion_path(), built once for all IDs
+            criterion_prefix = f"customers/{customer_id}/campaignCriteria/{params.campaign_id}~"
             operations = []
 
             for criterion_id in params.criterion_ids:
-                operation = client.get_type("CampaignCriterionOperation")
-                operation.remove = campaign_criterion_service.campaign_criterion_path(
-                    customer_id, params.campaign_id, criterion_id
-                )
+                operation = operation_type()
+                operation.remove = criterion_prefix + criterion_id
                 operations.append(operation)
 
-            response = campaign_criterion_service.mutate_campaign_criteria(
-                customer_id=customer_id,
-                operations=operations
-            )
+            rpc = campaign_criterion_service.mutate_campaign_criteria
 
         else:  # AD_GROUP level
             if not params.ad_group_id:
                 return "❌ Error: ad_group_id is required when level is AD_GROUP"
 
-            ad_group_criterion_service = client.get_service("AdGroupCriterionService")
+            ad_group_criterion_service = _get_service("AdGroupCriterionService")
+            operation_type = type(client.get_type("AdGroupCriterionOperation"))
+            # Same format as ad_group_criterion_path(), built once for all IDs
+            criterion_prefix = f"customers/{customer_id}/adGroupCriteria/{params.ad_group_id}~"
             operations = []
 
             for criterion_id in params.criterion_ids:
-                operation = client.get_type("AdGroupCriterionOperation")
-                operation.remove = ad_group_criterion_service.ad_group_criterion_path(
-                    customer_id, params.ad_group_id, criterion_id
-                )
+                operation = operation_type()
+                operation.remove = criterion_prefix + criterion_id
                 operations.append(operation)
 
-            response = ad_group_criterion_service.mutate_ad_group_criteria(
-                customer_id=customer_id,
-                operations=operations
-            )
+            rpc = ad_group_criterion_service.mutate_ad_group_criteria
+
+        # Execute in concurrent chunks; each chunk succeeds or fails as a whole
+        removed = []
+        failed = []
+        for start, end, outcome in await _mutate_in_chunks(rpc, customer_id, operations):
+            if isinstance(outcome, Exception):
+                failed.append((params.criterion_ids[start:end], outcome))
+            else:
+                removed.extend(params.criterion_ids[start:end])
+
+        if not removed:
+            raise failed[0][1]
+        _query_cache.invalidate(customer_id)
 
         level_name = "campaign" if params.level == NegativeKeywordLevel.CAMPAIGN else "ad group"
 
+        if failed:
+            failed_list = "\n".join(
+                f"- {', '.join(criterion_ids)}: {_handle_google_ads_error(error)}" for criterion_ids, error in failed
+            )
+            return f"""⚠️ **Removed {len(removed)} of {len(params.criterion_ids)} negative keyword(s)**
+
+**Level**: {level_name.title()}
+**Removed Criterion IDs**: {', '.join(removed)}
+
+**Not Removed:**
+{failed_list}"""
+
         return f"""✅ **Removed {len(params.criterion_ids)} negative keyword(s) successfully!**
 
 **Level**: {level_name.title()}
@@ -4340,13 +6459,58 @@ Your ads may now show for searches that were previously blocked by these negativ
 **Tip**: Monitor search terms report to see if this increases irrelevant traffic."""
 
     except Exception as e:
-        return _handle_google_ads_error(e)
+        return _handle_google_ads_error(e, params.customer_id)
 
 
 # ============================================================================
 # BUDGET MANAGEMENT TOOLS
 # ============================================================================
 
+async def _update_budget_by_resource_name(client: GoogleAdsClient, customer_id: str, params: UpdateCampaignBudgetInput) -> str:
+    """
+    Update a budget whose resource name the caller supplied, without the lookup query.
+
+    The budget must belong to customer_id. Without the lookup its link to
+    params.campaign_id is not verified, so the report names only the budget.
+    """
+    budget_customer_id = params.budget_resource_name.split("/")[1]
+    if budget_customer_id != customer_id:
+        raise ValueError(
+            f"Budget {params.budget_resource_name} belongs to customer {budget_customer_id}, not {customer_id}"
+        )
+
+    budget_operation = client.get_type("CampaignBudgetOperation")
+    budget_operation.update.resource_name = params.budget_resource_name
+    budget_operation.update.amount_micros = params.new_budget_micros
+    budget_operation.update_mask.paths.append("amount_micros")
+
+    await _call_with_rate_limit_async(
+        1,
+        _get_async_service("CampaignBudgetService").mutate_campaign_budgets,
+        customer_id=customer_id,
+        operations=[budget_operation]
+    )
+
+    _query_cache.invalidate(customer_id)
+
+    new_amount = params.new_budget_micros / 1_000_000
+
+    if params.response_format == ResponseFormat.MARKDOWN:
+        return f"""✅ **Campaign budget updated successfully!**
+
+**Budget**: {params.budget_resource_name}
+**New Budget**: ${new_amount:,.2f}/day
+
+**Note**: The new budget takes effect immediately. Google may spend up to 2x the daily budget on high-traffic days, but won't exceed monthly budget."""
+
+    return _dumps({
+        "success": True,
+        "budget_resource_name": params.budget_resource_name,
+        "new_budget_micros": params.new_budget_micros,
+        "new_budget_dollars": new_amount
+    })
+
+
 @mcp.tool(
     name="google_ads_update_campaign_budget",
     annotations={
@@ -4369,6 +6533,7 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
             - customer_id (str): 10-digit customer ID
             - campaign_id (str): Campaign ID
             - new_budget_micros (int): New daily budget in micros (1000000 = $1)
+            - budget_resource_name (Optional[str]): Budget resource name, skips the lookup query
             - response_format (ResponseFormat): Output format
 
     Returns:
@@ -4378,6 +6543,7 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
         - "Set campaign 123456 budget to $50/day" (new_budget_micros=50000000)
         - "Increase budget to $100 daily" (new_budget_micros=100000000)
         - "Reduce budget to $25/day" (new_budget_micros=25000000)
+        - "Set budget customers/1234567890/campaignBudgets/555 to $40/day" (one API call instead of two)
 
     Note:
         - Budget is in micros: $1 = 1,000,000 micros
@@ -4386,20 +6552,24 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
+        cached_error = _cached_account_error(customer_id)
+        if cached_error:
+            return cached_error
         client = _get_google_ads_client()
 
+        if params.budget_resource_name:
+            return await _update_budget_by_resource_name(client, customer_id, params)
+
         # First, get the current campaign budget resource name
         query = f"""
             SELECT
-                campaign.id,
                 campaign.name,
                 campaign.campaign_budget,
-                campaign_budget.amount_micros,
-                campaign_budget.id
+                campaign_budget.amount_micros
             FROM campaign
             WHERE campaign.id = {params.campaign_id}
         """
-        results = _execute_query(client, customer_id, query)
+        results = await asyncio.to_thread(_execute_query, client, customer_id, query)
 
         if not results:
             return f"❌ Error: Campaign {params.campaign_id} not found"
@@ -4410,7 +6580,7 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
         campaign_name = row.campaign.name
 
         # Update the budget
-        campaign_budget_service = client.get_service("CampaignBudgetService")
+        campaign_budget_service = _get_async_service("CampaignBudgetService")
 
         budget_operation = client.get_type("CampaignBudgetOperation")
         budget = budget_operation.update
@@ -4422,11 +6592,15 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
         budget_operation.update_mask.paths.append("amount_micros")
 
         # Execute update
-        response = campaign_budget_service.mutate_campaign_budgets(
+        response = await _call_with_rate_limit_async(
+            1,
+            campaign_budget_service.mutate_campaign_budgets,
             customer_id=customer_id,
             operations=[budget_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         # Format response
         old_amount = old_budget_micros / 1_000_000
         new_amount = params.new_budget_micros / 1_000_000
@@ -4449,7 +6623,7 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
 **Note**: The new budget takes effect immediately. Google may spend up to 2x the daily budget on high-traffic days, but won't exceed monthly budget."""
 
         else:  # JSON
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "campaign_id": params.campaign_id,
                 "campaign_name": campaign_name,
@@ -4459,10 +6633,10 @@ async def google_ads_update_campaign_budget(params: UpdateCampaignBudgetInput) -
                 "new_budget_dollars": new_amount,
                 "change_dollars": change,
                 "change_percent": change_pct
-            }, indent=2)
+            })
 
     except Exception as e:
-        return _handle_google_ads_error(e)
+        return _handle_google_ads_error(e, params.customer_id)
 
 
 @mcp.tool(
@@ -4505,135 +6679,143 @@ async def google_ads_get_budget_utilization(params: GetBudgetUtilizationInput) -
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
+        cached_error = _cached_account_error(customer_id)
+        if cached_error:
+            return cached_error
         client = _get_google_ads_client()
 
         # Build query (custom dates take precedence over preset)
         date_filter = _format_date_range(params.date_range, params.since, params.until)
-        campaign_filter = ""
+        # Long campaign ID lists are split into shards queried concurrently,
+        # keeping each IN clause well below the API's filter value limit
+        campaign_filters = [""]
         if params.campaign_ids:
-            ids = ", ".join(params.campaign_ids)
-            campaign_filter = f"AND campaign.id IN ({ids})"
+            ids = [_numeric_id(campaign_id, "Campaign ID") for campaign_id in params.campaign_ids]
+            campaign_filters = [
+                f"AND campaign.id IN ({', '.join(ids[start:start + GAQL_IN_SHARD_SIZE])})"
+                for start in range(0, len(ids), GAQL_IN_SHARD_SIZE)
+            ]
 
-        query = f"""
+        queries = [
+            f"""
             SELECT
                 campaign.id,
                 campaign.name,
                 campaign.status,
                 campaign_budget.amount_micros,
-                campaign_budget.type,
                 metrics.cost_micros
             FROM campaign
             WHERE campaign.status != 'REMOVED'
             AND {date_filter}
             {campaign_filter}
         """
+            for campaign_filter in campaign_filters
+        ]
 
-        results = _execute_query(client, customer_id, query)
+        # Without segments.date in SELECT the API returns one row per campaign
+        # with cost summed over the range, so the day count comes from the range
+        days = _date_range_days(params.date_range, params.since, params.until)
+        status_names = _pb_enum_names(client.get_type("Campaign")._pb.DESCRIPTOR, "status")
+
+        def _utilization(query: str) -> Tuple[List[Dict[str, Any]], int, float]:
+            # Account totals accumulate in the same pass
+            utilization_data = []
+            total_budget_micros = total_spend_micros = 0
+            for row in _stream_query(client, customer_id, query):
+                pb = row._pb
+                total_cost_micros = pb.metrics.cost_micros
+                avg_daily_spend = total_cost_micros / days
+                daily_budget = pb.campaign_budget.amount_micros
+                total_budget_micros += daily_budget
+                total_spend_micros += avg_daily_spend
+
+                utilization_data.append({
+                    "campaign_id": str(pb.campaign.id),
+                    "name": pb.campaign.name,
+                    "status": status_names.get(pb.campaign.status, "UNKNOWN"),
+                    "daily_budget": daily_budget / 1_000_000,
+                    "avg_daily_spend": avg_daily_spend / 1_000_000,
+                    "total_spend": total_cost_micros / 1_000_000,
+                    "utilization": (avg_daily_spend / daily_budget) * 100 if daily_budget > 0 else 0,
+                    "days": days
+                })
+            return utilization_data, total_budget_micros, total_spend_micros
 
-        if not results:
-            return "No campaign data found for the specified criteria."
+        shards = await asyncio.gather(*[asyncio.to_thread(_utilization, query) for query in queries])
+        utilization_data = [entry for shard_data, _, _ in shards for entry in shard_data]
+        total_budget_micros = sum(shard_budget for _, shard_budget, _ in shards)
+        total_spend_micros = sum(shard_spend for _, _, shard_spend in shards)
 
-        # Aggregate by campaign (multiple rows per day)
-        campaign_data = {}
-        for row in results:
-            cid = str(row.campaign.id)
-            if cid not in campaign_data:
-                campaign_data[cid] = {
-                    "name": row.campaign.name,
-                    "status": row.campaign.status.name,
-                    "daily_budget_micros": row.campaign_budget.amount_micros,
-                    "budget_type": row.campaign_budget.type.name,
-                    "total_cost_micros": 0,
-                    "days": 0
-                }
-            campaign_data[cid]["total_cost_micros"] += row.metrics.cost_micros
-            campaign_data[cid]["days"] += 1
-
-        # Calculate utilization
-        utilization_data = []
-        for cid, data in campaign_data.items():
-            days = max(data["days"], 1)
-            avg_daily_spend = data["total_cost_micros"] / days
-            daily_budget = data["daily_budget_micros"]
-
-            if daily_budget > 0:
-                utilization = (avg_daily_spend / daily_budget) * 100
-            else:
-                utilization = 0
-
-            utilization_data.append({
-                "campaign_id": cid,
-                "name": data["name"],
-                "status": data["status"],
-                "daily_budget": daily_budget / 1_000_000,
-                "avg_daily_spend": avg_daily_spend / 1_000_000,
-                "total_spend": data["total_cost_micros"] / 1_000_000,
-                "utilization": utilization,
-                "days": days
-            })
+        if not utilization_data:
+            return "No campaign data found for the specified criteria."
 
         # Sort by utilization descending
         utilization_data.sort(key=lambda x: x["utilization"], reverse=True)
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Budget Utilization Report\n",
-                f"**Date Range**: {params.date_range.value.replace('_', ' ').title()}",
-                f"**Campaigns Analyzed**: {len(utilization_data)}\n"
-            ]
-
-            # Summary statistics
-            total_budget = sum(c["daily_budget"] for c in utilization_data)
-            total_spend = sum(c["avg_daily_spend"] for c in utilization_data)
-            avg_utilization = (total_spend / total_budget * 100) if total_budget > 0 else 0
-
-            lines.append("## Summary")
-            lines.append(f"- **Total Daily Budget**: ${total_budget:,.2f}")
-            lines.append(f"- **Avg Daily Spend**: ${total_spend:,.2f}")
-            lines.append(f"- **Overall Utilization**: {avg_utilization:.1f}%\n")
-
-            # Campaigns at risk (>95% utilization)
-            high_util = [c for c in utilization_data if c["utilization"] >= 95]
-            if high_util:
-                lines.append("## ⚠️ Budget-Limited Campaigns")
-                lines.append("These campaigns may be missing traffic due to budget constraints:\n")
-                for c in high_util:
-                    lines.append(f"- **{c['name']}**: {c['utilization']:.1f}% (${c['daily_budget']:.2f}/day)")
-                lines.append("")
-
-            # Underspending campaigns (<50% utilization)
-            low_util = [c for c in utilization_data if c["utilization"] < 50 and c["status"] == "ENABLED"]
-            if low_util:
-                lines.append("## 📉 Underspending Campaigns")
-                lines.append("These campaigns have room to spend more:\n")
-                for c in low_util:
-                    lines.append(f"- **{c['name']}**: {c['utilization']:.1f}% (${c['avg_daily_spend']:.2f} of ${c['daily_budget']:.2f}/day)")
-                lines.append("")
+        # Summary statistics
+        total_budget = total_budget_micros / 1_000_000
+        total_spend = total_spend_micros / 1_000_000
+        avg_utilization = (total_spend / total_budget * 100) if total_budget > 0 else 0
 
-            # Full table
-            lines.append("## All Campaigns\n")
-            lines.append("| Campaign | Status | Daily Budget | Avg Spend | Utilization |")
-            lines.append("|----------|--------|--------------|-----------|-------------|")
-            for c in utilization_data:
-                util_icon = "🔴" if c["utilization"] >= 95 else "🟡" if c["utilization"] >= 70 else "🟢"
-                lines.append(f"| {c['name'][:30]} | {c['status']} | ${c['daily_budget']:,.2f} | ${c['avg_daily_spend']:,.2f} | {util_icon} {c['utilization']:.1f}% |")
+        if params.response_format == ResponseFormat.MARKDOWN:
+            # Lines are produced lazily so rows past the size limit are never formatted
+            def _lines() -> Iterator[str]:
+                yield "# Budget Utilization Report\n"
+                yield f"**Date Range**: {params.date_range.value.replace('_', ' ').title()}"
+                yield f"**Campaigns Analyzed**: {len(utilization_data)}\n"
+
+                yield "## Summary"
+                yield f"- **Total Daily Budget**: ${total_budget:,.2f}"
+                yield f"- **Avg Daily Spend**: ${total_spend:,.2f}"
+                yield f"- **Overall Utilization**: {avg_utilization:.1f}%\n"
+
+                # Campaigns at risk (>95% utilization)
+                high_util = [c for c in utilization_data if c["utilization"] >= 95]
+                if high_util:
+                    yield "## ⚠️ Budget-Limited Campaigns"
+                    yield "These campaigns may be missing traffic due to budget constraints:\n"
+                    yield from (
+                        f"- **{c['name']}**: {c['utilization']:.1f}% (${c['daily_budget']:.2f}/day)" for c in high_util
+                    )
+                    yield ""
+
+                # Underspending campaigns (<50% utilization)
+                low_util = [c for c in utilization_data if c["utilization"] < 50 and c["status"] == "ENABLED"]
+                if low_util:
+                    yield "## 📉 Underspending Campaigns"
+                    yield "These campaigns have room to spend more:\n"
+                    yield from (
+                        f"- **{c['name']}**: {c['utilization']:.1f}% (${c['avg_daily_spend']:.2f} of ${c['daily_budget']:.2f}/day)"
+                        for c in low_util
+                    )
+                    yield ""
+
+                # Full table
+                yield "## All Campaigns\n"
+                yield "| Campaign | Status | Daily Budget | Avg Spend | Utilization |"
+                yield "|----------|--------|--------------|-----------|-------------|"
+                yield from (
+                    f"| {c['name'][:30]} | {c['status']} | ${c['daily_budget']:,.2f} | ${c['avg_daily_spend']:,.2f} | "
+                    f"{'🔴' if c['utilization'] >= 95 else '🟡' if c['utilization'] >= 70 else '🟢'} {c['utilization']:.1f}% |"
+                    for c in utilization_data
+                )
 
-            return _check_and_truncate("\n".join(lines))
+            return _bounded_join(_lines())
 
         else:  # JSON
-            return json.dumps({
+            return _dumps({
                 "date_range": params.date_range.value,
                 "total_campaigns": len(utilization_data),
                 "summary": {
-                    "total_daily_budget": sum(c["daily_budget"] for c in utilization_data),
-                    "total_avg_daily_spend": sum(c["avg_daily_spend"] for c in utilization_data),
+                    "total_daily_budget": total_budget,
+                    "total_avg_daily_spend": total_spend,
                     "overall_utilization": avg_utilization
                 },
                 "campaigns": utilization_data
-            }, indent=2)
+            })
 
     except Exception as e:
-        return _handle_google_ads_error(e)
+        return _handle_google_ads_error(e, params.customer_id)
 
 
 # ============================================================================
@@ -4684,128 +6866,133 @@ async def google_ads_get_keyword_quality_scores(params: GetKeywordQualityScoresI
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        # Build filters
-        filters = ["ad_group_criterion.status != 'REMOVED'"]
-        if params.campaign_id:
-            filters.append(f"campaign.id = {params.campaign_id}")
-        if params.ad_group_id:
-            filters.append(f"ad_group.id = {params.ad_group_id}")
-        if params.min_impressions > 0:
-            filters.append(f"metrics.impressions >= {params.min_impressions}")
-
-        filter_clause = " AND ".join(filters)
-
-        query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.quality_info.quality_score,
-                ad_group_criterion.quality_info.creative_quality_score,
-                ad_group_criterion.quality_info.post_click_quality_score,
-                ad_group_criterion.quality_info.search_predicted_ctr,
-                ad_group.id,
-                ad_group.name,
-                campaign.id,
-                campaign.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.cost_micros
-            FROM keyword_view
-            WHERE {filter_clause}
-            ORDER BY ad_group_criterion.quality_info.quality_score ASC
-            LIMIT {params.limit}
-        """
-
-        results = _execute_query(client, customer_id, query)
+        # Rendered responses are cached per parameter set, like the other read tools
+        cache_key = (
+            customer_id, "keyword_quality_scores", params.campaign_id, params.ad_group_id,
+            params.min_impressions, params.limit, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        markdown = params.response_format == ResponseFormat.MARKDOWN
+
+        # Markdown shows at most _QS_TABLE_ROWS keywords in full; past that only
+        # the scores are needed, so the distribution, the full table and the
+        # low-QS table come from three narrow concurrent queries instead of
+        # fetching every column for every keyword
+        split = markdown and params.limit > _QS_TABLE_ROWS
+        if split:
+            score_rows, results, attention_rows = await asyncio.gather(
+                asyncio.to_thread(_execute_query, client, customer_id, _keyword_quality_query(
+                    params.campaign_id, params.ad_group_id, params.min_impressions, params.limit, scores_only=True
+                )),
+                asyncio.to_thread(_execute_query, client, customer_id, _keyword_quality_query(
+                    params.campaign_id, params.ad_group_id, params.min_impressions, _QS_TABLE_ROWS
+                )),
+                asyncio.to_thread(_execute_query, client, customer_id, _keyword_quality_query(
+                    params.campaign_id, params.ad_group_id, params.min_impressions, _QS_ATTENTION_ROWS, low_only=True
+                ))
+            )
+        else:
+            query = _keyword_quality_query(params.campaign_id, params.ad_group_id, params.min_impressions, params.limit)
+            results = await asyncio.to_thread(_execute_query, client, customer_id, query)
+            score_rows = attention_rows = results
 
-        if not results:
+        if not score_rows:
             return "No keyword data found. Keywords need impressions for Quality Score to be calculated."
 
-        keywords = []
-        for row in results:
-            qi = row.ad_group_criterion.quality_info
+        def qs_label(val: int) -> str:
+            return _QS_LABELS[val] if 0 <= val < len(_QS_LABELS) else str(val)
 
-            # Map enum values to readable names
-            def qs_label(val):
-                mapping = {0: "UNSPECIFIED", 1: "UNKNOWN", 2: "BELOW_AVERAGE", 3: "AVERAGE", 4: "ABOVE_AVERAGE"}
-                return mapping.get(val, str(val))
+        match_type_names = _pb_enum_names(client.get_type("KeywordInfo")._pb.DESCRIPTOR, "match_type")
 
-            keywords.append({
-                "keyword": row.ad_group_criterion.keyword.text,
-                "match_type": row.ad_group_criterion.keyword.match_type.name,
+        def keyword_dict(row: Any) -> Dict[str, Any]:
+            pb = row._pb
+            criterion = pb.ad_group_criterion
+            qi = criterion.quality_info
+            return {
+                "keyword": criterion.keyword.text,
+                "match_type": match_type_names.get(criterion.keyword.match_type, "UNKNOWN"),
                 "quality_score": qi.quality_score if qi.quality_score else "N/A",
                 "expected_ctr": qs_label(qi.search_predicted_ctr),
                 "ad_relevance": qs_label(qi.creative_quality_score),
                 "landing_page": qs_label(qi.post_click_quality_score),
-                "impressions": row.metrics.impressions,
-                "clicks": row.metrics.clicks,
-                "cost": row.metrics.cost_micros / 1_000_000,
-                "ad_group": row.ad_group.name,
-                "campaign": row.campaign.name,
-                "criterion_id": str(row.ad_group_criterion.criterion_id)
-            })
-
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Keyword Quality Scores\n",
-                f"**Keywords Analyzed**: {len(keywords)}\n"
-            ]
+                "impressions": pb.metrics.impressions,
+                "clicks": pb.metrics.clicks,
+                "cost": pb.metrics.cost_micros / 1_000_000,
+                "ad_group": pb.ad_group.name,
+                "campaign": pb.campaign.name,
+                "criterion_id": str(criterion.criterion_id)
+            }
 
-            # Summary by QS
+        if markdown:
             qs_distribution = {}
-            for kw in keywords:
-                qs = kw["quality_score"]
-                if qs != "N/A":
+            for row in score_rows:
+                qs = row._pb.ad_group_criterion.quality_info.quality_score
+                if qs:
                     qs_distribution[qs] = qs_distribution.get(qs, 0) + 1
 
+            buf = io.StringIO()
+            buf.write(f"# Keyword Quality Scores\n\n**Keywords Analyzed**: {len(score_rows)}\n\n")
+
+            # Summary by QS
             if qs_distribution:
-                lines.append("## Quality Score Distribution")
+                buf.write("## Quality Score Distribution\n")
                 for qs in sorted(qs_distribution.keys()):
                     count = qs_distribution[qs]
-                    bar = "█" * min(count, 20)
-                    emoji = "🟢" if qs >= 7 else "🟡" if qs >= 5 else "🔴"
-                    lines.append(f"- {emoji} **QS {qs}**: {count} keywords {bar}")
-                lines.append("")
+                    buf.write(f"- {_QS_EMOJI[qs]} **QS {qs}**: {count} keywords {_BARS[min(count, 20)]}\n")
+                buf.write("\n")
 
             # Low QS keywords needing attention
-            low_qs = [kw for kw in keywords if isinstance(kw["quality_score"], int) and kw["quality_score"] < 5]
+            low_qs = [
+                keyword_dict(row) for row in attention_rows
+                if 1 <= row._pb.ad_group_criterion.quality_info.quality_score < 5
+            ]
             if low_qs:
-                lines.append("## ⚠️ Keywords Needing Attention (QS < 5)\n")
-                lines.append("| Keyword | QS | CTR | Ad Rel | LP | Impressions |")
-                lines.append("|---------|-----|-----|--------|-----|------------|")
-                for kw in low_qs[:20]:
-                    lines.append(
-                        f"| {kw['keyword'][:25]} | {kw['quality_score']} | "
-                        f"{kw['expected_ctr'][:3]} | {kw['ad_relevance'][:3]} | "
-                        f"{kw['landing_page'][:3]} | {kw['impressions']:,} |"
-                    )
-                lines.append("")
-
-            # Full table
-            lines.append("## All Keywords\n")
-            lines.append("| Keyword | Match | QS | CTR | Ad Rel | LP | Impr | Cost |")
-            lines.append("|---------|-------|-----|-----|--------|-----|------|------|")
-            for kw in keywords[:50]:
-                lines.append(
-                    f"| {kw['keyword'][:20]} | {kw['match_type'][:5]} | {kw['quality_score']} | "
-                    f"{kw['expected_ctr'][:3]} | {kw['ad_relevance'][:3]} | {kw['landing_page'][:3]} | "
-                    f"{kw['impressions']:,} | ${kw['cost']:.2f} |"
+                buf.write(
+                    "## ⚠️ Keywords Needing Attention (QS < 5)\n\n"
+                    "| Keyword | QS | CTR | Ad Rel | LP | Impressions |\n"
+                    "|---------|-----|-----|--------|-----|------------|\n"
                 )
+                for kw in low_qs[:_QS_ATTENTION_ROWS]:
+                    buf.write(_QS_LOW_ROW(
+                        kw["keyword"], kw["quality_score"], kw["expected_ctr"],
+                        kw["ad_relevance"], kw["landing_page"], kw["impressions"]
+                    ))
+                buf.write("\n")
 
-            lines.append("\n### Legend")
-            lines.append("- **CTR**: Expected Click-Through Rate")
-            lines.append("- **Ad Rel**: Ad Relevance")
-            lines.append("- **LP**: Landing Page Experience")
-            lines.append("- Values: ABV (Above Average), AVG (Average), BEL (Below Average)")
+            # Full table
+            buf.write(
+                "## All Keywords\n\n"
+                "| Keyword | Match | QS | CTR | Ad Rel | LP | Impr | Cost |\n"
+                "|---------|-------|-----|-----|--------|-----|------|------|\n"
+            )
+            for row in islice(results, _QS_TABLE_ROWS):
+                kw = keyword_dict(row)
+                buf.write(_QS_ALL_ROW(
+                    kw["keyword"], kw["match_type"], kw["quality_score"], kw["expected_ctr"],
+                    kw["ad_relevance"], kw["landing_page"], kw["impressions"], kw["cost"]
+                ))
+
+            buf.write(
+                "\n### Legend\n"
+                "- **CTR**: Expected Click-Through Rate\n"
+                "- **Ad Rel**: Ad Relevance\n"
+                "- **LP**: Landing Page Experience\n"
+                "- Values: ABV (Above Average), AVG (Average), BEL (Below Average)"
+            )
 
-            return _check_and_truncate("\n".join(lines))
+            response = _check_and_truncate(buf.getvalue())
 
         else:  # JSON
-            return json.dumps({
-                "total": len(keywords),
-                "keywords": keywords
-            }, indent=2)
+            # Keyword dicts are encoded one at a time as the generator yields them
+            response = _dumps_rows({"total": len(results)}, "keywords", (keyword_dict(row) for row in results))
+
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response)
+        return response
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -4855,113 +7042,102 @@ async def google_ads_get_ad_strength(params: GetAdStrengthInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        # Build filters
-        filters = ["ad_group_ad.ad.type = 'RESPONSIVE_SEARCH_AD'", "ad_group_ad.status != 'REMOVED'"]
-        if params.campaign_id:
-            filters.append(f"campaign.id = {params.campaign_id}")
-        if params.ad_group_id:
-            filters.append(f"ad_group.id = {params.ad_group_id}")
-
-        filter_clause = " AND ".join(filters)
-
-        query = f"""
-            SELECT
-                ad_group_ad.ad.id,
-                ad_group_ad.ad.responsive_search_ad.headlines,
-                ad_group_ad.ad.responsive_search_ad.descriptions,
-                ad_group_ad.ad.final_urls,
-                ad_group_ad.ad_strength,
-                ad_group_ad.status,
-                ad_group.id,
-                ad_group.name,
-                campaign.id,
-                campaign.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr
-            FROM ad_group_ad
-            WHERE {filter_clause}
-            ORDER BY ad_group_ad.ad_strength ASC
-            LIMIT {params.limit}
-        """
+        cache_key = (
+            customer_id, "ad_strength", params.campaign_id, params.ad_group_id,
+            params.limit, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        query = _ad_strength_query(params.campaign_id, params.ad_group_id, params.limit)
+
+        ad_group_ad_descriptor = client.get_type("AdGroupAd")._pb.DESCRIPTOR
+        strength_names = _pb_enum_names(ad_group_ad_descriptor, "ad_strength")
+        status_names = _pb_enum_names(ad_group_ad_descriptor, "status")
+
+        def _convert() -> List[Dict[str, Any]]:
+            # Rows are converted as the stream yields them, capped at the limit
+            ads = []
+            for row in islice(_stream_query(client, customer_id, query), params.limit):
+                pb = row._pb
+                ad = pb.ad_group_ad.ad
+                rsa = ad.responsive_search_ad
+                headlines = [h.text for h in rsa.headlines]
+                descriptions = [d.text for d in rsa.descriptions]
+
+                ads.append({
+                    "ad_id": str(ad.id),
+                    "ad_strength": strength_names.get(pb.ad_group_ad.ad_strength, "UNKNOWN"),
+                    "status": status_names.get(pb.ad_group_ad.status, "UNKNOWN"),
+                    "headlines_count": len(headlines),
+                    "descriptions_count": len(descriptions),
+                    "headlines": headlines[:5],  # First 5 for preview
+                    "descriptions": descriptions[:2],  # First 2 for preview
+                    "final_url": ad.final_urls[0] if ad.final_urls else "",
+                    "impressions": pb.metrics.impressions,
+                    "clicks": pb.metrics.clicks,
+                    "ctr": pb.metrics.ctr * 100 if pb.metrics.ctr else 0,
+                    "ad_group": pb.ad_group.name,
+                    "campaign": pb.campaign.name
+                })
+            return ads
 
-        results = _execute_query(client, customer_id, query)
+        ads = await asyncio.to_thread(_convert)
 
-        if not results:
+        if not ads:
             return "No Responsive Search Ads found."
 
-        ads = []
-        for row in results:
-            rsa = row.ad_group_ad.ad.responsive_search_ad
-            headlines = [h.text for h in rsa.headlines] if rsa.headlines else []
-            descriptions = [d.text for d in rsa.descriptions] if rsa.descriptions else []
-
-            ads.append({
-                "ad_id": str(row.ad_group_ad.ad.id),
-                "ad_strength": row.ad_group_ad.ad_strength.name,
-                "status": row.ad_group_ad.status.name,
-                "headlines_count": len(headlines),
-                "descriptions_count": len(descriptions),
-                "headlines": headlines[:5],  # First 5 for preview
-                "descriptions": descriptions[:2],  # First 2 for preview
-                "final_url": row.ad_group_ad.ad.final_urls[0] if row.ad_group_ad.ad.final_urls else "",
-                "impressions": row.metrics.impressions,
-                "clicks": row.metrics.clicks,
-                "ctr": row.metrics.ctr * 100 if row.metrics.ctr else 0,
-                "ad_group": row.ad_group.name,
-                "campaign": row.campaign.name
-            })
+        # Distribution (also part of the JSON response)
+        strength_dist = Counter(ad["ad_strength"] for ad in ads)
 
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Ad Strength Report\n",
-                f"**Responsive Search Ads Analyzed**: {len(ads)}\n"
-            ]
+            buf = io.StringIO()
+            buf.write(f"# Ad Strength Report\n\n**Responsive Search Ads Analyzed**: {len(ads)}\n\n")
 
-            # Distribution
-            strength_dist = {}
-            for ad in ads:
-                strength_dist[ad["ad_strength"]] = strength_dist.get(ad["ad_strength"], 0) + 1
-
-            lines.append("## Ad Strength Distribution")
-            strength_order = ["EXCELLENT", "GOOD", "AVERAGE", "POOR", "UNSPECIFIED"]
-            strength_emoji = {"EXCELLENT": "🟢", "GOOD": "🟡", "AVERAGE": "🟠", "POOR": "🔴", "UNSPECIFIED": "⚪"}
-
-            for strength in strength_order:
+            buf.write("## Ad Strength Distribution\n")
+            for strength in _STRENGTH_ORDER:
                 if strength in strength_dist:
-                    emoji = strength_emoji.get(strength, "⚪")
-                    lines.append(f"- {emoji} **{strength}**: {strength_dist[strength]} ads")
-            lines.append("")
+                    buf.write(f"- {_STRENGTH_EMOJI[strength]} **{strength}**: {strength_dist[strength]} ads\n")
+            buf.write("\n")
 
             # Ads needing improvement
             poor_ads = [ad for ad in ads if ad["ad_strength"] in ["POOR", "AVERAGE"]]
             if poor_ads:
-                lines.append("## ⚠️ Ads Needing Improvement\n")
+                buf.write("## ⚠️ Ads Needing Improvement\n\n")
                 for ad in poor_ads[:10]:
-                    lines.append(f"### Ad {ad['ad_id']} - {ad['ad_strength']}")
-                    lines.append(f"- **Campaign**: {ad['campaign']}")
-                    lines.append(f"- **Ad Group**: {ad['ad_group']}")
-                    lines.append(f"- **Headlines**: {ad['headlines_count']} (need 8-15 for best results)")
-                    lines.append(f"- **Descriptions**: {ad['descriptions_count']} (need 4 for best results)")
-                    lines.append(f"- **Performance**: {ad['impressions']:,} impr, {ad['ctr']:.2f}% CTR")
-                    lines.append("")
+                    buf.write(
+                        f"### Ad {ad['ad_id']} - {ad['ad_strength']}\n"
+                        f"- **Campaign**: {ad['campaign']}\n"
+                        f"- **Ad Group**: {ad['ad_group']}\n"
+                        f"- **Headlines**: {ad['headlines_count']} (need 8-15 for best results)\n"
+                        f"- **Descriptions**: {ad['descriptions_count']} (need 4 for best results)\n"
+                        f"- **Performance**: {ad['impressions']:,} impr, {ad['ctr']:.2f}% CTR\n\n"
+                    )
 
             # Recommendations
-            lines.append("## Recommendations to Improve Ad Strength\n")
-            lines.append("1. **Add more headlines**: Aim for 10-15 unique headlines")
-            lines.append("2. **Add more descriptions**: Use all 4 description slots")
-            lines.append("3. **Include keywords**: Add popular keywords in headlines")
-            lines.append("4. **Vary messaging**: Different selling points and CTAs")
-            lines.append("5. **Pin strategically**: Only pin if absolutely necessary")
+            buf.write(
+                "## Recommendations to Improve Ad Strength\n\n"
+                "1. **Add more headlines**: Aim for 10-15 unique headlines\n"
+                "2. **Add more descriptions**: Use all 4 description slots\n"
+                "3. **Include keywords**: Add popular keywords in headlines\n"
+                "4. **Vary messaging**: Different selling points and CTAs\n"
+                "5. **Pin strategically**: Only pin if absolutely necessary"
+            )
 
-            return _check_and_truncate("\n".join(lines))
+            response = _check_and_truncate(buf.getvalue())
 
         else:  # JSON
-            return json.dumps({
+            response = _dumps({
                 "total": len(ads),
                 "distribution": strength_dist,
                 "ads": ads
-            }, indent=2)
+            })
+
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response)
+        return response
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -5012,99 +7188,96 @@ async def google_ads_get_policy_issues(params: GetPolicyIssuesInput) -> str:
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        issues = {"ads": [], "assets": []}
-
-        # Get ad policy issues
-        if params.include_ads:
-            campaign_filter = f"AND campaign.id = {params.campaign_id}" if params.campaign_id else ""
-
-            ad_query = f"""
-                SELECT
-                    ad_group_ad.ad.id,
-                    ad_group_ad.ad.type,
-                    ad_group_ad.status,
-                    ad_group_ad.policy_summary.approval_status,
-                    ad_group_ad.policy_summary.policy_topic_entries,
-                    ad_group_ad.policy_summary.review_status,
-                    ad_group.id,
-                    ad_group.name,
-                    campaign.id,
-                    campaign.name
-                FROM ad_group_ad
-                WHERE ad_group_ad.policy_summary.approval_status IN ('DISAPPROVED', 'APPROVED_LIMITED', 'AREA_OF_INTEREST_ONLY')
-                {campaign_filter}
-            """
-
-            ad_results = _execute_query(client, customer_id, ad_query)
+        cache_key = (
+            customer_id, "policy_issues", params.campaign_id, params.include_ads,
+            params.include_assets, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            for row in ad_results:
-                policy_topics = []
-                if row.ad_group_ad.policy_summary.policy_topic_entries:
-                    for entry in row.ad_group_ad.policy_summary.policy_topic_entries:
-                        policy_topics.append({
-                            "topic": entry.topic if hasattr(entry, 'topic') else "Unknown",
-                            "type": entry.type_.name if hasattr(entry, 'type_') else "Unknown"
-                        })
+        issues = {"ads": [], "assets": []}
 
-                issues["ads"].append({
-                    "ad_id": str(row.ad_group_ad.ad.id),
-                    "ad_type": row.ad_group_ad.ad.type_.name,
-                    "status": row.ad_group_ad.status.name,
-                    "approval_status": row.ad_group_ad.policy_summary.approval_status.name,
-                    "review_status": row.ad_group_ad.policy_summary.review_status.name,
+        topic_type_names = _pb_enum_names(client.get_type("PolicyTopicEntry")._pb.DESCRIPTOR, "type_")
+
+        def _ad_issues() -> List[Dict[str, Any]]:
+            ad_group_ad_descriptor = client.get_type("AdGroupAd")._pb.DESCRIPTOR
+            ad_type_names = _pb_enum_names(client.get_type("Ad")._pb.DESCRIPTOR, "type_")
+            status_names = _pb_enum_names(ad_group_ad_descriptor, "status")
+            policy_descriptor = client.get_type("AdGroupAdPolicySummary")._pb.DESCRIPTOR
+            approval_names = _pb_enum_names(policy_descriptor, "approval_status")
+            review_names = _pb_enum_names(policy_descriptor, "review_status")
+
+            ad_issues = []
+            for row in _stream_query(client, customer_id, _policy_ads_query(params.campaign_id)):
+                pb = row._pb
+                policy_summary = pb.ad_group_ad.policy_summary
+                # topic and type_ are always present on the fixed protobuf schema
+                policy_topics = [
+                    {"topic": entry.topic, "type": topic_type_names.get(entry.type_, "UNKNOWN")}
+                    for entry in policy_summary.policy_topic_entries
+                ]
+
+                ad_issues.append({
+                    "ad_id": str(pb.ad_group_ad.ad.id),
+                    "ad_type": ad_type_names.get(pb.ad_group_ad.ad.type_, "UNKNOWN"),
+                    "status": status_names.get(pb.ad_group_ad.status, "UNKNOWN"),
+                    "approval_status": approval_names.get(policy_summary.approval_status, "UNKNOWN"),
+                    "review_status": review_names.get(policy_summary.review_status, "UNKNOWN"),
                     "policy_topics": policy_topics,
-                    "ad_group": row.ad_group.name,
-                    "ad_group_id": str(row.ad_group.id),
-                    "campaign": row.campaign.name,
-                    "campaign_id": str(row.campaign.id)
+                    "ad_group": pb.ad_group.name,
+                    "ad_group_id": str(pb.ad_group.id),
+                    "campaign": pb.campaign.name,
+                    "campaign_id": str(pb.campaign.id)
                 })
+            return ad_issues
+
+        # Asset policy issues (for Performance Max)
+        def _asset_issues() -> List[Dict[str, Any]]:
+            asset_type_names = _pb_enum_names(client.get_type("Asset")._pb.DESCRIPTOR, "type_")
+            policy_descriptor = client.get_type("AssetPolicySummary")._pb.DESCRIPTOR
+            approval_names = _pb_enum_names(policy_descriptor, "approval_status")
+            review_names = _pb_enum_names(policy_descriptor, "review_status")
+
+            asset_issues = []
+            for row in _stream_query(client, customer_id, _POLICY_ASSETS_QUERY):
+                asset = row._pb.asset
+                policy_topics = [
+                    {"topic": entry.topic, "type": topic_type_names.get(entry.type_, "UNKNOWN")}
+                    for entry in asset.policy_summary.policy_topic_entries
+                ]
+
+                asset_type = asset_type_names.get(asset.type_, "UNKNOWN")
+                text_content = asset.text_asset.text if asset_type == "TEXT" else ""
+
+                asset_issues.append({
+                    "asset_id": str(asset.id),
+                    "asset_type": asset_type,
+                    "name": asset.name,
+                    "content": text_content,
+                    "approval_status": approval_names.get(asset.policy_summary.approval_status, "UNKNOWN"),
+                    "review_status": review_names.get(asset.policy_summary.review_status, "UNKNOWN"),
+                    "policy_topics": policy_topics
+                })
+            return asset_issues
+
+        async def _run(enabled: bool, convert: Any) -> List[Dict[str, Any]]:
+            return await asyncio.to_thread(convert) if enabled else []
+
+        # The two queries are independent: overlap their round trips
+        ad_results, asset_results = await asyncio.gather(
+            _run(params.include_ads, _ad_issues),
+            _run(params.include_assets, _asset_issues),
+            return_exceptions=True
+        )
+        if isinstance(ad_results, BaseException):
+            raise ad_results
+        issues["ads"] = ad_results
+        # Asset query might fail if no PMax campaigns
+        if not isinstance(asset_results, BaseException):
+            issues["assets"] = asset_results
 
-        # Get asset policy issues (for Performance Max)
-        if params.include_assets:
-            campaign_filter = f"AND campaign.id = {params.campaign_id}" if params.campaign_id else ""
-
-            asset_query = f"""
-                SELECT
-                    asset.id,
-                    asset.type,
-                    asset.name,
-                    asset.text_asset.text,
-                    asset.policy_summary.approval_status,
-                    asset.policy_summary.policy_topic_entries,
-                    asset.policy_summary.review_status
-                FROM asset
-                WHERE asset.policy_summary.approval_status IN ('DISAPPROVED', 'APPROVED_LIMITED', 'AREA_OF_INTEREST_ONLY')
-            """
-
-            try:
-                asset_results = _execute_query(client, customer_id, asset_query)
-
-                for row in asset_results:
-                    policy_topics = []
-                    if row.asset.policy_summary.policy_topic_entries:
-                        for entry in row.asset.policy_summary.policy_topic_entries:
-                            policy_topics.append({
-                                "topic": entry.topic if hasattr(entry, 'topic') else "Unknown",
-                                "type": entry.type_.name if hasattr(entry, 'type_') else "Unknown"
-                            })
-
-                    text_content = ""
-                    if row.asset.type_.name == "TEXT" and row.asset.text_asset:
-                        text_content = row.asset.text_asset.text
-
-                    issues["assets"].append({
-                        "asset_id": str(row.asset.id),
-                        "asset_type": row.asset.type_.name,
-                        "name": row.asset.name,
-                        "content": text_content,
-                        "approval_status": row.asset.policy_summary.approval_status.name,
-                        "review_status": row.asset.policy_summary.review_status.name,
-                        "policy_topics": policy_topics
-                    })
-            except Exception:
-                # Asset query might fail if no PMax campaigns
-                pass
-
         total_issues = len(issues["ads"]) + len(issues["assets"])
 
         if params.response_format == ResponseFormat.MARKDOWN:
@@ -5124,9 +7297,10 @@ All your ads and assets are approved and serving normally.
             if issues["ads"]:
                 lines.append(f"## ⚠️ Ad Policy Issues ({len(issues['ads'])})\n")
 
-                # Group by approval status
-                disapproved = [a for a in issues["ads"] if a["approval_status"] == "DISAPPROVED"]
-                limited = [a for a in issues["ads"] if a["approval_status"] != "DISAPPROVED"]
+                # Group by approval status in one pass
+                disapproved, limited = [], []
+                for ad in issues["ads"]:
+                    (disapproved if ad["approval_status"] == "DISAPPROVED" else limited).append(ad)
 
                 if disapproved:
                     lines.append("### 🔴 Disapproved Ads")
@@ -5172,14 +7346,18 @@ All your ads and assets are approved and serving normally.
             lines.append("3. **Request re-review**: After fixing, ads are automatically re-reviewed")
             lines.append("4. **Appeal if needed**: Use the Google Ads appeal process for incorrect disapprovals")
 
-            return _check_and_truncate("\n".join(lines))
+            response = _check_and_truncate("\n".join(lines))
 
         else:  # JSON
-            return json.dumps({
+            response = _dumps({
                 "total_issues": total_issues,
                 "ads": issues["ads"],
                 "assets": issues["assets"]
-            }, indent=2)
+            })
+
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response)
+        return response
 
     except Exception as e:
         return _handle_google_ads_error(e)
@@ -5189,6 +7367,86 @@ All your ads and assets are approved and serving normally.
 # RECOMMENDATIONS TOOLS
 # ============================================================================
 
+async def _submit_recommendation_operations(
+    customer_id: str,
+    recommendation_ids: List[str],
+    dismiss: bool,
+    partial_failure: bool = True
+) -> Dict[int, str]:
+    """
+    Apply or dismiss recommendations in a single RecommendationService request.
+
+    Successful requests invalidate the response cache: applying changes the
+    account itself, while dismissing only stales its recommendation entries.
+
+    Args:
+        customer_id: Customer ID
+        recommendation_ids: Recommendation resource names or bare IDs
+        dismiss: Dismiss instead of apply
+        partial_failure: Let valid operations succeed when others fail
+
+    Returns:
+        Dict of failed operation index -> error message (empty when everything succeeded)
+    """
+    client = _get_google_ads_client(use_proto_plus=False)
+    recommendation_service = _get_async_service("RecommendationService")
+
+    if dismiss:
+        operation_type = type(client.get_type("DismissRecommendationRequest")).DismissRecommendationOperation
+        rpc = recommendation_service.dismiss_recommendation
+    else:
+        operation_type = type(client.get_type("ApplyRecommendationOperation"))
+        rpc = recommendation_service.apply_recommendation
+
+    # Build resource names for IDs given without the customers/ prefix
+    prefix = f"customers/{customer_id}/recommendations/"
+    operations = []
+    for recommendation_id in recommendation_ids:
+        operation = operation_type()
+        operation.resource_name = recommendation_id if recommendation_id.startswith("customers/") else prefix + recommendation_id
+        operations.append(operation)
+
+    # partial_failure isn't a flattened argument, so it goes in the request
+    async with _customer_semaphore(customer_id):
+        response = await _call_with_rate_limit_async(
+            len(operations),
+            rpc,
+            request={"customer_id": customer_id, "operations": operations, "partial_failure": partial_failure}
+        )
+    errors = _partial_failure_errors(response) if partial_failure else {}
+
+    if any(i not in errors for i in range(len(operations))):
+        if dismiss:
+            _query_cache.invalidate(customer_id, "recommendations")
+            _query_cache.invalidate(customer_id, "audit_snapshot")
+        else:
+            _query_cache.invalidate(customer_id)
+
+    return errors
+
+
+def _recommendation_batch_report(recommendation_ids: List[str], errors: Dict[int, str], action: str) -> str:
+    """Render the per-recommendation outcome table for the batch apply/dismiss tools."""
+    done = sum(1 for i in range(len(recommendation_ids)) if i not in errors)
+    icon = "✅" if not errors else ("⚠️" if done else "❌")
+
+    lines = [
+        f"{icon} **{action} {done} of {len(recommendation_ids)} recommendation(s)**\n",
+        "| Recommendation ID | Result |",
+        "|-------------------|--------|"
+    ]
+    for i, recommendation_id in enumerate(recommendation_ids):
+        result = f"❌ {errors[i]}" if i in errors else f"✅ {action}"
+        lines.append(f"| {recommendation_id} | {result} |")
+
+    # Errors that could not be tied to an operation
+    for i, message in sorted(errors.items()):
+        if not 0 <= i < len(recommendation_ids):
+            lines.append(f"\n- {message}")
+
+    return _check_and_truncate("\n".join(lines))
+
+
 @mcp.tool(
     name="google_ads_list_recommendations",
     annotations={
@@ -5234,32 +7492,45 @@ async def google_ads_list_recommendations(params: ListRecommendationsInput) -> s
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
+        # Rendered responses are cached per parameter set; apply invalidates the
+        # account, dismiss only its recommendation entries
+        cache_key = (
+            customer_id, "recommendations", params.campaign_id,
+            tuple(params.recommendation_types) if params.recommendation_types else None,
+            params.limit, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Build filters
         filters = ["recommendation.dismissed = FALSE"]
         if params.campaign_id:
-            filters.append(f"recommendation.campaign = 'customers/{customer_id}/campaigns/{params.campaign_id}'")
+            campaign_id = _numeric_id(params.campaign_id, "Campaign ID")
+            filters.append(f"recommendation.campaign = 'customers/{customer_id}/campaigns/{campaign_id}'")
         if params.recommendation_types:
-            types_str = ", ".join([f"'{t}'" for t in params.recommendation_types])
+            types_str = ", ".join(f"'{t}'" for t in params.recommendation_types)
             filters.append(f"recommendation.type IN ({types_str})")
 
-        filter_clause = " AND ".join(filters)
+        # Only the detail sub-messages read below are fetched, and only for the
+        # requested types: a budget-only listing skips the keyword payload
+        types = set(params.recommendation_types or ())
+        detail_fields = [
+            field for rec_type, field in (
+                ("CAMPAIGN_BUDGET", "recommendation.campaign_budget_recommendation"),
+                ("KEYWORD", "recommendation.keyword_recommendation")
+            )
+            if not types or rec_type in types
+        ]
 
-        query = f"""
-            SELECT
-                recommendation.resource_name,
-                recommendation.type,
-                recommendation.impact,
-                recommendation.campaign,
-                recommendation.campaign_budget_recommendation,
-                recommendation.keyword_recommendation,
-                recommendation.text_ad_recommendation,
-                recommendation.responsive_search_ad_recommendation
-            FROM recommendation
-            WHERE {filter_clause}
-            LIMIT {params.limit}
-        """
+        query = _RECOMMENDATIONS_QUERY.format_map({
+            "detail_fields": "".join(f", {field}" for field in detail_fields),
+            "filters": " AND ".join(filters),
+            "limit": int(params.limit)
+        })
 
-        results = _execute_query(client, customer_id, query)
+        results = await asyncio.to_thread(_execute_query, client, customer_id, query)
 
         if not results:
             return """✅ **No pending recommendations found!**
@@ -5268,40 +7539,47 @@ Your account appears to be well-optimized, or all recommendations have been appl
 
 **Tip**: Check back regularly as Google generates new recommendations based on performance data."""
 
+        markdown = params.response_format == ResponseFormat.MARKDOWN
+
+        # One pass over the rows: JSON keeps every recommendation in query order;
+        # markdown groups by type and only converts the rows it will display
         recommendations = []
+        by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        type_counts: Counter = Counter()
         for row in results:
             rec = row.recommendation
-            rec_type = rec.type_.name if hasattr(rec.type_, 'name') else str(rec.type_)
+            rec_type = _enum_name(rec.type_)
+
+            if markdown:
+                type_counts[rec_type] += 1
+                shown = by_type[rec_type]
+                if len(shown) >= _RECOMMENDATIONS_PER_TYPE:
+                    continue
 
-            # Extract impact metrics
+            # Extract impact metrics (protobuf fields are always present, 0 when unset)
             impact_data = {}
             if rec.impact:
                 impact = rec.impact.base_metrics
-                if hasattr(impact, 'impressions'):
-                    impact_data["impressions"] = impact.impressions
-                if hasattr(impact, 'clicks'):
-                    impact_data["clicks"] = impact.clicks
-                if hasattr(impact, 'cost_micros'):
-                    impact_data["cost"] = impact.cost_micros / 1_000_000
-                if hasattr(impact, 'conversions'):
-                    impact_data["conversions"] = impact.conversions
+                impact_data = {
+                    "impressions": impact.impressions,
+                    "clicks": impact.clicks,
+                    "cost": impact.cost_micros / 1_000_000,
+                    "conversions": impact.conversions
+                }
 
             # Extract recommendation details based on type
             details = {}
             if rec_type == "CAMPAIGN_BUDGET" and rec.campaign_budget_recommendation:
                 budget_rec = rec.campaign_budget_recommendation
-                if hasattr(budget_rec, 'recommended_budget_amount_micros'):
-                    details["recommended_budget"] = budget_rec.recommended_budget_amount_micros / 1_000_000
-                if hasattr(budget_rec, 'current_budget_amount_micros'):
-                    details["current_budget"] = budget_rec.current_budget_amount_micros / 1_000_000
+                details["recommended_budget"] = budget_rec.recommended_budget_amount_micros / 1_000_000
+                details["current_budget"] = budget_rec.current_budget_amount_micros / 1_000_000
 
             elif rec_type == "KEYWORD" and rec.keyword_recommendation:
-                kw_rec = rec.keyword_recommendation
-                if hasattr(kw_rec, 'keyword'):
-                    details["keyword"] = kw_rec.keyword.text if hasattr(kw_rec.keyword, 'text') else str(kw_rec.keyword)
-                    details["match_type"] = kw_rec.keyword.match_type.name if hasattr(kw_rec.keyword, 'match_type') else "BROAD"
+                keyword = rec.keyword_recommendation.keyword
+                details["keyword"] = keyword.text
+                details["match_type"] = _enum_name(keyword.match_type)
 
-            recommendations.append({
+            (shown if markdown else recommendations).append({
                 "resource_name": rec.resource_name,
                 "type": rec_type,
                 "campaign": rec.campaign if rec.campaign else "N/A",
@@ -5309,68 +7587,57 @@ Your account appears to be well-optimized, or all recommendations have been appl
                 "details": details
             })
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Google Ads Recommendations\n",
-                f"**Total Recommendations**: {len(recommendations)}\n"
-            ]
-
-            # Group by type
-            by_type = {}
-            for rec in recommendations:
-                rec_type = rec["type"]
-                if rec_type not in by_type:
-                    by_type[rec_type] = []
-                by_type[rec_type].append(rec)
-
-            # Type icons and descriptions
-            type_info = {
-                "CAMPAIGN_BUDGET": ("💰", "Budget Recommendations"),
-                "KEYWORD": ("🔑", "Keyword Suggestions"),
-                "RESPONSIVE_SEARCH_AD": ("📝", "Ad Improvement"),
-                "TARGET_CPA_OPT_IN": ("🎯", "Bidding Strategy"),
-                "MAXIMIZE_CONVERSIONS_OPT_IN": ("📈", "Bidding Strategy"),
-                "SITELINK_ASSET": ("🔗", "Sitelink Suggestions"),
-                "CALLOUT_ASSET": ("📢", "Callout Suggestions"),
-            }
+        if markdown:
+            buf = io.StringIO()
+            buf.write(f"# Google Ads Recommendations\n\n**Total Recommendations**: {len(results)}\n\n")
 
             for rec_type, recs in by_type.items():
-                icon, desc = type_info.get(rec_type, ("💡", rec_type.replace("_", " ").title()))
-                lines.append(f"## {icon} {desc} ({len(recs)})\n")
-
-                for rec in recs[:10]:  # Limit per type
-                    lines.append(f"### Recommendation")
-                    lines.append(f"- **Type**: {rec['type']}")
-                    lines.append(f"- **ID**: `{rec['resource_name'].split('/')[-1]}`")
-
-                    if rec["details"]:
-                        for key, value in rec["details"].items():
-                            if "budget" in key:
-                                lines.append(f"- **{key.replace('_', ' ').title()}**: ${value:,.2f}")
-                            else:
-                                lines.append(f"- **{key.replace('_', ' ').title()}**: {value}")
+                # Sections past the character limit would only be cut off again
+                if buf.tell() > CHARACTER_LIMIT:
+                    break
+                icon, desc = _REC_TYPE_INFO.get(rec_type) or ("💡", rec_type.replace("_", " ").title())
+                buf.write(f"## {icon} {desc} ({type_counts[rec_type]})\n\n")
+
+                for rec in recs:
+                    buf.write(
+                        f"### Recommendation\n"
+                        f"- **Type**: {rec['type']}\n"
+                        f"- **ID**: `{rec['resource_name'].rpartition('/')[2]}`\n"
+                    )
+
+                    for key, value in rec["details"].items():
+                        if "budget" in key:
+                            buf.write(f"- **{key.replace('_', ' ').title()}**: ${value:,.2f}\n")
+                        else:
+                            buf.write(f"- **{key.replace('_', ' ').title()}**: {value}\n")
 
                     if rec["impact"]:
-                        lines.append("- **Estimated Impact**:")
+                        buf.write("- **Estimated Impact**:\n")
                         for metric, value in rec["impact"].items():
                             if metric == "cost":
-                                lines.append(f"  - {metric.title()}: ${value:,.2f}")
+                                buf.write(f"  - {metric.title()}: ${value:,.2f}\n")
                             else:
-                                lines.append(f"  - {metric.title()}: +{value:,.0f}")
-                    lines.append("")
+                                buf.write(f"  - {metric.title()}: +{value:,.0f}\n")
+                    buf.write("\n")
 
-            lines.append("## How to Apply Recommendations\n")
-            lines.append("Use `google_ads_apply_recommendation` with the recommendation ID to apply.")
-            lines.append("Use `google_ads_dismiss_recommendation` to dismiss if not relevant.")
+            buf.write(
+                "## How to Apply Recommendations\n\n"
+                "Use `google_ads_apply_recommendation` with the recommendation ID to apply.\n"
+                "Use `google_ads_dismiss_recommendation` to dismiss if not relevant."
+            )
 
-            return _check_and_truncate("\n".join(lines))
+            response = _truncate_buffer(buf)
 
         else:  # JSON
-            return json.dumps({
+            response = json.dumps({
                 "total": len(recommendations),
                 "recommendations": recommendations
             }, indent=2)
 
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response, ttl=RECOMMENDATIONS_CACHE_TTL_SECONDS)
+        return response
+
     except Exception as e:
         return _handle_google_ads_error(e)
 
@@ -5410,24 +7677,10 @@ async def google_ads_apply_recommendation(params: ApplyRecommendationInput) -> s
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-
-        recommendation_service = client.get_service("RecommendationService")
 
-        # Build resource name if only ID provided
-        if params.recommendation_id.startswith("customers/"):
-            resource_name = params.recommendation_id
-        else:
-            resource_name = f"customers/{customer_id}/recommendations/{params.recommendation_id}"
-
-        # Create apply operation
-        operation = client.get_type("ApplyRecommendationOperation")
-        operation.resource_name = resource_name
-
-        # Execute
-        response = recommendation_service.apply_recommendation(
-            customer_id=customer_id,
-            operations=[operation]
+        # A single operation: failures surface as exceptions
+        await _submit_recommendation_operations(
+            customer_id, [params.recommendation_id], dismiss=False, partial_failure=False
         )
 
         return f"""✅ **Recommendation applied successfully!**
@@ -5480,24 +7733,10 @@ async def google_ads_dismiss_recommendation(params: DismissRecommendationInput)
     """
     try:
         customer_id = _validate_customer_id(params.customer_id)
-        client = _get_google_ads_client()
-
-        recommendation_service = client.get_service("RecommendationService")
-
-        # Build resource name if only ID provided
-        if params.recommendation_id.startswith("customers/"):
-            resource_name = params.recommendation_id
-        else:
-            resource_name = f"customers/{customer_id}/recommendations/{params.recommendation_id}"
-
-        # Create dismiss operation
-        operation = client.get_type("DismissRecommendationOperation")
-        operation.resource_name = resource_name
 
-        # Execute
-        response = recommendation_service.dismiss_recommendation(
-            customer_id=customer_id,
-            operations=[operation]
+        # A single operation: failures surface as exceptions
+        await _submit_recommendation_operations(
+            customer_id, [params.recommendation_id], dismiss=True, partial_failure=False
         )
 
         return f"""✅ **Recommendation dismissed!**
@@ -5513,6 +7752,94 @@ This recommendation will no longer appear in your list.
         return _handle_google_ads_error(e)
 
 
+@mcp.tool(
+    name="google_ads_apply_recommendations",
+    annotations={
+        "title": "Apply Recommendations (Batch)",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def google_ads_apply_recommendations(params: BatchApplyRecommendationsInput) -> str:
+    """
+    Apply several Google Ads recommendations in one request.
+
+    All recommendations are sent in a single RecommendationService call with
+    partial failure enabled, so valid recommendations are applied even when
+    others are stale or invalid.
+
+    Args:
+        params (BatchApplyRecommendationsInput): Input parameters containing:
+            - customer_id (str): 10-digit customer ID
+            - recommendation_ids (List[str]): Recommendation resource names or IDs
+
+    Returns:
+        str: Per-recommendation results table
+
+    Examples:
+        - "Apply all the budget recommendations"
+        - "Apply recommendations abc123, def456 and ghi789"
+
+    Warning:
+        Applying recommendations will make changes to your account.
+        Review the recommendation details before applying.
+    """
+    try:
+        customer_id = _validate_customer_id(params.customer_id)
+
+        errors = await _submit_recommendation_operations(customer_id, params.recommendation_ids, dismiss=False)
+
+        return _recommendation_batch_report(params.recommendation_ids, errors, "Applied")
+
+    except Exception as e:
+        return _handle_google_ads_error(e)
+
+
+@mcp.tool(
+    name="google_ads_dismiss_recommendations",
+    annotations={
+        "title": "Dismiss Recommendations (Batch)",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False
+    }
+)
+async def google_ads_dismiss_recommendations(params: BatchDismissRecommendationsInput) -> str:
+    """
+    Dismiss several Google Ads recommendations in one request.
+
+    All recommendations are sent in a single RecommendationService call with
+    partial failure enabled, so one invalid ID does not block the rest.
+
+    Args:
+        params (BatchDismissRecommendationsInput): Input parameters containing:
+            - customer_id (str): 10-digit customer ID
+            - recommendation_ids (List[str]): Recommendation resource names or IDs
+
+    Returns:
+        str: Per-recommendation results table
+
+    Examples:
+        - "Dismiss all the keyword suggestions"
+        - "Dismiss recommendations abc123 and def456"
+
+    Note:
+        Dismissed recommendations may reappear if conditions change significantly.
+    """
+    try:
+        customer_id = _validate_customer_id(params.customer_id)
+
+        errors = await _submit_recommendation_operations(customer_id, params.recommendation_ids, dismiss=True)
+
+        return _recommendation_batch_report(params.recommendation_ids, errors, "Dismissed")
+
+    except Exception as e:
+        return _handle_google_ads_error(e)
+
+
 # ============================================================================
 # CONVERSION TRACKING TOOLS
 # ============================================================================
@@ -5556,19 +7883,17 @@ async def google_ads_list_conversion_actions(params: ListConversionActionsInput)
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        status_filter = "WHERE conversion_action.status = 'ENABLED'" if not params.include_disabled else ""
+        cache_key = (customer_id, "conversion_actions", params.include_disabled, params.response_format)
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        query = f"""
-            SELECT
-                conversion_action.id,
-                conversion_action.name,
-                conversion_action.status
-            FROM conversion_action
-            {status_filter}
-            ORDER BY conversion_action.name
-        """
+        query = _CONVERSION_ACTIONS_QUERY.format_map({
+            "status_clause": "" if params.include_disabled else " WHERE conversion_action.status = 'ENABLED'"
+        })
 
-        results = _execute_query(client, customer_id, query)
+        results = await asyncio.to_thread(_execute_query, client, customer_id, query)
 
         if not results:
             return """⚠️ **No conversion actions found!**
@@ -5587,34 +7912,35 @@ Without conversion tracking, you can't measure ROI or optimize for conversions."
             actions.append({
                 "id": str(ca.id),
                 "name": ca.name,
-                "status": ca.status.name if hasattr(ca.status, 'name') else str(ca.status)
+                "status": _enum_name(ca.status)
             })
 
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Conversion Actions\n",
-                f"**Total Actions**: {len(actions)}\n"
-            ]
-
-            # Simple list
-            lines.append("| Status | Name | ID |")
-            lines.append("|--------|------|----|")
+            buf = io.StringIO()
+            buf.write(
+                f"# Conversion Actions\n\n**Total Actions**: {len(actions)}\n\n"
+                "| Status | Name | ID |\n"
+                "|--------|------|----|\n"
+            )
 
             for action in actions:
                 status_icon = "✅" if action["status"] == "ENABLED" else "⏸️"
-                lines.append(f"| {status_icon} | {action['name']} | {action['id']} |")
+                buf.write(f"| {status_icon} | {action['name']} | {action['id']} |\n")
 
-            lines.append("")
-            lines.append("**Note**: Use conversion IDs for tracking and reporting configuration.")
+            buf.write("\n**Note**: Use conversion IDs for tracking and reporting configuration.")
 
-            return _check_and_truncate("\n".join(lines))
+            response = _check_and_truncate(buf.getvalue())
 
         else:  # JSON
-            return json.dumps({
+            response = json.dumps({
                 "total": len(actions),
                 "conversion_actions": actions
             }, indent=2)
 
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response, ttl=CONVERSION_SETUP_CACHE_TTL_SECONDS)
+        return response
+
     except Exception as e:
         return _handle_google_ads_error(e)
 
@@ -5641,10 +7967,12 @@ async def google_ads_get_conversion_stats(params: GetConversionStatsInput) -> st
             - customer_id (str): 10-digit customer ID
             - campaign_id (Optional[str]): Filter by campaign
             - date_range (DatePreset): Date range (default: LAST_30_DAYS)
+            - max_campaigns (int): Maximum campaigns to list (default: 100)
             - response_format (ResponseFormat): Output format
 
     Returns:
-        str: Conversion statistics with ROI metrics
+        str: Conversion statistics with ROI metrics; totals cover every
+            campaign, the per-campaign list only the top max_campaigns
 
     Examples:
         - "Show me conversion stats for last 30 days"
@@ -5658,27 +7986,27 @@ async def google_ads_get_conversion_stats(params: GetConversionStatsInput) -> st
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        # Custom dates take precedence over preset
-        date_filter = _format_date_range(params.date_range, params.since, params.until)
-        campaign_filter = f"AND campaign.id = {params.campaign_id}" if params.campaign_id else ""
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.status,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.cost_micros,
-                metrics.clicks,
-                metrics.impressions
-            FROM campaign
-            WHERE {date_filter}
-            {campaign_filter}
-            ORDER BY metrics.conversions DESC
-        """
+        cache_key = (
+            customer_id, "conversion_stats", params.campaign_id, params.date_range,
+            params.since, params.until, params.max_campaigns, params.response_format
+        )
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        query = _CONVERSION_STATS_QUERY.format_map({
+            # Custom dates take precedence over preset
+            "date_filter": _format_date_range(params.date_range, params.since, params.until),
+            "campaign_clause": f" AND campaign.id = {_numeric_id(params.campaign_id, 'Campaign ID')}" if params.campaign_id else "",
+            # Markdown only derives the conversion rate from clicks; JSON reports impressions too
+            "extra_metrics": (
+                ", metrics.clicks" if params.response_format == ResponseFormat.MARKDOWN
+                else ", metrics.clicks, metrics.impressions"
+            )
+        })
 
-        results = _execute_query(client, customer_id, query)
+        results = await asyncio.to_thread(_execute_query, client, customer_id, query)
 
         if not results:
             return f"""⚠️ **No conversions found for {params.date_range.value.replace('_', ' ').lower()}**
@@ -5695,82 +8023,100 @@ This could mean:
 
         # Aggregate data
         campaigns = []
+        # Cost stays in integer micros until render time so the totals are exact
         totals = {
             "conversions": 0,
             "value": 0,
-            "cost": 0,
+            "cost_micros": 0,
             "clicks": 0,
             "impressions": 0
         }
 
+        # Totals cover every row; only the top max_campaigns (rows arrive by
+        # conversions, descending) are listed
         for row in results:
             conversions = row.metrics.conversions or 0
             conv_value = row.metrics.conversions_value or 0
-            cost = (row.metrics.cost_micros or 0) / 1_000_000
+            cost_micros = row.metrics.cost_micros or 0
             clicks = row.metrics.clicks or 0
             impressions = row.metrics.impressions or 0
 
-            campaigns.append({
-                "id": str(row.campaign.id),
-                "name": row.campaign.name,
-                "status": row.campaign.status.name if hasattr(row.campaign.status, 'name') else str(row.campaign.status),
-                "conversions": conversions,
-                "value": conv_value,
-                "cost": cost,
-                "clicks": clicks,
-                "impressions": impressions
-            })
+            if len(campaigns) < params.max_campaigns:
+                campaigns.append({
+                    "id": str(row.campaign.id),
+                    "name": row.campaign.name,
+                    "status": _enum_name(row.campaign.status),
+                    "conversions": conversions,
+                    "value": conv_value,
+                    "cost_micros": cost_micros,
+                    "clicks": clicks,
+                    "impressions": impressions
+                })
 
             totals["conversions"] += conversions
             totals["value"] += conv_value
-            totals["cost"] += cost
+            totals["cost_micros"] += cost_micros
             totals["clicks"] += clicks
             totals["impressions"] += impressions
 
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Conversion Statistics\n",
-                f"**Date Range**: {params.date_range.value.replace('_', ' ').title()}\n"
-            ]
-
             # Summary
-            avg_cpa = totals["cost"] / totals["conversions"] if totals["conversions"] > 0 else 0
-            roas = totals["value"] / totals["cost"] if totals["cost"] > 0 else 0
+            total_cost = totals["cost_micros"] / 1_000_000
+            avg_cpa = total_cost / totals["conversions"] if totals["conversions"] > 0 else 0
+            roas = totals["value"] / total_cost if total_cost > 0 else 0
             conv_rate = (totals["conversions"] / totals["clicks"] * 100) if totals["clicks"] > 0 else 0
 
-            lines.append("## Summary")
-            lines.append(f"- **Total Conversions**: {totals['conversions']:,.1f}")
-            lines.append(f"- **Total Value**: ${totals['value']:,.2f}")
-            lines.append(f"- **Total Cost**: ${totals['cost']:,.2f}")
-            lines.append(f"- **Cost/Conversion (CPA)**: ${avg_cpa:,.2f}")
-            lines.append(f"- **Conversion Rate**: {conv_rate:.2f}%")
-            lines.append(f"- **ROAS**: {roas:.2f}x ({roas*100:.0f}%)\n")
+            buf = io.StringIO()
+            buf.write(
+                f"# Conversion Statistics\n\n"
+                f"**Date Range**: {params.date_range.value.replace('_', ' ').title()}\n\n"
+                f"## Summary\n"
+                f"- **Total Conversions**: {totals['conversions']:,.1f}\n"
+                f"- **Total Value**: ${totals['value']:,.2f}\n"
+                f"- **Total Cost**: ${total_cost:,.2f}\n"
+                f"- **Cost/Conversion (CPA)**: ${avg_cpa:,.2f}\n"
+                f"- **Conversion Rate**: {conv_rate:.2f}%\n"
+                f"- **ROAS**: {roas:.2f}x ({roas*100:.0f}%)\n\n"
+            )
 
             # By campaign
-            lines.append("## By Campaign\n")
-            lines.append("| Campaign | Status | Conv | Value | Cost | CPA | ROAS |")
-            lines.append("|----------|--------|------|-------|------|-----|------|")
-            for camp in sorted(campaigns, key=lambda x: x["conversions"], reverse=True):
-                cpa = camp["cost"] / camp["conversions"] if camp["conversions"] > 0 else 0
-                campaign_roas = camp["value"] / camp["cost"] if camp["cost"] > 0 else 0
+            shown = f" (top {len(campaigns)} of {len(results)})" if len(campaigns) < len(results) else ""
+            buf.write(
+                f"## By Campaign{shown}\n\n"
+                "| Campaign | Status | Conv | Value | Cost | CPA | ROAS |\n"
+                "|----------|--------|------|-------|------|-----|------|\n"
+            )
+            # Rows arrive in ORDER BY metrics.conversions DESC order
+            for camp in campaigns:
+                if buf.tell() > CHARACTER_LIMIT:
+                    break
+                cost = camp["cost_micros"] / 1_000_000
+                cpa = cost / camp["conversions"] if camp["conversions"] > 0 else 0
+                campaign_roas = camp["value"] / cost if cost > 0 else 0
                 status_icon = "✅" if camp["status"] == "ENABLED" else "⏸️"
-                lines.append(
-                    f"| {camp['name'][:20]} | {status_icon} | {camp['conversions']:,.1f} | "
-                    f"${camp['value']:,.2f} | ${camp['cost']:,.2f} | "
-                    f"${cpa:,.2f} | {campaign_roas:.2f}x |"
-                )
+                buf.write(_CONVERSION_STATS_ROW(
+                    camp["name"], status_icon, camp["conversions"], camp["value"], cost, cpa, campaign_roas
+                ))
 
-            lines.append("\n**Note**: Conversion data may have a 1-3 day delay due to attribution windows.")
+            buf.write("\n**Note**: Conversion data may have a 1-3 day delay due to attribution windows.")
 
-            return _check_and_truncate("\n".join(lines))
+            response = _truncate_buffer(buf)
 
         else:  # JSON
-            return json.dumps({
+            # Keep the dollar "cost" field alongside the exact micros value
+            for entry in (totals, *campaigns):
+                entry["cost"] = entry["cost_micros"] / 1_000_000
+            response = json.dumps({
                 "date_range": params.date_range.value,
+                "total_campaigns": len(results),
                 "totals": totals,
                 "campaigns": campaigns
             }, indent=2)
 
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response, ttl=CONVERSION_STATS_CACHE_TTL_SECONDS)
+        return response
+
     except Exception as e:
         return _handle_google_ads_error(e)
 
@@ -6042,24 +8388,17 @@ async def google_ads_get_campaign_conversion_goals(params: GetCampaignConversion
         customer_id = _validate_customer_id(params.customer_id)
         client = _get_google_ads_client()
 
-        campaign_filter = f"AND campaign.id = {params.campaign_id}" if params.campaign_id else ""
+        cache_key = (customer_id, "campaign_conversion_goals", params.campaign_id, params.response_format)
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.advertising_channel_type,
-                campaign.bidding_strategy_type,
-                campaign_conversion_goal.category,
-                campaign_conversion_goal.origin,
-                campaign_conversion_goal.biddable
-            FROM campaign_conversion_goal
-            WHERE campaign.status != 'REMOVED'
-            {campaign_filter}
-            ORDER BY campaign.name, campaign_conversion_goal.biddable DESC
-        """
+        query = _CAMPAIGN_CONVERSION_GOALS_QUERY.format_map({
+            "campaign_clause": f" AND campaign.id = {_numeric_id(params.campaign_id, 'Campaign ID')}" if params.campaign_id else ""
+        })
 
-        results = _execute_query(client, customer_id, query)
+        results = await asyncio.to_thread(_execute_query, client, customer_id, query)
 
         if not results:
             return """⚠️ **No campaign conversion goals found!**
@@ -6077,72 +8416,248 @@ This could mean:
         # Group by campaign
         by_campaign = {}
         for row in results:
-            cid = str(row.campaign.id)
-            if cid not in by_campaign:
-                by_campaign[cid] = {
-                    "name": row.campaign.name,
-                    "channel_type": row.campaign.advertising_channel_type.name if hasattr(row.campaign.advertising_channel_type, 'name') else str(row.campaign.advertising_channel_type),
-                    "bidding_strategy": row.campaign.bidding_strategy_type.name if hasattr(row.campaign.bidding_strategy_type, 'name') else str(row.campaign.bidding_strategy_type),
+            # Each proto-plus attribute access builds a wrapper, so read the
+            # sub-messages once per row
+            campaign = row.campaign
+            goal = row.campaign_conversion_goal
+            cid = str(campaign.id)
+            # Single lookup for campaigns already seen; the entry is built from
+            # this row, so it can't come from a default factory
+            entry = by_campaign.get(cid)
+            if entry is None:
+                entry = by_campaign[cid] = {
+                    "name": campaign.name,
+                    "channel_type": _enum_name(campaign.advertising_channel_type),
+                    "bidding_strategy": _enum_name(campaign.bidding_strategy_type),
                     "goals": []
                 }
 
-            by_campaign[cid]["goals"].append({
-                "category": row.campaign_conversion_goal.category.name if hasattr(row.campaign_conversion_goal.category, 'name') else str(row.campaign_conversion_goal.category),
-                "origin": row.campaign_conversion_goal.origin.name if hasattr(row.campaign_conversion_goal.origin, 'name') else str(row.campaign_conversion_goal.origin),
-                "biddable": row.campaign_conversion_goal.biddable
+            entry["goals"].append({
+                "category": _enum_name(goal.category),
+                "origin": _enum_name(goal.origin),
+                "biddable": goal.biddable
             })
 
         if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Campaign Conversion Goals\n",
-                f"**Campaigns Analyzed**: {len(by_campaign)}\n"
-            ]
+            buf = io.StringIO()
+            buf.write(f"# Campaign Conversion Goals\n\n**Campaigns Analyzed**: {len(by_campaign)}\n\n")
 
             for cid, data in by_campaign.items():
-                primary_count = sum(1 for g in data["goals"] if g["biddable"])
-                secondary_count = len(data["goals"]) - primary_count
-
-                lines.append(f"## {data['name']}")
-                lines.append(f"- **ID**: {cid}")
-                lines.append(f"- **Type**: {data['channel_type']}")
-                lines.append(f"- **Bidding**: {data['bidding_strategy']}")
-                lines.append(f"- **Primary Goals**: {primary_count}")
-                lines.append(f"- **Secondary Goals**: {secondary_count}\n")
+                if buf.tell() > CHARACTER_LIMIT:
+                    break
+
+                # Split primary (biddable) and secondary goals in one pass
+                primary_goals = []
+                secondary_goals = []
+                for goal in data["goals"]:
+                    (primary_goals if goal["biddable"] else secondary_goals).append(goal)
+
+                buf.write(
+                    f"## {data['name']}\n"
+                    f"- **ID**: {cid}\n"
+                    f"- **Type**: {data['channel_type']}\n"
+                    f"- **Bidding**: {data['bidding_strategy']}\n"
+                    f"- **Primary Goals**: {len(primary_goals)}\n"
+                    f"- **Secondary Goals**: {len(secondary_goals)}\n\n"
+                )
 
                 # Primary conversions
-                primary_goals = [g for g in data["goals"] if g["biddable"]]
                 if primary_goals:
-                    lines.append("### ✅ Primary Conversions (Used for Bidding)")
-                    lines.append("| Category | Origin |")
-                    lines.append("|----------|--------|")
+                    buf.write("### ✅ Primary Conversions (Used for Bidding)\n| Category | Origin |\n|----------|--------|\n")
                     for goal in primary_goals:
-                        lines.append(f"| {goal['category']} | {goal['origin']} |")
-                    lines.append("")
+                        buf.write(f"| {goal['category']} | {goal['origin']} |\n")
+                    buf.write("\n")
 
                 # Secondary conversions
-                secondary_goals = [g for g in data["goals"] if not g["biddable"]]
                 if secondary_goals:
-                    lines.append("### 📊 Secondary Conversions (Observation Only)")
-                    lines.append("| Category | Origin |")
-                    lines.append("|----------|--------|")
+                    buf.write("### 📊 Secondary Conversions (Observation Only)\n| Category | Origin |\n|----------|--------|\n")
                     for goal in secondary_goals:
-                        lines.append(f"| {goal['category']} | {goal['origin']} |")
-                    lines.append("")
-
-            lines.append("---")
-            lines.append("**Legend**:")
-            lines.append("- **Primary**: Used for Smart Bidding optimization")
-            lines.append("- **Secondary**: Tracked but not used for bidding")
-            lines.append("- **Origin**: GOOGLE_ADS (native), FIREBASE, ANALYTICS, etc.")
+                        buf.write(f"| {goal['category']} | {goal['origin']} |\n")
+                    buf.write("\n")
+
+            buf.write(
+                "---\n"
+                "**Legend**:\n"
+                "- **Primary**: Used for Smart Bidding optimization\n"
+                "- **Secondary**: Tracked but not used for bidding\n"
+                "- **Origin**: GOOGLE_ADS (native), FIREBASE, ANALYTICS, etc."
+            )
 
-            return _check_and_truncate("\n".join(lines))
+            response = _truncate_buffer(buf)
 
         else:  # JSON
-            return json.dumps({
+            response = json.dumps({
                 "total_campaigns": len(by_campaign),
                 "campaigns": by_campaign
             }, indent=2)
 
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response, ttl=CONVERSION_SETUP_CACHE_TTL_SECONDS)
+        return response
+
+    except Exception as e:
+        return _handle_google_ads_error(e)
+
+
+# ============================================================================
+# ACCOUNT AUDIT TOOLS
+# ============================================================================
+
+@mcp.tool(
+    name="google_ads_audit_snapshot",
+    annotations={
+        "title": "Account Audit Snapshot",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False
+    }
+)
+async def google_ads_audit_snapshot(params: AuditSnapshotInput) -> str:
+    """
+    Get pending recommendations, conversion setup and conversion performance in one report.
+
+    Runs the recommendations, conversion actions and conversion statistics
+    queries concurrently, so a dashboard-style audit costs one round trip
+    instead of three sequential tool calls.
+
+    Args:
+        params (AuditSnapshotInput): Input parameters containing:
+            - customer_id (str): 10-digit customer ID
+            - date_range (DatePreset): Date range for conversion performance (default: LAST_30_DAYS)
+            - since / until (Optional[str]): Custom date range (YYYY-MM-DD)
+
+    Returns:
+        str: Markdown report with recommendation counts by type, conversion
+            actions and the top campaigns by conversions
+
+    Examples:
+        - "Give me a quick audit of account 1234567890"
+        - "Summarize recommendations and conversion tracking for this account"
+
+    Note:
+        For full details use `google_ads_list_recommendations`,
+        `google_ads_list_conversion_actions` and `google_ads_get_conversion_stats`.
+    """
+    try:
+        customer_id = _validate_customer_id(params.customer_id)
+        client = _get_google_ads_client()
+
+        cache_key = (customer_id, "audit_snapshot", params.date_range, params.since, params.until)
+        if CACHE_MODE != "disabled":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        queries = (
+            # Only types are counted, so no detail sub-messages
+            _RECOMMENDATIONS_QUERY.format_map({
+                "detail_fields": "",
+                "filters": "recommendation.dismissed = FALSE",
+                "limit": _AUDIT_RECOMMENDATIONS_LIMIT
+            }),
+            _CONVERSION_ACTIONS_QUERY.format_map({"status_clause": ""}),
+            _CONVERSION_STATS_QUERY.format_map({
+                # Custom dates take precedence over preset
+                "date_filter": _format_date_range(params.date_range, params.since, params.until),
+                "campaign_clause": "",
+                "extra_metrics": ""
+            })
+        )
+
+        # The three queries are independent: overlap their round trips
+        rec_rows, action_rows, stats_rows = await asyncio.gather(
+            *[asyncio.to_thread(_execute_query, client, customer_id, query) for query in queries]
+        )
+
+        buf = io.StringIO()
+        buf.write(f"# Account Audit Snapshot\n\n**Customer ID**: {customer_id}\n\n")
+
+        # Recommendations: counts per type only
+        type_counts = Counter(_enum_name(row.recommendation.type_) for row in rec_rows)
+
+        # The query stops at _AUDIT_RECOMMENDATIONS_LIMIT rows, so a full page is a lower bound
+        capped = len(rec_rows) >= _AUDIT_RECOMMENDATIONS_LIMIT
+        buf.write(f"## 💡 Pending Recommendations ({len(rec_rows)}{'+' if capped else ''})\n\n")
+        if capped:
+            buf.write(f"Counts cover the first {len(rec_rows)} recommendations.\n\n")
+        if type_counts:
+            for rec_type, count in type_counts.most_common():
+                icon, desc = _REC_TYPE_INFO.get(rec_type) or ("💡", rec_type.replace("_", " ").title())
+                buf.write(f"- {icon} {desc} (`{rec_type}`): {count}\n")
+        else:
+            buf.write("No pending recommendations.\n")
+        buf.write("\n")
+
+        # Conversion actions
+        enabled = sum(1 for row in action_rows if _enum_name(row.conversion_action.status) == "ENABLED")
+        buf.write(f"## 🎯 Conversion Actions ({enabled} enabled of {len(action_rows)})\n\n")
+        if action_rows:
+            buf.write("| Status | Name | ID |\n|--------|------|----|\n")
+            for row in action_rows:
+                if buf.tell() > CHARACTER_LIMIT:
+                    break
+                ca = row.conversion_action
+                status_icon = "✅" if _enum_name(ca.status) == "ENABLED" else "⏸️"
+                buf.write(f"| {status_icon} | {ca.name} | {ca.id} |\n")
+        else:
+            buf.write("⚠️ No conversion tracking set up.\n")
+        buf.write("\n")
+
+        # Conversion performance; rows arrive in ORDER BY metrics.conversions DESC order
+        total_conversions = total_value = 0
+        total_cost_micros = 0
+        for row in stats_rows:
+            total_conversions += row.metrics.conversions or 0
+            total_value += row.metrics.conversions_value or 0
+            total_cost_micros += row.metrics.cost_micros or 0
+        total_cost = total_cost_micros / 1_000_000
+        avg_cpa = total_cost / total_conversions if total_conversions > 0 else 0
+        roas = total_value / total_cost if total_cost > 0 else 0
+
+        if params.since:
+            period = f"{params.since} to {params.until}"
+        else:
+            period = params.date_range.value.replace('_', ' ').title()
+        buf.write(
+            f"## 📊 Conversion Performance ({period})\n\n"
+            f"- **Total Conversions**: {total_conversions:,.1f}\n"
+            f"- **Total Value**: ${total_value:,.2f}\n"
+            f"- **Total Cost**: ${total_cost:,.2f}\n"
+            f"- **Cost/Conversion (CPA)**: ${avg_cpa:,.2f}\n"
+            f"- **ROAS**: {roas:.2f}x\n\n"
+        )
+        if stats_rows:
+            shown = f"Top {_AUDIT_TOP_CAMPAIGNS} of {len(stats_rows)}" if len(stats_rows) > _AUDIT_TOP_CAMPAIGNS else "All"
+            buf.write(
+                f"### {shown} Campaigns\n\n"
+                "| Campaign | Status | Conv | Value | Cost | CPA | ROAS |\n"
+                "|----------|--------|------|-------|------|-----|------|\n"
+            )
+            for row in stats_rows[:_AUDIT_TOP_CAMPAIGNS]:
+                conversions = row.metrics.conversions or 0
+                conv_value = row.metrics.conversions_value or 0
+                cost = (row.metrics.cost_micros or 0) / 1_000_000
+                cpa = cost / conversions if conversions > 0 else 0
+                campaign_roas = conv_value / cost if cost > 0 else 0
+                status_icon = "✅" if _enum_name(row.campaign.status) == "ENABLED" else "⏸️"
+                buf.write(_CONVERSION_STATS_ROW(
+                    row.campaign.name, status_icon, conversions, conv_value, cost, cpa, campaign_roas
+                ))
+            buf.write("\n")
+
+        buf.write(
+            "**Next Steps**: Use `google_ads_list_recommendations`, `google_ads_list_conversion_actions` "
+            "and `google_ads_get_conversion_stats` for the full details."
+        )
+
+        response = _truncate_buffer(buf)
+
+        # Shortest TTL of the three sections: recommendations change fastest
+        if CACHE_MODE not in ("disabled", "read-only"):
+            _query_cache.set(cache_key, response, ttl=RECOMMENDATIONS_CACHE_TTL_SECONDS)
+        return response
+
     except Exception as e:
         return _handle_google_ads_error(e)
 
@@ -6369,7 +8884,7 @@ async def google_ads_search_geo_targets(params: SearchGeoTargetsInput) -> str:
                 "name": geo.name,
                 "canonical_name": geo.canonical_name,
                 "country_code": geo.country_code,
-                "type": geo.target_type.name if hasattr(geo.target_type, 'name') else str(geo.target_type),
+                "type": _enum_name(geo.target_type),
                 "reach": suggestion.reach if hasattr(suggestion, 'reach') else None
             })
 
@@ -6991,6 +9506,8 @@ async def google_ads_update_bidding_strategy(params: UpdateBiddingStrategyInput)
             operations=[campaign_operation]
         )
 
+        _query_cache.invalidate(customer_id)
+
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
             result = f"""## Bidding Strategy Updated Successfully!
@@ -8453,6 +10970,7 @@ async def google_ads_create_pmax_campaign(params: CreatePmaxCampaignInput) -> st
         )
         campaign_resource_name = campaign_response.results[0].resource_name
         campaign_id = campaign_resource_name.split("/")[-1]
+        _query_cache.invalidate(customer_id)
 
         # ====================================================================
         # Step 3: Add Geo Targeting
@@ -8619,29 +11137,13 @@ async def google_ads_create_pmax_campaign(params: CreatePmaxCampaignInput) -> st
         # === Create asset group asset link operations ===
         asset_group_resource = client.get_service("AssetGroupService").asset_group_path(customer_id, str(asset_group_temp_id))
 
+        field_types = _enum_map("AssetFieldTypeEnum")
         for temp_id, asset_type in asset_info:
             mutate_op = client.get_type("MutateOperation")
             link = mutate_op.asset_group_asset_operation.create
             link.asset_group = asset_group_resource
             link.asset = client.get_service("AssetService").asset_path(customer_id, str(temp_id))
-
-            # Set field type
-            if asset_type == "HEADLINE":
-                link.field_type = client.enums.AssetFieldTypeEnum.HEADLINE
-            elif asset_type == "LONG_HEADLINE":
-                link.field_type = client.enums.AssetFieldTypeEnum.LONG_HEADLINE
-            elif asset_type == "DESCRIPTION":
-                link.field_type = client.enums.AssetFieldTypeEnum.DESCRIPTION
-            elif asset_type == "BUSINESS_NAME":
-                link.field_type = client.enums.AssetFieldTypeEnum.BUSINESS_NAME
-            elif asset_type == "MARKETING_IMAGE":
-                link.field_type = client.enums.AssetFieldTypeEnum.MARKETING_IMAGE
-            elif asset_type == "SQUARE_MARKETING_IMAGE":
-                link.field_type = client.enums.AssetFieldTypeEnum.SQUARE_MARKETING_IMAGE
-            elif asset_type == "LOGO":
-                link.field_type = client.enums.AssetFieldTypeEnum.LOGO
-            elif asset_type == "PORTRAIT_MARKETING_IMAGE":
-                link.field_type = client.enums.AssetFieldTypeEnum.PORTRAIT_MARKETING_IMAGE
+            link.field_type = field_types[asset_type]
 
             mutate_operations.append(mutate_op)
 